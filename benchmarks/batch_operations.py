@@ -0,0 +1,65 @@
+"""
+Benchmark of the batch operations of HashTable against the equivalent per-key loops, then of the batch hashing of
+the hash functions with a vectorized form (NumPy) against hashing one key at a time.
+
+Usage :
+    python benchmarks/batch_operations.py [batch_size]
+"""
+from __future__ import annotations
+from typing import Callable
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+from hash_functions import VECTORIZED_HASH_FUNCTIONS, is_vectorized, make_batch_hash, make_hash
+
+
+def measure(function: Callable[[], object]) -> float:
+    """ Returns the duration in seconds of one call of the function. """
+    start = time.perf_counter()
+    function()
+
+    return time.perf_counter() - start
+
+
+def main(batch_size: int = 50_000) -> None:
+    entries = [(f"user:{i}", i) for i in range(batch_size)]
+    keys = [key for key, _ in entries]
+    misses = [f"missing:{i}" for i in range(batch_size)]
+
+    for storage in ("chained", "open"):
+        loop_table = HashTable(storage=storage)
+        batch_table = HashTable(storage=storage)
+
+        cases = [
+            ("put", lambda: [loop_table.put(key, value) for key, value in entries], lambda: batch_table.put_many(entries)),
+            ("get", lambda: [loop_table.get(key) for key in keys], lambda: batch_table.get_many(keys)),
+            ("contains", lambda: [loop_table.contains(key) for key in misses], lambda: batch_table.contains_many(misses)),
+            ("remove", lambda: [loop_table.remove(key) for key in keys], lambda: batch_table.remove_many(keys)),
+        ]
+
+        print(f"storage : {storage}, batch size : {batch_size}")
+        print(f"{'operation':<10} {'loop (s)':>10} {'batch (s)':>10} {'speedup':>8}")
+
+        for name, loop, batch in cases:
+            loop_seconds = measure(loop)
+            batch_seconds = measure(batch)
+            print(f"{name:<10} {loop_seconds:>10.3f} {batch_seconds:>10.3f} {loop_seconds / batch_seconds:>7.1f}x")
+
+    print(f"hashing and slot indices, batch size : {batch_size}")
+    print(f"{'hash':<10} {'loop (s)':>10} {'batch (s)':>10} {'speedup':>8}")
+
+    for name in VECTORIZED_HASH_FUNCTIONS:
+        hash = make_hash(name, 1)
+        batch_hash = make_batch_hash(name, 1)
+        loop_seconds = measure(lambda: [hash(key) % 1009 for key in keys])
+        batch_seconds = measure(lambda: batch_hash(keys, 1009))
+        vectorized = "" if is_vectorized(name) else " (NumPy not installed, not vectorized)"
+        print(f"{name:<10} {loop_seconds:>10.3f} {batch_seconds:>10.3f} {loop_seconds / batch_seconds:>7.1f}x{vectorized}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,62 @@
+"""
+Benchmark of the Bloom filter front of HashTable : lookups missing 80 % of the time, with and without the filter,
+for each storage backend, and for chained slots holding long chains (a max load factor of 8).
+
+Usage :
+    python benchmarks/bloom_filter.py [keys]
+"""
+from __future__ import annotations
+from typing import Any, Dict, List
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+
+
+def run(hash_table: HashTable, lookups: List[str]) -> float:
+    """ Returns the seconds taken to get then check every looked up key. """
+    start = time.perf_counter()
+
+    for key in lookups:
+        hash_table.get(key)
+
+    for key in lookups:
+        hash_table.contains(key)
+
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    keys = [f"user:{i}" for i in range(count)]
+    rng = random.Random(0)
+    # 80 % of the lookups miss
+    lookups = [f"user:{i}" if rng.random() < 0.2 else f"missing:{i}" for i in range(count)]
+    cases: List[Dict[str, Any]] = [
+        {"storage": "chained"},
+        {"storage": "open"},
+        {"storage": "chained", "max_load_factor": 8.0},
+    ]
+
+    print(f"{count:,} keys, {2 * count:,} lookups missing 80 % of the time")
+    print(f"  {'table':<38} {'without (ms)':>12} {'with (ms)':>10} {'speedup':>8} {'fp rate':>8} {'filter KiB':>10}")
+
+    for options in cases:
+        hash_table = HashTable(**options)
+        hash_table.put_many((key, key) for key in keys)
+        without = min(run(hash_table, lookups) for _ in range(5))
+        hash_table.enable_bloom_filter()
+        with_filter = min(run(hash_table, lookups) for _ in range(5))
+        stats = hash_table.bloom_filter_stats()
+        name = ", ".join(f"{name}={value}" for name, value in options.items())
+        print(
+            f"  {name:<38} {without * 1000:>12,.1f} {with_filter * 1000:>10,.1f} {without / with_filter:>7.2f}x "
+            f"{stats['false_positive_rate']:>8.2%} {stats['memory'] / 1024:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
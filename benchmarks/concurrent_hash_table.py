@@ -0,0 +1,86 @@
+"""
+Multi-threaded throughput benchmark of ConcurrentHashTable against a HashTable guarded by a single global lock.
+
+Usage :
+    python benchmarks/concurrent_hash_table.py [operations_per_thread]
+"""
+from __future__ import annotations
+from typing import Any
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from concurrent_hash_table import ConcurrentHashTable
+from hash_table import HashTable
+
+
+class GlobalLockHashTable:
+    """ The baseline : every operation of a single hash table takes the same lock. """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__table = HashTable()
+
+    def get(self, key: str) -> Any | None:
+        with self.__lock:
+            return self.__table.get(key)
+
+    def put(self, key: str, value: Any | None) -> Any | None:
+        with self.__lock:
+            return self.__table.put(key, value)
+
+    def increment(self, key: str) -> Any:
+        with self.__lock:
+            return self.__table.increment(key)
+
+
+def worker(table: Any, keys: list, operations: int, seed: int) -> None:
+    """ Runs a mix of 80% get, 10% put and 10% increment. """
+    generator = random.Random(seed)
+
+    for _ in range(operations):
+        key = keys[generator.randrange(len(keys))]
+        choice = generator.random()
+
+        if choice < 0.8:
+            table.get(key)
+        elif choice < 0.9:
+            table.put(key, choice)
+        else:
+            table.increment("counter:" + key[-1])
+
+
+def run(table: Any, threads: int, operations: int) -> float:
+    """ Returns the number of operations per second of the given number of threads sharing the table. """
+    keys = [f"user:{i}" for i in range(10_000)]
+
+    for key in keys:
+        table.put(key, 0)
+
+    workers = [threading.Thread(target=worker, args=(table, keys, operations, seed)) for seed in range(threads)]
+    start = time.perf_counter()
+
+    for thread in workers:
+        thread.start()
+
+    for thread in workers:
+        thread.join()
+
+    return threads * operations / (time.perf_counter() - start)
+
+
+def main(operations: int = 50_000) -> None:
+    print(f"{'threads':>7} {'global lock (ops/s)':>20} {'striped (ops/s)':>16}")
+
+    for threads in (1, 2, 4, 8):
+        global_lock = run(GlobalLockHashTable(), threads, operations)
+        striped = run(ConcurrentHashTable(), threads, operations)
+        print(f"{threads:>7} {global_lock:>20,.0f} {striped:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
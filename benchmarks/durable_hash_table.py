@@ -0,0 +1,52 @@
+"""
+Write throughput benchmark of DurableHashTable against an in-memory HashTable, for several group commit settings.
+
+Usage :
+    python benchmarks/durable_hash_table.py [writes]
+"""
+from __future__ import annotations
+from typing import Any
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from durable_hash_table import DurableHashTable
+from hash_table import HashTable
+
+
+def run(table: Any, keys: list) -> float:
+    """ Returns the number of puts per second, the pending writes being committed at the end. """
+    start = time.perf_counter()
+
+    for index, key in enumerate(keys):
+        table.put(key, index)
+
+    if isinstance(table, DurableHashTable):
+        table.commit()
+
+    return len(keys) / (time.perf_counter() - start)
+
+
+def main(count: int = 200_000) -> None:
+    keys = [f"session:{i % (count // 2)}" for i in range(count)]
+    memory = run(HashTable(), keys)
+    print(f"{'mode':>28} {'puts/s':>12} {'vs memory':>10}")
+    print(f"{'in memory':>28} {memory:>12,.0f} {1:>9.1f}x")
+
+    for group_commit, sync in ((1, True), (128, True), (1024, True), (1024, False)):
+        directory = tempfile.mkdtemp()
+        table = DurableHashTable(directory, group_commit=group_commit, sync=sync, compact_threshold=None)
+        # Syncing every write is orders of magnitude slower, so fewer writes are measured
+        durable = run(table, keys if group_commit > 1 else keys[:1000])
+        table.close()
+        shutil.rmtree(directory)
+        label = f"group of {group_commit}{'' if sync else ', no fsync'}"
+        print(f"{label:>28} {durable:>12,.0f} {memory / durable:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,35 @@
+"""
+Hash quality report of the built-in hash functions on a sample of keys : slot distribution, longest chain,
+avalanche and throughput, with the hash function and capacity HashTable.from_sample would pick.
+
+Usage :
+    python benchmarks/hash_quality.py [keys_file] [capacity]
+    The keys file holds one key per line. Without it, keys like "user:123" are analyzed.
+"""
+from __future__ import annotations
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_analysis import analyze, format_report, recommend, recommended_capacity
+
+
+def main(path: str | None = None, capacity: int | None = None) -> None:
+    if path is not None:
+        with open(path, encoding="utf-8") as file:
+            keys = [line.rstrip("\n") for line in file if line.strip()]
+    else:
+        keys = [f"user:{i}" for i in range(50_000)]
+
+    for analyzed_capacity in dict.fromkeys((12, capacity or recommended_capacity(len(keys)))):
+        print(f"{len(keys):,} keys, capacity {analyzed_capacity:,}")
+        print(format_report(analyze(keys, analyzed_capacity)))
+        print()
+
+    hash_function, recommended = recommend(keys)
+    print(f"Recommended : hash_function=\"{hash_function}\", capacity={recommended:,}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None, int(sys.argv[2]) if len(sys.argv) > 2 else None)
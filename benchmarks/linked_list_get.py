@@ -0,0 +1,73 @@
+"""
+Microbenchmark of LinkedList.get, comparing the single traversal lookup with the former approach
+which materialized the whole chain as a list before scanning it.
+
+Usage :
+    python benchmarks/linked_list_get.py [chain_length]
+"""
+from __future__ import annotations
+from typing import Any, Callable
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from linked_list import LinkedList
+
+
+def materialized_get(linked_list: LinkedList, key: str, default: Any | None = None) -> Any | None:
+    """ Reproduces the former lookup, which built a list of the whole chain before scanning it. """
+    for node_key, value in linked_list.entries():
+        if node_key == key:
+            return value
+
+    return default
+
+
+def peak_bytes(function: Callable[[], Any], repeat: int = 1000) -> float:
+    """ Returns the average peak of memory allocated by one call of the function. """
+    function()
+    tracemalloc.start()
+    total = 0
+
+    for _ in range(repeat):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        function()
+        total += tracemalloc.get_traced_memory()[1] - current
+
+    tracemalloc.stop()
+
+    return total / repeat
+
+
+def main(chain_length: int = 100) -> None:
+    linked_list = LinkedList()
+
+    for i in range(chain_length):
+        linked_list.insert(f"key{i}", i)
+
+    cases = {
+        "hit at head": "key0",
+        "hit at tail": f"key{chain_length - 1}",
+        "miss": "missing",
+    }
+
+    print(f"chain length : {chain_length}")
+    print(f"{'case':<12} {'lookup':<14} {'bytes/get':>10} {'ns/get':>10}")
+
+    for case, key in cases.items():
+        lookups = {
+            "materialized": lambda: materialized_get(linked_list, key),
+            "traversal": lambda: linked_list.get(key),
+        }
+
+        for name, lookup in lookups.items():
+            seconds = min(timeit.repeat(lookup, number=1000, repeat=5)) / 1000
+            print(f"{case:<12} {name:<14} {peak_bytes(lookup):>10.0f} {seconds * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,114 @@
+"""
+Load benchmark of HashTableServer : a server running in a child process, loaded by a HashTableClient at increasing
+concurrency. Each concurrent task sends a request, waits for its reply, and sends the next one, half of the requests
+being gets and half puts. The pipelined run sends the same requests by batches, a single round trip each.
+
+The throughput counts the requests answered per second, the latencies are the ones of each request (or batch)
+as seen by the client.
+
+Usage :
+    python benchmarks/server.py [--requests 20000] [--concurrency 1,4,16,64] [--pipeline 64] [--unix]
+"""
+from __future__ import annotations
+from typing import List, Tuple
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from client import HashTableClient
+from server import HashTableServer
+
+
+KEYS = 10_000
+VALUE = b"x" * 64
+
+
+def serve(port: int, path: str | None, ready) -> None:
+    """ Runs the server in the child process until it is terminated. """
+    async def run() -> None:
+        server = HashTableServer()
+        await server.start(port=port, path=path)
+        ready.send(server.address() if path is None else path)
+        await server.serve_forever()
+
+    asyncio.run(run())
+
+
+def percentile(latencies: List[float], share: float) -> float:
+    """ Returns the latency under which the given share of the sorted latencies are. """
+    return latencies[min(len(latencies) - 1, int(share * len(latencies)))]
+
+
+async def load(client: HashTableClient, requests: int, concurrency: int, pipeline: int) -> Tuple[float, List[float]]:
+    """ Sends the requests from concurrent tasks, returning the seconds taken and the latency of each round trip. """
+    latencies: List[float] = []
+    rng = random.Random(0)
+    keys = [f"user:{rng.randrange(KEYS)}" for _ in range(requests)]
+    per_task = requests // concurrency
+
+    async def task(index: int) -> None:
+        own = keys[index * per_task:(index + 1) * per_task]
+
+        for start in range(0, len(own), pipeline):
+            batch = [("GET", key) if i % 2 == 0 else ("SET", key, VALUE) for i, key in enumerate(own[start:start + pipeline])]
+            before = time.perf_counter()
+            await client.pipeline(batch)
+            latencies.append(time.perf_counter() - before)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task(index) for index in range(concurrency)))
+
+    return time.perf_counter() - start, sorted(latencies)
+
+
+async def bench(address, path: str | None, requests: int, levels: List[int], pipeline: int) -> None:
+    host, port = ("127.0.0.1", 0) if path is not None else address[:2]
+    runs = [(f"concurrency {concurrency}", concurrency, 1) for concurrency in levels]
+    runs.append((f"pipeline {pipeline}", 1, pipeline))
+    print(f"{requests:,} requests, half gets and half puts of {len(VALUE)} bytes, over {'a Unix socket' if path else 'TCP'}")
+    print(f"  {'run':<16} {'req/s':>10} {'p50 us':>9} {'p99 us':>9} {'p999 us':>9}")
+
+    for name, concurrency, batch in runs:
+        async with HashTableClient(host, port, path=path, pool_size=concurrency) as client:
+            # Warms the connections up, so that connecting isn't measured
+            await asyncio.gather(*(client.ping() for _ in range(concurrency)))
+            seconds, latencies = await load(client, requests, concurrency, batch)
+
+        answered = (requests // concurrency) * concurrency
+        print(
+            f"  {name:<16} {answered / seconds:>10,.0f} {percentile(latencies, 0.50) * 1e6:>9,.0f} "
+            f"{percentile(latencies, 0.99) * 1e6:>9,.0f} {percentile(latencies, 0.999) * 1e6:>9,.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load benchmark of HashTableServer.")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", default="1,4,16,64", help="The comma-separated concurrency levels.")
+    parser.add_argument("--pipeline", type=int, default=64, help="The batch size of the pipelined run.")
+    parser.add_argument("--unix", action="store_true", help="Serves over a Unix socket instead of TCP.")
+    arguments = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "hash_table.sock") if arguments.unix else None
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=serve, args=(0, path, sender), daemon=True)
+    process.start()
+
+    try:
+        address = receiver.recv()
+        levels = [int(level) for level in arguments.concurrency.split(",")]
+        asyncio.run(bench(address, path, arguments.requests, levels, arguments.pipeline))
+    finally:
+        process.terminate()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
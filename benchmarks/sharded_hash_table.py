@@ -0,0 +1,56 @@
+"""
+Batch throughput benchmark of ShardedHashTable against a single HashTable, for an increasing number of shards.
+Scaling is bounded by the number of CPUs, and by the cost of sending the batches to the shards.
+
+Usage :
+    python benchmarks/sharded_hash_table.py [keys]
+"""
+from __future__ import annotations
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+from sharded_hash_table import ShardedHashTable
+
+
+def run_single(keys: list) -> tuple:
+    """ Returns the seconds spent by a single hash table to insert then look up every key. """
+    table = HashTable()
+    start = time.perf_counter()
+    table.put_many((key, index) for index, key in enumerate(keys))
+    inserted = time.perf_counter()
+    table.get_many(keys)
+
+    return inserted - start, time.perf_counter() - inserted
+
+
+def run_sharded(keys: list, shards: int) -> tuple:
+    """ Returns the seconds spent by a sharded hash table to insert then look up every key. """
+    with ShardedHashTable(shards) as table:
+        start = time.perf_counter()
+        table.put_many((key, index) for index, key in enumerate(keys))
+        inserted = time.perf_counter()
+        table.get_many(keys)
+
+        return inserted - start, time.perf_counter() - inserted
+
+
+def main(count: int = 1_000_000) -> None:
+    keys = [f"key:{i}" for i in range(count)]
+    put_seconds, get_seconds = run_single(keys)
+    print(f"{count:,} keys, {os.cpu_count()} CPUs")
+    print(f"{'shards':>7} {'put_many (keys/s)':>18} {'get_many (keys/s)':>18}")
+    print(f"{'single':>7} {count / put_seconds:>18,.0f} {count / get_seconds:>18,.0f}")
+    shards = 1
+
+    while shards <= (os.cpu_count() or 1) * 2:
+        put_seconds, get_seconds = run_sharded(keys, shards)
+        print(f"{shards:>7} {count / put_seconds:>18,.0f} {count / get_seconds:>18,.0f}")
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
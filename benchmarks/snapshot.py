@@ -0,0 +1,57 @@
+"""
+Cold-start benchmark of a saved HashTable : rebuilding it through put, loading its snapshot, and memory mapping it.
+
+Usage :
+    python benchmarks/snapshot.py [keys]
+"""
+from __future__ import annotations
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+
+
+def main(count: int = 1_000_000) -> None:
+    entries = [(f"user:{i}", i) for i in range(count)]
+    path = os.path.join(tempfile.mkdtemp(), "table.snapshot")
+
+    start = time.perf_counter()
+    hash_table = HashTable(hash_function="fnv1a")
+
+    for key, value in entries:
+        hash_table.put(key, value)
+
+    rebuilt = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hash_table.save(path)
+    saved = time.perf_counter() - start
+
+    start = time.perf_counter()
+    HashTable.open(path, mmap=False)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mapped = HashTable.open(path)
+    opened = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mapped.get(entries[count // 2][0])
+    first_get = time.perf_counter() - start
+    mapped.close()
+
+    print(f"{count:,} keys, snapshot of {os.path.getsize(path) / 2**20:,.1f} MiB")
+    print(f"{'rebuild with put':>20} {rebuilt * 1000:>12,.2f} ms")
+    print(f"{'save':>20} {saved * 1000:>12,.2f} ms")
+    print(f"{'open (mmap=False)':>20} {loaded * 1000:>12,.2f} ms")
+    print(f"{'open (mmap=True)':>20} {opened * 1000:>12,.2f} ms")
+    print(f"{'first mapped get':>20} {first_get * 1000:>12,.2f} ms")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,64 @@
+"""
+Benchmark of the sorted index of HashTable : prefix scans of a single tenant's keys, with the index, against
+filtering keys(), and the cost of the index on puts.
+
+Usage :
+    python benchmarks/sorted_index.py [keys]
+"""
+from __future__ import annotations
+from typing import List
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+
+
+TENANTS = 1_000
+
+
+def fill(keys: List[str], indexed: bool) -> float:
+    """ Returns the seconds taken to put every key, with or without the index. """
+    hash_table = HashTable()
+
+    if indexed:
+        hash_table.enable_sorted_index()
+
+    start = time.perf_counter()
+
+    for key in keys:
+        hash_table.put(key, key)
+
+    return time.perf_counter() - start
+
+
+def main(count: int = 200_000) -> None:
+    keys = [f"tenant:{i % TENANTS}:user:{i}" for i in range(count)]
+    prefixes = [f"tenant:{tenant}:" for tenant in range(0, TENANTS, TENANTS // 20)]
+    hash_table = HashTable()
+    hash_table.put_many((key, key) for key in keys)
+    hash_table.enable_sorted_index()
+
+    print(f"{count:,} keys over {TENANTS:,} tenants, {len(prefixes)} prefix scans")
+
+    start = time.perf_counter()
+    filtered = [[key for key in hash_table.keys() if key.startswith(prefix)] for prefix in prefixes]
+    without = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [list(hash_table.prefix_scan(prefix)) for prefix in prefixes]
+    with_index = time.perf_counter() - start
+
+    assert [sorted(keys) for keys in filtered] == scanned
+    print(f"  {'keys() filtered (ms)':>22} {'prefix_scan (ms)':>17} {'speedup':>8}")
+    print(f"  {without * 1000:>22,.1f} {with_index * 1000:>17,.2f} {without / with_index:>7.0f}x")
+
+    plain = min(fill(keys, False) for _ in range(3))
+    indexed = min(fill(keys, True) for _ in range(3))
+    print(f"  puts without the index {plain * 1000:,.0f} ms, with it {indexed * 1000:,.0f} ms ({indexed / plain:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
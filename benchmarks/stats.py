@@ -0,0 +1,59 @@
+"""
+Overhead benchmark of the HashTable statistics : the same gets and puts without stats, with the stats disabled again,
+and with the stats enabled at several sampling periods.
+
+Usage :
+    python benchmarks/stats.py [keys]
+"""
+from __future__ import annotations
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+
+
+def run(hash_table: HashTable, keys: list) -> float:
+    """ Returns the seconds taken to put then get every key. """
+    start = time.perf_counter()
+
+    for key in keys:
+        hash_table.put(key, key)
+
+    for key in keys:
+        hash_table.get(key)
+
+    return time.perf_counter() - start
+
+
+def main(count: int = 200_000) -> None:
+    keys = [f"user:{i}" for i in range(count)]
+    baseline = min(run(HashTable(), keys) for _ in range(3))
+    results = [("no stats", baseline)]
+
+    def disabled() -> float:
+        hash_table = HashTable()
+        hash_table.enable_stats()
+        hash_table.disable_stats()
+        return run(hash_table, keys)
+
+    results.append(("disabled", min(disabled() for _ in range(3))))
+
+    for sample_every in (1024, 64, 1):
+        def enabled() -> float:
+            hash_table = HashTable()
+            hash_table.enable_stats(sample_every=sample_every)
+            return run(hash_table, keys)
+
+        results.append((f"sample 1/{sample_every}", min(enabled() for _ in range(3))))
+
+    print(f"{count:,} puts then gets")
+
+    for name, seconds in results:
+        print(f"{name:>14} {seconds * 1000:>10,.1f} ms {seconds / baseline - 1:>+8.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
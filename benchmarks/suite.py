@@ -0,0 +1,367 @@
+"""
+Benchmark suite of HashTable : put, get, contains, remove, iteration, merge and clone, for each storage backend and
+hash function, over several table sizes and key distributions, next to the built-in dict running the same workloads.
+The "frozen" storage is the FrozenHashTable built by HashTable.freeze : its build time is measured as a "freeze"
+operation instead of put, and it has no remove, merge nor clone.
+
+Every single-key operation is timed on its own, giving its p50 and p99 latencies. The throughput of the bulk
+operations (iteration, merge, clone) counts the entries they go through. The peak memory is the one traced while
+the table is built by put (or freeze), and the bytes per key the ones of HashTable.memory_usage once built. The results are written as JSON, and compared to a saved baseline if one is given.
+
+Key distributions :
+    - uniform : random keys, accessed uniformly.
+    - zipf : the same keys, accessed following a Zipf law, a few keys taking most of the accesses.
+    - prefix : keys sharing a long common prefix, which the hash functions reading every byte pay for.
+    - collision : keys colliding by groups of 64 under the polynomial hash whatever its seed, an ordinary
+      distribution for the other hash functions.
+
+Usage :
+    python benchmarks/suite.py [--sizes 1e3,1e4] [--full] [--output results.json] [--baseline baseline.json] [--save-baseline]
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+import argparse
+import datetime
+import gc
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from hash_table import HashTable
+from hash_functions import HASH_FUNCTIONS
+
+
+QUICK_SIZES = (1_000, 10_000)
+FULL_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DISTRIBUTIONS = ("uniform", "zipf", "prefix", "collision")
+STORAGES = ("chained", "open", "frozen")
+HIT_RATIOS = (1.0, 0.5, 0.0)
+ZIPF_EXPONENT = 1.1
+# Repetitions of the bulk operations, whose latency is the one of a whole pass
+BULK_REPEATS = 5
+# A result slower than the baseline by more than this share is reported as a regression
+REGRESSION_THRESHOLD = 0.10
+
+
+def make_keys(distribution: str, count: int, rng: random.Random) -> List[str]:
+    """ Returns the distinct keys of a distribution. """
+    if distribution == "prefix":
+        return [f"tenant/eu-west-1/production/services/accounts/users/{i:010d}" for i in range(count)]
+
+    if distribution == "collision":
+        # "Aa" and "BB" hash the same under hash * 31 + byte, so every mix of 6 of them collides with the others
+        blocks = ["".join(mix) for mix in itertools.product(("Aa", "BB"), repeat=6)]
+        return [f"{i // len(blocks)}:{blocks[i % len(blocks)]}" for i in range(count)]
+
+    return [f"key:{rng.getrandbits(64):016x}:{i}" for i in range(count)]
+
+
+def make_accesses(distribution: str, keys: List[str], misses: List[str], hit_ratio: float, rng: random.Random) -> List[str]:
+    """ Returns the keys looked up by a workload, as many as the keys, the given share of them existing. """
+    count = len(keys)
+
+    if distribution == "zipf":
+        weights = [1 / rank ** ZIPF_EXPONENT for rank in range(1, count + 1)]
+        hits = rng.choices(keys, weights=weights, k=count)
+    else:
+        hits = keys.copy()
+        rng.shuffle(hits)
+
+    hit_count = int(count * hit_ratio)
+    accesses = hits[:hit_count] + misses[:count - hit_count]
+    rng.shuffle(accesses)
+
+    return accesses
+
+
+def timed(function: Callable[[Any], Any], arguments: Iterable[Any]) -> Tuple[float, List[int]]:
+    """ Calls a function with each argument, returning the total seconds and the nanoseconds of each call. """
+    clock = time.perf_counter_ns
+    latencies: List[int] = []
+    append = latencies.append
+    start = time.perf_counter()
+
+    for argument in arguments:
+        call_start = clock()
+        function(argument)
+        append(clock() - call_start)
+
+    return time.perf_counter() - start, latencies
+
+
+def summarize(operation: str, count: int, seconds: float, latencies: List[int], **fields: Any) -> Dict[str, Any]:
+    """ Builds a result from the measures of an operation. """
+    latencies = sorted(latencies)
+
+    return {
+        "operation": operation,
+        "ops": count,
+        "seconds": seconds,
+        "ops_per_sec": count / seconds if seconds > 0 else 0.0,
+        "p50_ns": latencies[len(latencies) // 2],
+        "p99_ns": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)],
+        **fields,
+    }
+
+
+def peak_memory(build: Callable[[], Any]) -> int:
+    """ Returns the peak bytes allocated while building a table, the table itself included. """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        table = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del table
+
+    return peak
+
+
+class Target:
+    """ Adapts HashTable or dict to the operations of the benchmark, through bound methods only. """
+
+    def __init__(self, storage: str | None, hash_function: str | None) -> None:
+        self.storage = storage
+        self.hash_function = hash_function
+
+    def name(self) -> str:
+        """ Returns the name of the target in the results. """
+        if self.storage is None:
+            return "dict"
+
+        return "FrozenHashTable" if self.storage == "frozen" else "HashTable"
+
+    def new(self) -> Any:
+        """ Returns a new empty table, a chained HashTable to be frozen for the frozen storage. """
+        if self.storage is None:
+            return {}
+
+        storage = "chained" if self.storage == "frozen" else self.storage
+
+        return HashTable(storage=storage, hash_function=self.hash_function) # type: ignore[arg-type]
+
+    def operations(self, table: Any) -> Dict[str, Callable[[Any], Any]]:
+        """ Returns the single-key operations of a table. """
+        if self.storage is None:
+            return {"get": table.get, "contains": table.__contains__, "remove": table.pop}
+
+        if self.storage == "frozen":
+            return {"get": table.get, "contains": table.contains}
+
+        return {"get": table.get, "contains": table.contains, "remove": table.remove}
+
+    def bulk_operations(self, table: Any) -> Dict[str, Callable[[], Any]]:
+        """ Returns the whole-table operations of a table. """
+        if self.storage is None:
+            return {"iterate": lambda: list(table), "merge": lambda: {}.update(table), "clone": table.copy}
+
+        if self.storage == "frozen":
+            return {"iterate": table.keys}
+
+        def merge() -> None:
+            self.new().merge(table)
+
+        return {"iterate": table.keys, "merge": merge, "clone": table.clone}
+
+
+def run_workload(target: Target, distribution: str, size: int, seed: int) -> List[Dict[str, Any]]:
+    """ Runs every operation of a target on a table of the given size and distribution, returning their results. """
+    rng = random.Random(seed)
+    keys = make_keys(distribution, size, rng)
+    misses = [f"missing:{key}" for key in keys]
+    fields = {
+        "target": target.name(),
+        "storage": target.storage,
+        "hash_function": target.hash_function,
+        "distribution": distribution,
+        "size": size,
+    }
+    results: List[Dict[str, Any]] = []
+
+    def build() -> Any:
+        table = target.new()
+        put = table.__setitem__ if target.storage is None else table.put
+
+        for key in keys:
+            put(key, key)
+
+        return table
+
+    if target.storage == "frozen":
+        source = build()
+        memory = peak_memory(source.freeze)
+        seconds, latencies = timed(lambda _: source.freeze(), [None])
+        table = source.freeze()
+        del source
+        results.append(summarize("freeze", size, seconds, latencies, peak_memory_bytes=memory, **fields))
+    else:
+        memory = peak_memory(build)
+        table = target.new()
+        put = table.__setitem__ if target.storage is None else table.put
+        seconds, latencies = timed(lambda key: put(key, key), keys)
+        results.append(summarize("put", size, seconds, latencies, peak_memory_bytes=memory, **fields))
+
+    if target.storage is not None:
+        results[-1]["bytes_per_key"] = table.memory_usage()["bytes_per_entry"]
+
+    operations = target.operations(table)
+
+    for hit_ratio in HIT_RATIOS:
+        accesses = make_accesses(distribution, keys, misses, hit_ratio, rng)
+
+        for operation in ("get", "contains"):
+            seconds, latencies = timed(operations[operation], accesses)
+            results.append(summarize(operation, size, seconds, latencies, hit_ratio=hit_ratio, **fields))
+
+    for operation, function in target.bulk_operations(table).items():
+        passes = [timed(lambda _: function(), [None])[0] for _ in range(BULK_REPEATS)]
+        nanoseconds = [int(seconds * 1e9) for seconds in passes]
+        results.append(summarize(operation, size * BULK_REPEATS, sum(passes), nanoseconds, **fields))
+
+    if "remove" in operations:
+        removed = keys.copy()
+        rng.shuffle(removed)
+        seconds, latencies = timed(operations["remove"], removed)
+        results.append(summarize("remove", size, seconds, latencies, **fields))
+
+    return results
+
+
+def result_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    """ Returns what identifies a result between two runs. """
+    return tuple(result.get(field) for field in ("target", "storage", "hash_function", "distribution", "size", "operation", "hit_ratio"))
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compares the throughput of each result with the same one in a baseline.
+
+    Parameters :
+        - results (List[Dict[str, Any]]) : The results of this run.
+        - baseline (List[Dict[str, Any]]) : The results of the baseline run.
+        - threshold (float) : The share of throughput lost above which a result is a regression.
+
+    Returns :
+        The regressions, each result being annotated with its "baseline_ratio" (its throughput over the baseline's).
+    """
+    baseline_by_key = {result_key(result): result for result in baseline}
+    regressions: List[Dict[str, Any]] = []
+
+    for result in results:
+        # dict is the reference of each run, not the code under test
+        if result["target"] == "dict":
+            continue
+
+        reference = baseline_by_key.get(result_key(result))
+
+        if reference is None or reference["ops_per_sec"] == 0:
+            continue
+
+        result["baseline_ratio"] = result["ops_per_sec"] / reference["ops_per_sec"]
+
+        if result["baseline_ratio"] < 1 - threshold:
+            regressions.append(result)
+
+    return regressions
+
+
+def attach_dict_ratios(results: List[Dict[str, Any]]) -> None:
+    """ Annotates each result of a hash table with its throughput over the dict's on the same workload ("dict_ratio"). """
+    dict_results = {result_key({**result, "target": None}): result for result in results if result["target"] == "dict"}
+
+    for result in results:
+        if result["target"] == "dict":
+            continue
+
+        reference = dict_results.get(result_key({**result, "target": None, "storage": None, "hash_function": None}))
+
+        if reference is not None and reference["ops_per_sec"] > 0:
+            result["dict_ratio"] = result["ops_per_sec"] / reference["ops_per_sec"]
+
+
+def parse_list(value: str) -> List[str]:
+    """ Splits a comma-separated command line option. """
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suite of HashTable against dict.")
+    parser.add_argument("--sizes", type=parse_list, default=None, help="Comma-separated table sizes, like 1e3,1e5.")
+    parser.add_argument("--full", action="store_true", help="Runs every size from 1e3 to 1e7.")
+    parser.add_argument("--distributions", type=parse_list, default=list(DISTRIBUTIONS))
+    parser.add_argument("--storages", type=parse_list, default=list(STORAGES))
+    parser.add_argument("--hash-functions", type=parse_list, default=list(HASH_FUNCTIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="The JSON file of the results.")
+    parser.add_argument("--baseline", default=None, help="The JSON file of a previous run to compare with.")
+    parser.add_argument("--save-baseline", action="store_true", help="Writes the results to the baseline file too.")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    arguments = parser.parse_args()
+
+    sizes = [int(float(size)) for size in arguments.sizes] if arguments.sizes else list(FULL_SIZES if arguments.full else QUICK_SIZES)
+    targets = [Target(None, None)] + [
+        Target(storage, hash_function) for storage in arguments.storages for hash_function in arguments.hash_functions
+    ]
+    results: List[Dict[str, Any]] = []
+
+    for size in sizes:
+        for distribution in arguments.distributions:
+            for target in targets:
+                start = time.perf_counter()
+                results.extend(run_workload(target, distribution, size, arguments.seed))
+                label = target.name() if target.storage is None else f"{target.storage}/{target.hash_function}"
+                print(f"{size:>10,} {distribution:<10} {label:<20} {time.perf_counter() - start:>8.2f} s", file=sys.stderr)
+
+    attach_dict_ratios(results)
+    regressions: List[Dict[str, Any]] = []
+
+    if arguments.baseline is not None and not arguments.save_baseline:
+        if os.path.exists(arguments.baseline):
+            with open(arguments.baseline) as file:
+                regressions = compare(results, json.load(file)["results"], arguments.threshold)
+        else:
+            print(f"No baseline at {arguments.baseline}, run with --save-baseline to create it.", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "sizes": sizes,
+            "seed": arguments.seed,
+        },
+        "results": results,
+        "regressions": [result_key(result) for result in regressions],
+    }
+
+    paths = [arguments.output] if arguments.output is not None else []
+
+    if arguments.save_baseline and arguments.baseline is not None:
+        paths.append(arguments.baseline)
+
+    for path in paths:
+        with open(path, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if not paths:
+        json.dump(report, sys.stdout, indent=2)
+
+    for result in regressions:
+        print(f"Regression : {result_key(result)} at {result['baseline_ratio']:.0%} of the baseline", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
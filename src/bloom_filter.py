@@ -0,0 +1,181 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple
+from array import array
+import functools
+import math
+import random
+
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+# Scatters a hash, so that the hashes only differing by their low bits (like the hashes of integers) get unrelated blocks
+GOLDEN_64 = 0x9E3779B97F4A7C15
+# Each key picks one of these precomputed bit patterns with the top bits of its scattered hash, and its block with the
+# others, instead of computing the positions of its bits one by one
+PATTERN_BITS = 12
+PATTERN_SHIFT = 64 - PATTERN_BITS
+MAX_HASHES = 16
+
+# The patterns of each number of bits per key, generated once
+_patterns: Dict[int, List[int]] = {}
+
+
+def _get_patterns(hashes: int) -> List[int]:
+    """ Returns the 2 ** PATTERN_BITS patterns of 64 bits with the given number of bits set, always the same ones. """
+    patterns = _patterns.get(hashes)
+
+    if patterns is None:
+        rng = random.Random(hashes)
+        patterns = [sum(1 << bit for bit in rng.sample(range(64), hashes)) for _ in range(1 << PATTERN_BITS)]
+        _patterns[hashes] = patterns
+
+    return patterns
+
+
+def _expected_rate(keys_per_block: float, hashes: int) -> float:
+    """
+    Returns the false positive rate of a blocked Bloom filter, the number of keys per block following a Poisson law :
+    a block holding j keys has each of its bits set with a probability of 1 - (1 - 1 / 64) ** (j * hashes).
+    """
+    rate = 0.0
+    probability = math.exp(-keys_per_block)
+    j = 0
+
+    while j < keys_per_block + 10 * math.sqrt(keys_per_block) + 10:
+        rate += probability * (1 - (1 - 1 / 64) ** (j * hashes)) ** hashes
+        j += 1
+        probability *= keys_per_block / j
+
+    return rate
+
+
+@functools.lru_cache(maxsize=64)
+def _size(capacity: int, false_positive_rate: float) -> Tuple[int, int]:
+    """
+    Returns the number of blocks and of bits per key reaching the given false positive rate for the given number of keys.
+    The keys are unevenly spread over the blocks, so that a blocked filter needs more bits per key than the
+    -ln(rate) / ln(2) ** 2 of a classic Bloom filter : starting from them, the bits are increased until the rate is reached.
+    """
+    bits_per_key = -math.log(false_positive_rate) / math.log(2) ** 2
+
+    while True:
+        blocks = max(1, math.ceil(capacity * bits_per_key / 64))
+        rate, hashes = min((_expected_rate(capacity / blocks, hashes), hashes) for hashes in range(1, MAX_HASHES + 1))
+
+        if rate <= false_positive_rate:
+            return blocks, hashes
+
+        bits_per_key *= 1.05
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        """
+        Initializes an empty blocked Bloom filter over full key hashes, telling for sure when a key was never added.
+        Every key sets its bits in a single 64 bits block, chosen by its hash along with one of 4096 precomputed bit
+        patterns, so that a check is a single block read and mask, whatever the number of bits per key.
+        The blocks and the bits per key are sized for the given number of keys and false positive rate.
+        Past that number of keys, the false positive rate grows, and add tells that the filter is due to be rebuilt larger.
+
+        The bits of a removed key can't be cleared, since other keys may share them : the filter keeps answering
+        "maybe" for it, which only costs a false positive. The removals are counted instead, and remove tells when
+        they make up so much of the filter that it is due to be rebuilt from the remaining keys.
+
+        Parameters :
+            - capacity (int) : The number of keys the filter is sized for. At least 1 is used.
+            - false_positive_rate (float) : The share of the absent keys wrongly reported as maybe present,
+              once the filter holds capacity keys (Optional). Defaults to 0.01.
+
+        Behavior - The false positive rate is invalid :
+            Preconditions :
+                The false positive rate is not strictly between 0 and 1.
+            Postconditions :
+                A value error is raised.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate is expected to be strictly between 0 and 1.")
+
+        self.__capacity = max(1, capacity)
+        self.__target_rate = false_positive_rate
+        self.__block_count, self.__hashes = _size(self.__capacity, false_positive_rate)
+        self.__patterns = _get_patterns(self.__hashes)
+        self.__blocks = array("Q", bytes(8 * self.__block_count))
+        self.__count = 0
+        self.__removed = 0
+
+    def add(self, hash: int) -> bool:
+        """
+        Adds the hash of a key to the filter.
+
+        Parameters :
+            - hash (int) : The full hash of the key.
+
+        Returns :
+            True if the filter now holds more keys than it was sized for, and should be rebuilt larger. False otherwise.
+        """
+        hash = (hash * GOLDEN_64) & MASK_64
+        self.__blocks[(hash >> PATTERN_BITS) % self.__block_count] |= self.__patterns[hash >> PATTERN_SHIFT]
+        self.__count += 1
+
+        return self.__count > self.__capacity
+
+    def might_contain(self, hash: int) -> bool:
+        """ Checks if a key of the given hash may have been added, False meaning that it surely wasn't. """
+        hash = (hash * GOLDEN_64) & MASK_64
+        pattern = self.__patterns[hash >> PATTERN_SHIFT]
+
+        return self.__blocks[(hash >> PATTERN_BITS) % self.__block_count] & pattern == pattern
+
+    def remove(self) -> bool:
+        """
+        Counts the removal of a key, whose bits stay set.
+
+        Returns :
+            True if the removed keys make up half of the keys added, so that the filter should be rebuilt. False otherwise.
+        """
+        self.__removed += 1
+
+        return self.__removed * 2 >= self.__count
+
+    def false_positive_rate(self) -> float:
+        """
+        Estimates the current false positive rate : an absent key lands on a block chosen uniformly at random,
+        and its pattern's bits are all set with a probability of about the share of set bits of that block to the
+        power of the bits per key.
+        """
+        hashes = self.__hashes
+
+        return sum((block.bit_count() / 64) ** hashes for block in self.__blocks) / self.__block_count
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the state of the filter : its "capacity", the "target_false_positive_rate" it was sized for and
+        the "false_positive_rate" estimated now, the "bits" of its blocks and the "hashes" (bits set) per key,
+        the keys "added" and "removed" since it was built, and the "memory" of its blocks in bytes.
+        """
+        return {
+            "capacity": self.__capacity,
+            "target_false_positive_rate": self.__target_rate,
+            "false_positive_rate": self.false_positive_rate(),
+            "bits": self.__block_count * 64,
+            "hashes": self.__hashes,
+            "added": self.__count,
+            "removed": self.__removed,
+            "memory": self.__blocks.itemsize * self.__block_count,
+        }
+
+    def target_false_positive_rate(self) -> float:
+        """ Returns the false positive rate the filter was sized for. """
+        return self.__target_rate
+
+    def clone(self) -> BloomFilter:
+        """ Clones the filter, copying its blocks. """
+        clone = BloomFilter(1, self.__target_rate)
+        clone.__capacity = self.__capacity
+        clone.__hashes = self.__hashes
+        clone.__patterns = self.__patterns
+        clone.__block_count = self.__block_count
+        clone.__blocks = array("Q", self.__blocks)
+        clone.__count = self.__count
+        clone.__removed = self.__removed
+
+        return clone
@@ -0,0 +1,181 @@
+from __future__ import annotations
+from typing import Any, Iterable, List, Sequence, Tuple
+import asyncio
+from resp import ReplyError, encode_command, read_reply
+
+
+Command = Sequence[bytes | str | int]
+
+
+class _Connection:
+    """ A connection to the server, sending a batch of commands with a single write and reading their replies in order. """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.__reader = reader
+        self.__writer = writer
+
+    async def execute(self, commands: List[Command]) -> List[Any]:
+        """ Sends the commands, then reads one reply per command. """
+        self.__writer.write(b"".join(encode_command(*command) for command in commands))
+        await self.__writer.drain()
+
+        return [await read_reply(self.__reader) for _ in commands]
+
+    def close(self) -> None:
+        """ Closes the connection. """
+        self.__writer.close()
+
+
+class HashTableClient:
+    def __init__(self, host: str = "127.0.0.1", port: int = 6380, path: str | None = None, pool_size: int = 8) -> None:
+        """
+        Initializes a client of a HashTableServer. The connections are opened on demand and pooled : each request takes
+        an idle connection, or opens a new one while there are less than pool_size, or waits for one to be released.
+        Concurrent tasks thus share at most pool_size connections, each carrying one request or pipeline at a time.
+
+        Parameters :
+            - host (str) : The TCP address of the server (Optional). Defaults to "127.0.0.1".
+            - port (int) : The TCP port of the server (Optional). Defaults to 6380.
+            - path (str | None) : The path of the Unix socket of the server, used instead of TCP (Optional). Defaults to None.
+            - pool_size (int) : The maximum number of connections (Optional). Defaults to 8.
+
+        Behavior - The pool size is invalid :
+            Preconditions :
+                The pool size is lower than 1.
+            Postconditions :
+                A value error is raised.
+        """
+        if pool_size < 1:
+            raise ValueError("Pool size is expected to be at least 1.")
+
+        self.__host = host
+        self.__port = port
+        self.__path = path
+        self.__idle: List[_Connection] = []
+        self.__slots = asyncio.Semaphore(pool_size)
+        self.__closed = False
+
+    async def __connect(self) -> _Connection:
+        """ Opens a new connection to the server. """
+        if self.__path is not None:
+            reader, writer = await asyncio.open_unix_connection(self.__path)
+        else:
+            reader, writer = await asyncio.open_connection(self.__host, self.__port)
+
+        return _Connection(reader, writer)
+
+    async def pipeline(self, commands: Iterable[Command]) -> List[Any]:
+        """
+        Sends a batch of commands on a single connection without waiting for each reply, then reads their replies.
+        A batch of n commands costs a single round trip instead of n.
+
+        Parameters :
+            - commands (Iterable[Command]) : The commands, each one being its name followed by its arguments,
+              like ("SET", "key", b"value"). See HashTableServer for the commands.
+
+        Returns :
+            The reply of each command, in order : bytes or None for a value, an integer, a string, a list for an array,
+            or a ReplyError for a command the server rejected, which is returned instead of raised.
+
+        Behavior - The connection fails :
+            Preconditions :
+                The server can't be reached, or closes the connection before every reply is read.
+            Postconditions :
+                An OSError or asyncio.IncompleteReadError is raised. The connection is dropped from the pool.
+        """
+        commands = list(commands)
+
+        async with self.__slots:
+            connection = self.__idle.pop() if self.__idle else await self.__connect()
+
+            try:
+                replies = await connection.execute(commands)
+            except BaseException:
+                # The replies left unread would be taken for the replies of the next request
+                connection.close()
+                raise
+
+            if self.__closed:
+                connection.close()
+            else:
+                self.__idle.append(connection)
+
+        return replies
+
+    async def __execute(self, *command: bytes | str | int) -> Any:
+        """ Sends a single command, raising the error the server answers with if any. """
+        reply = (await self.pipeline([command]))[0]
+
+        if isinstance(reply, ReplyError):
+            raise reply
+
+        return reply
+
+    async def ping(self) -> bool:
+        """ Checks that the server answers. """
+        return await self.__execute("PING") == "PONG"
+
+    async def get(self, key: str, default: bytes | None = None) -> bytes | None:
+        """ Retrieves the value with the given key, or a default value if the key doesn't exist. See HashTable.get. """
+        value = await self.__execute("GET", key)
+
+        return default if value is None else value
+
+    async def put(self, key: str, value: bytes | str) -> None:
+        """ Stores a value with the given key, a string being stored in UTF-8. See HashTable.put. """
+        await self.__execute("SET", key, value)
+
+    async def remove(self, key: str) -> bool:
+        """ Removes the given key, telling if it existed. See HashTable.remove. """
+        return await self.__execute("DEL", key) == 1
+
+    async def contains(self, key: str) -> bool:
+        """ Checks if a given key exists. See HashTable.contains. """
+        return await self.__execute("EXISTS", key) == 1
+
+    async def get_many(self, keys: Iterable[str], default: bytes | None = None) -> List[bytes | None]:
+        """ Retrieves the values of a batch of keys with a single command. See HashTable.get_many. """
+        keys = list(keys)
+
+        if not keys:
+            return []
+
+        return [default if value is None else value for value in await self.__execute("MGET", *keys)]
+
+    async def put_many(self, entries: Iterable[Tuple[str, bytes | str]]) -> None:
+        """ Stores a batch of key-values with a single command. See HashTable.put_many. """
+        arguments = [part for entry in entries for part in entry]
+
+        if arguments:
+            await self.__execute("MSET", *arguments)
+
+    async def contains_many(self, keys: Iterable[str]) -> List[bool]:
+        """ Checks if each key of a batch exists, with a single pipeline. See HashTable.contains_many. """
+        return [reply == 1 for reply in await self.pipeline([("EXISTS", key) for key in keys])]
+
+    async def remove_many(self, keys: Iterable[str]) -> List[bool]:
+        """ Removes a batch of keys with a single pipeline, telling for each key if it existed. See HashTable.remove_many. """
+        return [reply == 1 for reply in await self.pipeline([("DEL", key) for key in keys])]
+
+    async def size(self) -> int:
+        """ Returns the number of elements inside the hash table. """
+        return await self.__execute("DBSIZE")
+
+    async def clear(self) -> None:
+        """ Clears the hash table. """
+        await self.__execute("FLUSHDB")
+
+    async def close(self) -> None:
+        """ Closes the idle connections, and the ones in use once their request is done. """
+        self.__closed = True
+
+        while self.__idle:
+            self.__idle.pop().close()
+
+    async def __aenter__(self) -> HashTableClient:
+        """ Returns the client, to be closed when leaving the async with statement. """
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        """ Closes the connections. """
+        await self.close()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+from typing import Any, Callable, Hashable, Iterator, List, Tuple
+import threading
+from hash_table import HashTable
+
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_64 = 0x9E3779B97F4A7C15
+
+class ConcurrentHashTable:
+    def __init__(
+        self,
+        capacity: int = 12,
+        stripes: int = 16,
+        custom_hash: Callable[[Hashable], int] | None = None,
+        storage: str = "chained",
+        hash_function: str = "builtin",
+        seed: int | None = None
+    ) -> None:
+        """
+        Initializes a new empty thread-safe hash table, split into independent segments each guarded by its own lock.
+        A key always belongs to the same segment, chosen from the high bits of the interpreter's hash of the key
+        multiplied by a 64 bits odd constant, so operations on keys of different segments never wait for each other.
+        The segments index their slots with the low bits of the hash : choosing the segment from them too would leave
+        all the keys of a segment sharing them, and so most of its slots empty.
+        Each segment resizes on its own, under its own lock only.
+
+        Every operation, lookups included, takes the lock of its segment : a HashTable lookup isn't read-only, as it
+        moves the entries of a resize in progress, and updates the recency of the eviction policy, the lazy expiry
+        and the statistics. A lock-free read would race with those writes, while an uncontended lock costs little.
+
+        Parameters :
+            - capacity (int) : The initial total size of the slots lists (Optional). Default to 12.
+            - stripes (int) : The number of segments, and so of locks (Optional). Defaults to 16.
+            - custom_hash (HashFunction | None) : A custom hash used by the segments (Optional). Defaults to None.
+            - storage (str) : The storage backend of the segments, "chained" or "open" (Optional). Defaults to "chained".
+            - hash_function (str) : The name of the built-in hash function of the segments (Optional). Defaults to "builtin".
+            - seed (int | None) : The seed of the hash function (Optional). Defaults to None, a random seed.
+
+        Behavior - The number of stripes is invalid :
+            Preconditions :
+                The number of stripes is lower than 1.
+            Postconditions :
+                A value error is raised.
+        """
+        if stripes < 1:
+            raise ValueError("Stripes are expected to be at least 1.")
+
+        self.__stripes = stripes
+        self.__segments: List[HashTable] = [
+            HashTable(max(1, capacity // stripes), custom_hash, storage=storage, hash_function=hash_function, seed=seed)
+            for _ in range(stripes)
+        ]
+        self.__locks: List[threading.Lock] = [threading.Lock() for _ in range(stripes)]
+
+    def __stripe(self, key: Hashable) -> int:
+        """ Returns the index of the segment owning the given key. """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        return (((hash(key) * GOLDEN_64) & MASK_64) >> 32) % self.__stripes
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """
+        Retrieves the value with the given key, or a default value if the key doesn't exist. See HashTable.get.
+        Lookups take the lock of their segment too, as they may move entries of a resize in progress.
+        """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].get(key, default)
+
+    def contains(self, key: Hashable) -> bool:
+        """ Checks if a given key exists in the hash table, under the lock of its segment. See get and HashTable.contains. """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].contains(key)
+
+    def put(self, key: Hashable, value: Any | None, override: bool = True) -> Any | None:
+        """ Adds a new value with the given key in the hash table, atomically. See HashTable.put. """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].put(key, value, override)
+
+    def put_if_absent(self, key: Hashable, value: Any | None) -> Any | None:
+        """
+        Atomically adds a new value with the given key, only if the key doesn't exist yet.
+
+        Parameters :
+            - key (Hashable) : The key of the value to add.
+            - value (Any | None) : The value to add.
+
+        Returns :
+            If the key exists, its current value is returned. Else, None is returned.
+
+        Behavior - The key is None or unhashable :
+            Preconditions :
+                The key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The hash table is not modified.
+
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the hash table.
+            Postconditions :
+                The key-value is inserted in the hash table.
+                None is returned.
+
+        Behavior - The key exists :
+            Preconditions :
+                The key exists in the hash table.
+            Postconditions :
+                The current value of the key is returned.
+            Invariants :
+                The hash table is not modified.
+        """
+        stripe = self.__stripe(key)
+        segment = self.__segments[stripe]
+
+        with self.__locks[stripe]:
+            size = segment.size()
+            current_value = segment.setdefault(key, value)
+
+            return None if segment.size() != size else current_value
+
+    def setdefault(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """ Atomically retrieves the value with the given key, inserting the default value first if needed. See HashTable.setdefault. """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].setdefault(key, default)
+
+    def compute(self, key: Hashable, function: Callable[[Any | None], Any | None], default: Any | None = None) -> Any | None:
+        """
+        Atomically replaces the value of the given key by the result of a function applied to it. See HashTable.compute.
+        The function is called while the segment is locked, so it must not access the hash table itself.
+        """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].compute(key, function, default)
+
+    def increment(self, key: Hashable, delta: Any = 1) -> Any:
+        """ Atomically adds a delta to the value of the given key. See HashTable.increment. """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].increment(key, delta)
+
+    def remove(self, key: Hashable) -> Any | None:
+        """ Removes the key-value corresponding to the given key, atomically. See HashTable.remove. """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].remove(key)
+
+    def pop(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """ Removes the key-value corresponding to the given key, atomically. See HashTable.pop. """
+        stripe = self.__stripe(key)
+
+        with self.__locks[stripe]:
+            return self.__segments[stripe].pop(key, default)
+
+    def size(self) -> int:
+        """ Returns the number of elements inside the hash table, summing the constant time size of each segment. """
+        return sum(segment.size() for segment in self.__segments)
+
+    def __len__(self) -> int:
+        """ Returns the number of elements inside the hash table. """
+        return self.size()
+
+    def is_empty(self) -> bool:
+        """ Checks if the hash table is empty or not. """
+        return self.size() == 0
+
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Returns the key-value pairs of the hash table as a list.
+        The segments are locked one after the other, so the result is consistent per segment only.
+        """
+        entries: List[Tuple[Hashable, Any]] = []
+
+        for lock, segment in zip(self.__locks, self.__segments):
+            with lock:
+                entries.extend(segment.entries())
+
+        return entries
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of the hash table as a list. See entries. """
+        return [key for key, _ in self.entries()]
+
+    def values(self) -> List[Any]:
+        """ Returns the values of the hash table as a list. See entries. """
+        return [value for _, value in self.entries()]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """ Iterates over the keys of the hash table. See entries. """
+        return iter(self.keys())
+
+    def clear(self) -> None:
+        """ Clears the hash table, one segment after the other. """
+        for lock, segment in zip(self.__locks, self.__segments):
+            with lock:
+                segment.clear()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Tuple
+import os
+import threading
+from hash_table import HashTable
+from snapshot import encode_key
+from write_ahead_log import CLEAR, PUT, REMOVE, WriteAheadLog, encode, replay
+
+
+# Marks a missing entry, as None is a valid value
+_MISSING = object()
+
+SNAPSHOT_FILE = "table.snapshot"
+LOG_FILE = "table.log"
+# The log being folded into a new snapshot by a compaction
+COMPACTING_LOG_FILE = "table.log.compacting"
+
+
+class DurableHashTable:
+    def __init__(
+        self,
+        directory: str,
+        capacity: int = 12,
+        custom_hash: Callable[[Hashable], int] | None = None,
+        storage: str = "chained",
+        hash_function: str = "builtin",
+        seed: int | None = None,
+        group_commit: int = 128,
+        commit_interval: float | None = 0.05,
+        sync: bool = True,
+        compact_threshold: int | None = 64 * 2**20
+    ) -> None:
+        """
+        Opens a hash table whose every put, remove and clear is appended to a write-ahead log before being acknowledged.
+        The directory holds the latest snapshot (see HashTable.save) and the log of the mutations made since.
+        On opening, the snapshot is loaded and the log is replayed on top of it, a torn record left by a crash being dropped.
+        Once the log grows past the compaction threshold, a new snapshot is saved by a background thread and the log restarts empty.
+
+        Parameters :
+            - directory (str) : The directory of the snapshot and log files, created if needed.
+            - capacity (int) : The initial capacity of a new hash table (Optional). Default to 12.
+            - custom_hash (HashFunction | None) : A custom hash, which must be given again on every opening (Optional). Defaults to None.
+            - storage (str) : The storage backend of a new hash table (Optional). Defaults to "chained".
+            - hash_function (str) : The name of the built-in hash function of a new hash table (Optional). Defaults to "builtin".
+            - seed (int | None) : The seed of the hash function of a new hash table (Optional). Defaults to None, a random seed.
+            - group_commit (int) : The number of mutations written and synced together (Optional). Defaults to 128.
+              With 1, every mutation is on disk before its method returns.
+            - commit_interval (float | None) : The maximum seconds a mutation waits for its group to be committed (Optional).
+              Defaults to 0.05. With None, the pending mutations are only committed by a full group, commit or close.
+            - sync (bool) : If each commit should fsync the log (Optional). Defaults to True.
+            - compact_threshold (int | None) : The log size in bytes that triggers a background compaction (Optional).
+              Defaults to 64 MiB. With None, the log is only compacted by compact.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.__snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.__log_path = os.path.join(directory, LOG_FILE)
+        self.__compacting_log_path = os.path.join(directory, COMPACTING_LOG_FILE)
+        self.__group_commit = group_commit
+        self.__sync = sync
+        self.__compact_threshold = compact_threshold
+        self.__lock = threading.RLock()
+        self.__compaction_lock = threading.Lock() # Held for a whole compaction, so that two compactions never overlap
+        self.__compaction: threading.Thread | None = None
+
+        if os.path.exists(self.__snapshot_path):
+            self.__table: HashTable = HashTable.open(self.__snapshot_path, mmap=False, custom_hash=custom_hash) # type: ignore[assignment]
+        else:
+            self.__table = HashTable(capacity, custom_hash, storage=storage, hash_function=hash_function, seed=seed)
+
+        # A crash during a compaction leaves its log behind, older than the current one
+        for path in (self.__compacting_log_path, self.__log_path):
+            if os.path.exists(path):
+                self.__replay(path)
+
+        self.__log = WriteAheadLog(self.__log_path, group_commit, sync)
+        self.__closed = threading.Event()
+        self.__committer: threading.Thread | None = None
+
+        if commit_interval is not None:
+            self.__committer = threading.Thread(target=self.__commit_periodically, args=(commit_interval,), daemon=True)
+            self.__committer.start()
+
+    def __replay(self, path: str) -> None:
+        """ Applies every mutation of a log file to the hash table. """
+        table = self.__table
+
+        for operation, key, value in replay(path):
+            if operation == PUT:
+                table.put(key, value)
+            elif operation == REMOVE:
+                table.remove(key)
+            else:
+                table.clear()
+
+    def __commit_periodically(self, interval: float) -> None:
+        """ Commits the pending mutations every interval, until the hash table is closed. """
+        while not self.__closed.wait(interval):
+            with self.__lock:
+                self.__log.commit()
+
+    def __append(self, record: bytes) -> None:
+        """ Appends a mutation to the log, starting a background compaction if the log is too large. """
+        self.__log.append(record)
+
+        if (
+            self.__compact_threshold is not None
+            and self.__log.size() >= self.__compact_threshold
+            and (self.__compaction is None or not self.__compaction.is_alive())
+        ):
+            self.__compaction = threading.Thread(target=self.compact, daemon=True)
+            self.__compaction.start()
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """ Retrieves the value with the given key. See HashTable.get. """
+        with self.__lock:
+            return self.__table.get(key, default)
+
+    def contains(self, key: Hashable) -> bool:
+        """ Checks if a given key exists in the hash table. See HashTable.contains. """
+        with self.__lock:
+            return self.__table.contains(key)
+
+    def get_many(self, keys: Iterable[Hashable], default: Any | None = None) -> List[Any | None]:
+        """ Retrieves the values of a batch of keys. See HashTable.get_many. """
+        with self.__lock:
+            return self.__table.get_many(keys, default)
+
+    def put(self, key: Hashable, value: Any | None, override: bool = True) -> Any | None:
+        """
+        Adds a new value with the given key, logging it if the hash table changes. See HashTable.put.
+        The key must be a string, bytes or an integer, the only key types a snapshot can hold : any other key raises a type error.
+        """
+        if encode_key(key) is None:
+            raise TypeError(f"Key of type {type(key).__name__} can't be saved, only strings, bytes and integers can.")
+
+        with self.__lock:
+            if not override and self.__table.contains(key):
+                return False
+
+            # Encoded first, so that a value that can't be pickled leaves the hash table unchanged
+            record = encode(PUT, key, value)
+            result = self.__table.put(key, value)
+            self.__append(record)
+
+            return result
+
+    def put_many(self, entries: Iterable[Tuple[Hashable, Any | None]], override: bool = True) -> None:
+        """ Adds a batch of key-values, logging each of them. See HashTable.put_many. """
+        with self.__lock:
+            for key, value in entries:
+                self.put(key, value, override)
+
+    def remove(self, key: Hashable) -> Any | None:
+        """ Removes the key-value corresponding to the given key, logging it if the key existed. See HashTable.remove. """
+        with self.__lock:
+            value = self.__table.pop(key, _MISSING)
+
+            if value is _MISSING:
+                return None
+
+            self.__append(encode(REMOVE, key))
+
+            return value
+
+    def clear(self) -> None:
+        """ Clears the hash table, logging it. """
+        with self.__lock:
+            self.__table.clear()
+            self.__append(encode(CLEAR))
+
+    def size(self) -> int:
+        """ Returns the number of elements inside the hash table. """
+        return self.__table.size()
+
+    def __len__(self) -> int:
+        """ Returns the number of elements inside the hash table. """
+        return self.__table.size()
+
+    def is_empty(self) -> bool:
+        """ Checks if the hash table is empty or not. """
+        return self.__table.is_empty()
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of the hash table as a list. """
+        with self.__lock:
+            return self.__table.keys()
+
+    def values(self) -> List[Any]:
+        """ Returns the values of the hash table as a list. """
+        with self.__lock:
+            return self.__table.values()
+
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """ Returns the key-value pairs of the hash table as a list. """
+        with self.__lock:
+            return self.__table.entries()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """ Iterates over the keys of the hash table. See keys. """
+        return iter(self.keys())
+
+    def commit(self) -> None:
+        """ Writes and syncs the pending mutations right away, without waiting for their group to be complete. """
+        with self.__lock:
+            self.__log.commit()
+
+    def compact(self) -> None:
+        """
+        Saves a new snapshot of the hash table and restarts the log empty.
+        The hash table is only locked while its log is switched and a copy-on-write clone is taken :
+        the snapshot is written from the clone while the mutations go on in the new log.
+        Replaying a log again over a snapshot that already holds its mutations gives the same hash table,
+        so a crash at any point of a compaction loses nothing.
+        """
+        with self.__compaction_lock:
+            with self.__lock:
+                # The log left by a compaction that failed is kept, the current one then still holds what follows it
+                if not os.path.exists(self.__compacting_log_path):
+                    self.__log.close()
+                    os.replace(self.__log_path, self.__compacting_log_path)
+                    self.__log = WriteAheadLog(self.__log_path, self.__group_commit, self.__sync)
+                else:
+                    self.__log.commit()
+
+                clone = self.__table.clone(copy_on_write=True)
+
+            clone.save(self.__snapshot_path)
+            os.remove(self.__compacting_log_path)
+
+    def close(self) -> None:
+        """ Commits the pending mutations and stops the background threads. The hash table can't be used anymore. """
+        self.__closed.set()
+
+        if self.__committer is not None:
+            self.__committer.join()
+
+        if self.__compaction is not None:
+            self.__compaction.join()
+
+        with self.__lock:
+            self.__log.close()
+
+    def __enter__(self) -> DurableHashTable:
+        """ Returns the durable hash table, to be closed when leaving the with statement. """
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """ Commits the pending mutations and stops the background threads. """
+        self.close()
@@ -0,0 +1,289 @@
+from __future__ import annotations
+from typing import Callable, Dict, Hashable
+from collections import OrderedDict
+
+
+class LRUPolicy:
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initializes a least recently used eviction policy : the key evicted is the one accessed the longest time ago.
+        The keys are kept in access order, so every operation is done in constant time.
+
+        Parameters :
+            - max_entries (int) : The maximum number of entries of the hash table.
+        """
+        self.__max_entries = max_entries
+        self.__order: OrderedDict[Hashable, None] = OrderedDict()
+
+    def insert(self, key: Hashable) -> None:
+        """ Records a new key, as the most recently used one. """
+        self.__order[key] = None
+
+    def access(self, key: Hashable) -> None:
+        """ Records an access to an existing key, making it the most recently used one. """
+        self.__order.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        """ Forgets a removed key. """
+        del self.__order[key]
+
+    def victim(self) -> Hashable:
+        """ Returns the key to evict, the least recently used one. """
+        return next(iter(self.__order))
+
+    def clear(self) -> None:
+        """ Forgets every key. """
+        self.__order.clear()
+
+    def clone(self) -> LRUPolicy:
+        """ Clones the policy with its current state. """
+        clone = LRUPolicy(self.__max_entries)
+        clone.__order = self.__order.copy()
+
+        return clone
+
+
+class LFUPolicy:
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initializes a least frequently used eviction policy : the key evicted is the one accessed the fewest times,
+        the least recently used one among them. The keys are grouped in one bucket per access count, and the lowest
+        count is tracked, so that inserting, accessing and evicting are done in constant time.
+
+        Parameters :
+            - max_entries (int) : The maximum number of entries of the hash table.
+        """
+        self.__max_entries = max_entries
+        self.__frequencies: Dict[Hashable, int] = {}
+        self.__buckets: Dict[int, OrderedDict[Hashable, None]] = {}
+        self.__min_frequency = 0
+
+    def insert(self, key: Hashable) -> None:
+        """ Records a new key, accessed once. """
+        self.__frequencies[key] = 1
+        self.__buckets.setdefault(1, OrderedDict())[key] = None
+        self.__min_frequency = 1
+
+    def access(self, key: Hashable) -> None:
+        """ Records an access to an existing key, moving it to the bucket of the next access count. """
+        frequency = self.__frequencies[key]
+        self.__unlink(key, frequency)
+        self.__frequencies[key] = frequency + 1
+        self.__buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+        if self.__min_frequency == 0:
+            self.__min_frequency = frequency + 1
+
+    def remove(self, key: Hashable) -> None:
+        """ Forgets a removed key. """
+        self.__unlink(key, self.__frequencies.pop(key))
+
+        if self.__min_frequency == 0 and self.__buckets:
+            # Only an explicit removal can empty the lowest bucket without a key taking its place
+            self.__min_frequency = min(self.__buckets)
+
+    def __unlink(self, key: Hashable, frequency: int) -> None:
+        """ Removes a key from the bucket of its access count, dropping the bucket once empty. """
+        bucket = self.__buckets[frequency]
+        del bucket[key]
+
+        if not bucket:
+            del self.__buckets[frequency]
+
+            if self.__min_frequency == frequency:
+                self.__min_frequency = 0
+
+    def victim(self) -> Hashable:
+        """ Returns the key to evict, the least recently used one of the lowest access count. """
+        return next(iter(self.__buckets[self.__min_frequency]))
+
+    def clear(self) -> None:
+        """ Forgets every key. """
+        self.__frequencies.clear()
+        self.__buckets.clear()
+        self.__min_frequency = 0
+
+    def clone(self) -> LFUPolicy:
+        """ Clones the policy with its current state. """
+        clone = LFUPolicy(self.__max_entries)
+        clone.__frequencies = self.__frequencies.copy()
+        clone.__buckets = {frequency: bucket.copy() for frequency, bucket in self.__buckets.items()}
+        clone.__min_frequency = self.__min_frequency
+
+        return clone
+
+
+class FrequencySketch:
+    # Each counter saturates at 15, as in a 4 bits count-min sketch
+    MAX_COUNT = 15
+    DEPTH = 4
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x85EBCA77C2B2AE63)
+    # Maps each counter to its half, to age a whole row at once
+    HALVES = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initializes a count-min sketch estimating how often each key was accessed recently, in a fixed amount of memory.
+        Once ten accesses per entry are recorded, every counter is halved so that old popularity fades away.
+
+        Parameters :
+            - max_entries (int) : The maximum number of entries of the hash table, which sizes the sketch.
+        """
+        self.__width = 1 << max(4, (max_entries - 1).bit_length())
+        self.__counters = [bytearray(self.__width) for _ in range(FrequencySketch.DEPTH)]
+        self.__sample_size = 10 * max_entries
+        self.__additions = 0
+
+    def __indexes(self, key: Hashable) -> list:
+        """ Returns the counter index of a key in each row. """
+        key_hash = hash(key)
+        mask = self.__width - 1
+
+        return [(((key_hash ^ seed) * 0x9E3779B1) >> 16) & mask for seed in FrequencySketch.SEEDS]
+
+    def increment(self, key: Hashable) -> None:
+        """ Records an access to a key. """
+        for row, index in zip(self.__counters, self.__indexes(key)):
+            if row[index] < FrequencySketch.MAX_COUNT:
+                row[index] += 1
+
+        self.__additions += 1
+
+        if self.__additions >= self.__sample_size:
+            self.__additions //= 2
+
+            for row in self.__counters:
+                row[:] = row.translate(FrequencySketch.HALVES)
+
+    def estimate(self, key: Hashable) -> int:
+        """ Returns the estimated number of recent accesses to a key, never lower than the true number. """
+        return min(row[index] for row, index in zip(self.__counters, self.__indexes(key)))
+
+    def clone(self) -> FrequencySketch:
+        """ Clones the sketch with its current counters. """
+        clone = FrequencySketch(1)
+        clone.__width = self.__width
+        clone.__counters = [row.copy() for row in self.__counters]
+        clone.__sample_size = self.__sample_size
+        clone.__additions = self.__additions
+
+        return clone
+
+
+class TinyLFUPolicy:
+    # The share of the entries kept in the admission window
+    WINDOW_RATIO = 0.01
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initializes a Window TinyLFU eviction policy. New keys enter a small LRU window. When the window overflows,
+        its least recently used key is only admitted in the main LRU segment if the frequency sketch estimates it more
+        popular than the key the main segment would evict, the other one being evicted. Bursts of keys accessed once
+        thus never flush the popular ones, as a plain LRU policy would.
+
+        Parameters :
+            - max_entries (int) : The maximum number of entries of the hash table.
+
+        References :
+            - https://arxiv.org/abs/1512.00727
+        """
+        self.__max_entries = max_entries
+        self.__window_size = max(1, int(max_entries * TinyLFUPolicy.WINDOW_RATIO))
+        self.__window: OrderedDict[Hashable, None] = OrderedDict()
+        self.__main: OrderedDict[Hashable, None] = OrderedDict()
+        self.__sketch = FrequencySketch(max_entries)
+
+    def insert(self, key: Hashable) -> None:
+        """ Records a new key, entering the window. The window's least recently used key moves to the main segment if it overflows. """
+        self.__sketch.increment(key)
+        self.__window[key] = None
+
+        if len(self.__window) > self.__window_size:
+            self.__main[self.__window.popitem(last=False)[0]] = None
+
+    def access(self, key: Hashable) -> None:
+        """ Records an access to an existing key, making it the most recently used one of its segment. """
+        self.__sketch.increment(key)
+
+        if key in self.__window:
+            self.__window.move_to_end(key)
+        else:
+            self.__main.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        """ Forgets a removed key. """
+        if key in self.__window:
+            del self.__window[key]
+        else:
+            del self.__main[key]
+
+    def victim(self) -> Hashable:
+        """
+        Returns the key to evict. If the window is full, its least recently used key competes with the least recently
+        used key of the main segment, and the winner moves to or stays in the main segment.
+        """
+        if not self.__main:
+            return next(iter(self.__window))
+
+        victim = next(iter(self.__main))
+
+        if len(self.__window) < self.__window_size:
+            return victim
+
+        candidate = next(iter(self.__window))
+
+        if self.__sketch.estimate(candidate) <= self.__sketch.estimate(victim):
+            return candidate
+
+        del self.__window[candidate]
+        self.__main[candidate] = None
+
+        return victim
+
+    def clear(self) -> None:
+        """ Forgets every key, the frequency sketch being kept. """
+        self.__window.clear()
+        self.__main.clear()
+
+    def clone(self) -> TinyLFUPolicy:
+        """ Clones the policy with its current state. """
+        clone = TinyLFUPolicy(1)
+        clone.__max_entries = self.__max_entries
+        clone.__window_size = self.__window_size
+        clone.__window = self.__window.copy()
+        clone.__main = self.__main.copy()
+        clone.__sketch = self.__sketch.clone()
+
+        return clone
+
+
+EvictionPolicy = LRUPolicy | LFUPolicy | TinyLFUPolicy
+
+POLICIES: Dict[str, Callable[[int], EvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "tinylfu": TinyLFUPolicy,
+}
+
+
+def make_policy(name: str, max_entries: int) -> EvictionPolicy:
+    """
+    Builds an eviction policy for a hash table bounded to the given number of entries.
+
+    Parameters :
+        - name (str) : The name of the policy, one of POLICIES.
+        - max_entries (int) : The maximum number of entries of the hash table.
+
+    Returns :
+        The eviction policy.
+
+    Behavior - The name is unknown :
+        Preconditions :
+            The name is not a key of POLICIES.
+        Postconditions :
+            A value error is raised.
+    """
+    if name not in POLICIES:
+        raise ValueError(f"Policy is expected to be one of {', '.join(POLICIES)}.")
+
+    return POLICIES[name](max_entries)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Tuple
+from array import array
+import math
+import sys
+from hash_functions import make_hash
+
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_64 = 0x9E3779B97F4A7C15
+# Mix a scattered hash with the displacement of its bucket into its slot index
+DISPLACEMENT_MULTIPLIER = 0xC2B2AE3D27D4EB4F
+SLOT_MULTIPLIER = 0xFF51AFD7ED558CCD
+# The average number of keys per bucket : larger buckets need less displacements, but are slower to place
+KEYS_PER_BUCKET = 2.0
+# The displacements tried for a bucket before the build starts over with another salt
+MAX_DISPLACEMENT = 1 << 20
+MAX_SALTS = 16
+
+
+def _slot(scattered: int, displacement: int, size: int) -> int:
+    """ Returns the slot index of a scattered hash under the displacement of its bucket. """
+    return (((scattered ^ (displacement * DISPLACEMENT_MULTIPLIER)) * SLOT_MULTIPLIER & MASK_64) >> 32) % size
+
+
+def _displace(scattered: List[int], bucket_count: int) -> array | None:
+    """
+    Finds the displacement of each bucket so that every scattered hash gets a slot of its own, or None if a bucket
+    can't be placed. See FrozenHashTable for the layout.
+    """
+    size = len(scattered)
+    buckets: List[List[int]] = [[] for _ in range(bucket_count)]
+
+    for scattered_hash in scattered:
+        buckets[(scattered_hash >> 32) % bucket_count].append(scattered_hash)
+
+    displacements = array("q", bytes(8 * bucket_count))
+    taken = bytearray(size)
+    singles: List[int] = []
+
+    # The largest buckets are placed first, while most slots are still free
+    for bucket in sorted(range(bucket_count), key=lambda bucket: len(buckets[bucket]), reverse=True):
+        members = buckets[bucket]
+
+        if len(members) <= 1:
+            if members:
+                singles.append(bucket)
+
+            continue
+
+        for displacement in range(MAX_DISPLACEMENT):
+            # _slot inlined, a displacement being rejected at its first collision
+            mask = displacement * DISPLACEMENT_MULTIPLIER
+            slots: List[int] = []
+
+            for scattered_hash in members:
+                slot = ((((scattered_hash ^ mask) * SLOT_MULTIPLIER) & MASK_64) >> 32) % size
+
+                if taken[slot] or slot in slots:
+                    break
+
+                slots.append(slot)
+            else:
+                break
+        else:
+            return None
+
+        for slot in slots:
+            taken[slot] = 1
+
+        displacements[bucket] = displacement
+
+    # A bucket holding a single key takes any free slot, stored as a negative displacement
+    free_slots = (slot for slot in range(size) if not taken[slot])
+
+    for bucket, slot in zip(singles, free_slots):
+        displacements[bucket] = -slot - 1
+
+    return displacements
+
+
+class FrozenHashTable:
+    def __init__(self, hashed_entries: List[Tuple[int, Hashable, Any]], hash: Callable[[Hashable], int]) -> None:
+        """
+        Builds a read-only hash table over distinct keys whose hashes are already computed. See from_entries.
+
+        Parameters :
+            - hashed_entries (List[Tuple[int, Hashable, Any]]) : The hash, key and value of each entry, the keys being distinct.
+            - hash (Callable[[Hashable], int]) : The hash function that computed the hashes, used by the lookups.
+        """
+        self.__hash = hash
+        # The keys sharing their full hash with another key can't be told apart by any displacement, they are kept aside
+        self.__overflow: Dict[Hashable, Any] | None = None
+        first_entries: Dict[int, Tuple[Hashable, Any]] = {}
+
+        for key_hash, key, value in hashed_entries:
+            if key_hash in first_entries:
+                if self.__overflow is None:
+                    self.__overflow = {}
+
+                self.__overflow[key] = value
+            else:
+                first_entries[key_hash] = (key, value)
+
+        self.__size = len(first_entries)
+        self.__bucket_count = max(1, math.ceil(self.__size / KEYS_PER_BUCKET))
+        self.__keys: List[Hashable] = [None] * self.__size
+        self.__values: List[Any] = [None] * self.__size
+        self.__salt = 0
+        self.__displacements = array("q", bytes(8 * self.__bucket_count))
+
+        if self.__size == 0:
+            return
+
+        for salt in range(MAX_SALTS):
+            scattered = [((key_hash ^ salt) * GOLDEN_64) & MASK_64 for key_hash in first_entries]
+            displacements = _displace(scattered, self.__bucket_count)
+
+            if displacements is not None:
+                break
+        else:
+            raise RuntimeError("Perfect hash couldn't be built, the hash function is expected to spread the keys.")
+
+        self.__salt = salt
+        self.__displacements = displacements
+
+        for scattered_hash, (key, value) in zip(scattered, first_entries.values()):
+            slot = self.__find_slot(scattered_hash)
+            self.__keys[slot] = key
+            self.__values[slot] = value
+
+    @staticmethod
+    def from_entries(
+        entries: Iterable[Tuple[Hashable, Any]],
+        custom_hash: Callable[[Hashable], int] | None = None,
+        hash_function: str = "builtin",
+        seed: int = 0
+    ) -> FrozenHashTable:
+        """
+        Builds a read-only hash table from key-values, with a minimal perfect hash of its keys (hash and displace, CHD) :
+        every key has a slot of its own among exactly as many slots as keys, so that a lookup probes a single slot.
+        The keys are split into buckets of about two keys by their hash, and each bucket gets the displacement that
+        sends all of its keys to free slots, the largest buckets first. A bucket of a single key stores its slot directly.
+        The keys, values and displacements are stored in flat lists and an array, without any node or chain.
+        A lookup hashes the key, reads the displacement of its bucket, and compares the key in the slot it points to.
+
+        Parameters :
+            - entries (Iterable[Tuple[Hashable, Any]]) : The key-values, the last value of a key repeated winning.
+            - custom_hash (Callable[[Hashable], int] | None) : A custom hash to use instead of the built-in one (Optional).
+              Defaults to None.
+            - hash_function (str) : The name of the built-in hash function, see HashTable (Optional). Defaults to "builtin".
+            - seed (int) : The seed of the hash function (Optional). Defaults to 0.
+
+        Returns :
+            The frozen hash table.
+
+        Behavior - A key is None or unhashable :
+            Preconditions :
+                At least one key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+
+        Behavior - The parameters are invalid :
+            Preconditions :
+                The hash function is unknown.
+            Postconditions :
+                A value error is raised.
+        """
+        hash = custom_hash if custom_hash is not None else make_hash(hash_function, seed)
+        distinct: Dict[Hashable, Any] = {}
+
+        for key, value in entries:
+            if key is None: # type: ignore[reportOptionalMemberAccess]
+                raise TypeError("Key is expected to be hashable, None received.")
+
+            distinct[key] = value
+
+        return FrozenHashTable([(hash(key), key, value) for key, value in distinct.items()], hash)
+
+    def __find_slot(self, scattered_hash: int) -> int:
+        """ Returns the only slot a key of the given scattered hash may be stored in. """
+        displacement = self.__displacements[(scattered_hash >> 32) % self.__bucket_count]
+
+        if displacement < 0:
+            return -displacement - 1
+
+        return _slot(scattered_hash, displacement, self.__size)
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """
+        Retrieves the value with the given key, or a default value if the key doesn't exist, probing a single slot.
+        See HashTable.get.
+        """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__size > 0:
+            scattered_hash = ((self.__hash(key) ^ self.__salt) * GOLDEN_64) & MASK_64
+            displacement = self.__displacements[(scattered_hash >> 32) % self.__bucket_count]
+            slot = -displacement - 1 if displacement < 0 else _slot(scattered_hash, displacement, self.__size)
+
+            if self.__keys[slot] == key:
+                return self.__values[slot]
+
+        if self.__overflow is not None:
+            return self.__overflow.get(key, default)
+
+        return default
+
+    def contains(self, key: Hashable) -> bool:
+        """ Checks if a given key exists, probing a single slot. See HashTable.contains. """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__size > 0:
+            scattered_hash = ((self.__hash(key) ^ self.__salt) * GOLDEN_64) & MASK_64
+
+            if self.__keys[self.__find_slot(scattered_hash)] == key:
+                return True
+
+        return self.__overflow is not None and key in self.__overflow
+
+    def get_many(self, keys: Iterable[Hashable], default: Any | None = None) -> List[Any | None]:
+        """ Retrieves the values of a batch of keys. See HashTable.get_many. """
+        return [self.get(key, default) for key in keys]
+
+    def contains_many(self, keys: Iterable[Hashable]) -> List[bool]:
+        """ Checks if each key of a batch exists. See HashTable.contains_many. """
+        return [self.contains(key) for key in keys]
+
+    def size(self) -> int:
+        """ Returns the number of elements inside the hash table. """
+        return self.__size + (len(self.__overflow) if self.__overflow is not None else 0)
+
+    def __len__(self) -> int:
+        """ Returns the number of elements inside the hash table. """
+        return self.size()
+
+    def is_empty(self) -> bool:
+        """ Checks if the hash table is empty or not. """
+        return self.size() == 0
+
+    def get_capacity(self) -> int:
+        """ Returns the number of slots, which is the number of keys. """
+        return self.__size
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """ Lazily iterates over the key-value pairs of the hash table, in slot order. """
+        yield from zip(self.__keys, self.__values)
+
+        if self.__overflow is not None:
+            yield from self.__overflow.items()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """ Iterates over the keys of the hash table. """
+        return (key for key, _ in self.items())
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of the hash table as a list. """
+        return list(self)
+
+    def values(self) -> List[Any]:
+        """ Returns the values of the hash table as a list. """
+        return [value for _, value in self.items()]
+
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """ Returns the key-value pairs of the hash table as a list. """
+        return list(self.items())
+
+    def memory_usage(self, include_data: bool = False) -> Dict[str, float]:
+        """
+        Reports the memory used by the hash table. See HashTable.memory_usage.
+
+        Parameters :
+            - include_data (bool) : If the keys and values themselves should be counted (Optional). Defaults to False.
+
+        Returns :
+            A dictionary with the bytes used by the lists of keys and values ("slots"), the array of displacements
+            ("displacements"), the keys sharing their hash with another one ("overflow"), the keys and values ("data"),
+            their sum ("total") and the bytes per entry ("bytes_per_entry").
+        """
+        slots = sys.getsizeof(self.__keys) + sys.getsizeof(self.__values)
+        displacements = self.__displacements.itemsize * len(self.__displacements)
+        overflow = sys.getsizeof(self.__overflow) if self.__overflow is not None else 0
+        data = 0
+
+        if include_data:
+            for key, value in self.items():
+                data += sys.getsizeof(key) + sys.getsizeof(value)
+
+        total = slots + displacements + overflow + data
+        size = self.size()
+
+        return {
+            "slots": slots,
+            "displacements": displacements,
+            "overflow": overflow,
+            "data": data,
+            "total": total,
+            "bytes_per_entry": total / size if size > 0 else 0.0,
+        }
@@ -0,0 +1,242 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+import math
+import random
+import time
+from hash_functions import HASH_FUNCTIONS, make_hash
+
+
+# The load factor the recommended capacity is sized for
+TARGET_LOAD_FACTOR = 0.75
+# The hash functions whose distribution is within this share of the best one are considered as good, the fastest wins
+DISTRIBUTION_TOLERANCE = 0.10
+# An ideal hash changes half of its output bits when a single input bit changes
+IDEAL_AVALANCHE = 0.5
+AVALANCHE_TOLERANCE = 0.05
+AVALANCHE_KEYS = 200
+AVALANCHE_BITS = 16
+
+
+def is_prime(number: int) -> bool:
+    """ Checks if a number is prime, by trial division. """
+    if number < 2:
+        return False
+
+    if number % 2 == 0:
+        return number == 2
+
+    for divisor in range(3, math.isqrt(number) + 1, 2):
+        if number % divisor == 0:
+            return False
+
+    return True
+
+
+def recommended_capacity(count: int, load_factor: float = TARGET_LOAD_FACTOR) -> int:
+    """
+    Returns the capacity recommended for the given number of keys : the smallest prime keeping the load factor under
+    the given one. Reducing a hash modulo a prime uses all of its bits, so hashes sharing low bits still spread.
+    """
+    capacity = max(2, math.ceil(count / load_factor))
+
+    while not is_prime(capacity):
+        capacity += 1
+
+    return capacity
+
+
+def _flipped(key: Hashable, bit: int) -> Hashable | None:
+    """ Returns the key with one of its bits flipped, or None for a key whose bits can't be flipped. """
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+
+    if isinstance(key, bytes):
+        if not key:
+            return None
+
+        data = bytearray(key)
+        bit %= len(data) * 8
+        data[bit // 8] ^= 1 << (bit % 8)
+
+        return bytes(data)
+
+    if isinstance(key, int):
+        return key ^ (1 << (bit % 64))
+
+    return None
+
+
+def avalanche(hash: Callable[[Hashable], int], keys: List[Hashable], rng: random.Random) -> float | None:
+    """
+    Measures the avalanche behavior of a hash : the average share of the 64 output bits that change when a single bit
+    of a key changes. A string key is flipped through its UTF-8 bytes, which the built-in hash functions hash alike.
+
+    Parameters :
+        - hash (Callable[[Hashable], int]) : The hash function.
+        - keys (List[Hashable]) : The keys whose bits to flip, a sample of them being used.
+        - rng (random.Random) : The source of the sampled keys and bits.
+
+    Returns :
+        The average share of output bits changed, ideally 0.5, or None if no key has bits to flip.
+    """
+    sample = rng.sample(keys, min(len(keys), AVALANCHE_KEYS))
+    changed = 0
+    trials = 0
+
+    for key in sample:
+        reference = _flipped(key, 0)
+
+        if reference is None:
+            continue
+
+        # The reference is the key with its first bit flipped twice, so that both hashes see the same key type
+        reference = _flipped(reference, 0)
+        reference_hash = hash(reference) & 0xFFFFFFFFFFFFFFFF
+
+        for _ in range(AVALANCHE_BITS):
+            flipped = _flipped(reference, rng.getrandbits(32))
+            changed += bin((hash(flipped) & 0xFFFFFFFFFFFFFFFF) ^ reference_hash).count("1")
+            trials += 1
+
+    return changed / (trials * 64) if trials > 0 else None
+
+
+def analyze_hash(hash: Callable[[Hashable], int], keys: List[Hashable], capacity: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Measures the quality of a hash function on a sample of keys, for a table of the given capacity.
+
+    Parameters :
+        - hash (Callable[[Hashable], int]) : The hash function, reduced modulo the capacity as HashTable does.
+        - keys (List[Hashable]) : The sample of distinct keys.
+        - capacity (int) : The number of slots.
+        - rng (random.Random) : The source of randomness of the avalanche test.
+
+    Returns :
+        A dictionary with :
+            - "chi_squared" : The chi-squared statistic of the slot counts against a uniform distribution.
+            - "chi_squared_ratio" : The chi-squared over its degrees of freedom, close to 1 for a uniformly random hash,
+              larger for a hash that clusters the keys.
+            - "longest_chain" : The number of keys of the fullest slot.
+            - "empty_slots" : The share of slots without any key.
+            - "avalanche" : See avalanche, None if the keys have no bits to flip.
+            - "keys_per_second" : The hashing throughput.
+    """
+    start = time.perf_counter()
+    hashes = [hash(key) for key in keys]
+    seconds = time.perf_counter() - start
+
+    counts = [0] * capacity
+
+    for key_hash in hashes:
+        counts[key_hash % capacity] += 1
+
+    expected = len(keys) / capacity
+    chi_squared = sum((count - expected) ** 2 for count in counts) / expected if expected > 0 else 0.0
+
+    return {
+        "chi_squared": chi_squared,
+        "chi_squared_ratio": chi_squared / max(1, capacity - 1),
+        "longest_chain": max(counts),
+        "empty_slots": counts.count(0) / capacity,
+        "avalanche": avalanche(hash, keys, rng),
+        "keys_per_second": len(keys) / seconds if seconds > 0 else math.inf,
+    }
+
+
+def analyze(
+    keys: List[Hashable],
+    capacity: int | None = None,
+    candidates: Dict[str, Callable[[Hashable], int]] | None = None,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Measures every candidate hash function on a sample of real keys, and ranks them.
+    Among the hash functions spreading the keys about as well as the best one (chi-squared ratio within 10 %) and
+    with a sound avalanche (within 0.45 and 0.55), the fastest is recommended. The others follow by chi-squared ratio.
+
+    Parameters :
+        - keys (List[Hashable]) : A sample of the keys the table will hold, duplicates being ignored.
+        - capacity (int | None) : The capacity to analyze (Optional). Defaults to None, the recommended capacity of the sample.
+        - candidates (Dict[str, Callable[[Hashable], int]] | None) : The hash functions to compare, by name (Optional).
+          Defaults to None, every built-in hash function under the given seed.
+        - seed (int) : The seed of the built-in hash functions and of the random tests (Optional). Defaults to 0.
+
+    Returns :
+        The report of each candidate (see analyze_hash), with its "name", "capacity" and whether it is "recommended",
+        the recommended one first.
+
+    Behavior - The sample is empty :
+        Preconditions :
+            The sample holds no key.
+        Postconditions :
+            A value error is raised.
+    """
+    keys = list(dict.fromkeys(keys))
+
+    if not keys:
+        raise ValueError("Sample is expected to hold at least one key.")
+
+    if capacity is None:
+        capacity = recommended_capacity(len(keys))
+
+    if candidates is None:
+        candidates = {name: make_hash(name, seed) for name in HASH_FUNCTIONS}
+
+    reports: List[Dict[str, Any]] = []
+
+    for name, hash in candidates.items():
+        report = analyze_hash(hash, keys, capacity, random.Random(seed))
+        report["name"] = name
+        report["capacity"] = capacity
+        report["recommended"] = False
+        reports.append(report)
+
+    best_ratio = min(report["chi_squared_ratio"] for report in reports)
+
+    def is_sound(report: Dict[str, Any]) -> bool:
+        return (
+            report["chi_squared_ratio"] <= max(best_ratio * (1 + DISTRIBUTION_TOLERANCE), 1 + DISTRIBUTION_TOLERANCE)
+            and (report["avalanche"] is None or abs(report["avalanche"] - IDEAL_AVALANCHE) <= AVALANCHE_TOLERANCE)
+        )
+
+    sound = [report for report in reports if is_sound(report)]
+    best = max(sound, key=lambda report: report["keys_per_second"]) if sound else min(reports, key=lambda report: report["chi_squared_ratio"])
+    best["recommended"] = True
+    reports.sort(key=lambda report: (not report["recommended"], report["chi_squared_ratio"]))
+
+    return reports
+
+
+def recommend(keys: List[Hashable], expected_size: int | None = None, seed: int = 0) -> Tuple[str, int]:
+    """
+    Recommends a built-in hash function and a capacity for a table holding keys like the sample. See analyze.
+
+    Parameters :
+        - keys (List[Hashable]) : A sample of the keys the table will hold.
+        - expected_size (int | None) : The number of keys the table will hold (Optional). Defaults to None, the sample size.
+        - seed (int) : The seed the table will use (Optional). Defaults to 0.
+
+    Returns :
+        A tuple with the name of the hash function and the capacity.
+    """
+    distinct = len(dict.fromkeys(keys))
+    capacity = recommended_capacity(max(expected_size or distinct, 1))
+    # The distribution is measured at the load factor the capacity is sized for, whatever the sample size
+    sample_capacity = recommended_capacity(distinct) if expected_size is not None else capacity
+    best = analyze(keys, sample_capacity, seed=seed)[0]
+
+    return best["name"], capacity
+
+
+def format_report(reports: List[Dict[str, Any]]) -> str:
+    """ Formats the reports of analyze as a table, the recommended hash function being marked with a star. """
+    lines = [f"  {'hash':<12} {'chi2 ratio':>10} {'longest':>8} {'empty':>7} {'avalanche':>10} {'keys/s':>12}"]
+
+    for report in reports:
+        avalanche_text = "-" if report["avalanche"] is None else f"{report['avalanche']:.3f}"
+        lines.append(
+            f"{'*' if report['recommended'] else ' '} {report['name']:<12} {report['chi_squared_ratio']:>10.3f} "
+            f"{report['longest_chain']:>8} {report['empty_slots']:>7.1%} {avalanche_text:>10} {report['keys_per_second']:>12,.0f}"
+        )
+
+    return "\n".join(lines)
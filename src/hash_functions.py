@@ -0,0 +1,377 @@
+from __future__ import annotations
+from typing import Callable, Dict, Hashable, List, Tuple
+
+try:
+    import xxhash # type: ignore[import-not-found]
+except ImportError: # The pure Python implementation below is used instead
+    xxhash = None
+
+try:
+    import numpy # type: ignore[import-not-found]
+except ImportError: # The batches are hashed one key at a time instead
+    numpy = None
+
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+FNV_OFFSET_BASIS_64 = 0xCBF29CE484222325
+FNV_PRIME_64 = 0x100000001B3
+
+XXH_PRIME64_1 = 0x9E3779B185EBCA87
+XXH_PRIME64_2 = 0xC2B2AE3D27D4EB4F
+XXH_PRIME64_3 = 0x165667B19E3779F9
+XXH_PRIME64_4 = 0x85EBCA77C2B2AE63
+XXH_PRIME64_5 = 0x27D4EB2F165667C5
+
+# Under this number of keys, the NumPy calls of a vectorized batch cost more than hashing the keys one at a time
+MIN_VECTORIZED_BATCH = 64
+
+
+def _mix_int(value: Hashable, seed: int) -> int:
+    """
+    Hashes a key that isn't a string nor bytes by mixing its interpreter's hash with the 64 bits finalizer of MurmurHash3.
+    The interpreter's hash of an integer is the integer itself modulo 2 ** 61 - 1, so integer keys never go through
+    any string hashing, and hash the same in every process.
+    """
+    mixed = (hash(value) ^ seed) & MASK_64
+    mixed = ((mixed ^ (mixed >> 33)) * 0xFF51AFD7ED558CCD) & MASK_64
+    mixed = ((mixed ^ (mixed >> 33)) * 0xC4CEB9FE1A85EC53) & MASK_64
+
+    return mixed ^ (mixed >> 33)
+
+
+def _key_bytes(key: Hashable) -> bytes | None:
+    """ Returns the bytes hashed for a string or bytes key, or None for any other key, which is hashed by _mix_int. """
+    if isinstance(key, str):
+        return key.encode("utf-8")
+
+    if isinstance(key, bytes):
+        return key
+
+    return None
+
+
+def builtin_hash(key: Hashable, seed: int = 0) -> int:
+    """
+    Hashes a key with the interpreter's hash, which a string computes once and caches inside itself.
+    The interpreter already randomizes the hash of strings and bytes per process (SipHash), the seed additionally
+    scatters it per hash table. A seeded hash goes through the finalizer of _mix_int : the interpreter's hash of an
+    integer is the integer itself, so that integers sharing their low bits would otherwise share their slot index.
+
+    Parameters :
+        - key (Hashable) : The key to hash.
+        - seed (int) : The seed mixed into the hash (Optional). Defaults to 0.
+
+    Returns :
+        The hashed value of the key.
+    """
+    if seed == 0:
+        return hash(key)
+
+    return _mix_int(key, seed)
+
+
+def polynomial_hash(key: Hashable, seed: int = 0) -> int:
+    """
+    Hashes a key with the historical polynomial hash of the hash table (hash * 31 + byte), truncated to 64 bits.
+    Strings are hashed through their UTF-8 bytes, the other keys than bytes through _mix_int.
+
+    Parameters :
+        - key (Hashable) : The key to hash.
+        - seed (int) : The seed added to the initial value (Optional). Defaults to 0.
+
+    Returns :
+        The hashed value of the key.
+
+    References :
+        - https://stackoverflow.com/a/2624210/20892950
+    """
+    data = _key_bytes(key)
+
+    if data is None:
+        return _mix_int(key, seed)
+
+    hash = (7 + seed) & MASK_64
+
+    for byte in data:
+        hash = (hash * 31 + byte) & MASK_64
+
+    return hash
+
+
+def fnv1a_hash(key: Hashable, seed: int = 0) -> int:
+    """
+    Hashes a key with the 64 bits FNV-1a hash of its UTF-8 bytes, or of the key itself for bytes.
+    The other keys are hashed through _mix_int.
+
+    Parameters :
+        - key (Hashable) : The key to hash.
+        - seed (int) : The seed xored into the offset basis (Optional). Defaults to 0.
+
+    Returns :
+        The hashed value of the key.
+
+    References :
+        - http://www.isthe.com/chongo/tech/comp/fnv/index.html
+    """
+    data = _key_bytes(key)
+
+    if data is None:
+        return _mix_int(key, seed)
+
+    hash = FNV_OFFSET_BASIS_64 ^ (seed & MASK_64)
+
+    for byte in data:
+        hash = ((hash ^ byte) * FNV_PRIME_64) & MASK_64
+
+    return hash
+
+
+def _rotate_left(value: int, bits: int) -> int:
+    """ Rotates a 64 bits integer to the left. """
+    return ((value << bits) | (value >> (64 - bits))) & MASK_64
+
+
+def _xxh64_round(accumulator: int, lane: int) -> int:
+    """ Mixes an eight bytes lane into an accumulator of the XXH64 hash. """
+    accumulator = (accumulator + lane * XXH_PRIME64_2) & MASK_64
+    accumulator = _rotate_left(accumulator, 31)
+
+    return (accumulator * XXH_PRIME64_1) & MASK_64
+
+
+def _xxh64_merge_round(accumulator: int, value: int) -> int:
+    """ Merges an accumulator of the XXH64 hash into the final value. """
+    accumulator ^= _xxh64_round(0, value)
+
+    return (accumulator * XXH_PRIME64_1 + XXH_PRIME64_4) & MASK_64
+
+
+def _xxh64(data: bytes, seed: int) -> int:
+    """ Pure Python implementation of the XXH64 hash. """
+    length = len(data)
+    index = 0
+
+    if length >= 32:
+        v1 = (seed + XXH_PRIME64_1 + XXH_PRIME64_2) & MASK_64
+        v2 = (seed + XXH_PRIME64_2) & MASK_64
+        v3 = seed
+        v4 = (seed - XXH_PRIME64_1) & MASK_64
+
+        while index + 32 <= length:
+            v1 = _xxh64_round(v1, int.from_bytes(data[index:index + 8], "little"))
+            v2 = _xxh64_round(v2, int.from_bytes(data[index + 8:index + 16], "little"))
+            v3 = _xxh64_round(v3, int.from_bytes(data[index + 16:index + 24], "little"))
+            v4 = _xxh64_round(v4, int.from_bytes(data[index + 24:index + 32], "little"))
+            index += 32
+
+        hash = (_rotate_left(v1, 1) + _rotate_left(v2, 7) + _rotate_left(v3, 12) + _rotate_left(v4, 18)) & MASK_64
+        hash = _xxh64_merge_round(hash, v1)
+        hash = _xxh64_merge_round(hash, v2)
+        hash = _xxh64_merge_round(hash, v3)
+        hash = _xxh64_merge_round(hash, v4)
+    else:
+        hash = (seed + XXH_PRIME64_5) & MASK_64
+
+    hash = (hash + length) & MASK_64
+
+    while index + 8 <= length:
+        hash ^= _xxh64_round(0, int.from_bytes(data[index:index + 8], "little"))
+        hash = (_rotate_left(hash, 27) * XXH_PRIME64_1 + XXH_PRIME64_4) & MASK_64
+        index += 8
+
+    if index + 4 <= length:
+        hash ^= (int.from_bytes(data[index:index + 4], "little") * XXH_PRIME64_1) & MASK_64
+        hash = (_rotate_left(hash, 23) * XXH_PRIME64_2 + XXH_PRIME64_3) & MASK_64
+        index += 4
+
+    while index < length:
+        hash ^= (data[index] * XXH_PRIME64_5) & MASK_64
+        hash = (_rotate_left(hash, 11) * XXH_PRIME64_1) & MASK_64
+        index += 1
+
+    hash ^= hash >> 33
+    hash = (hash * XXH_PRIME64_2) & MASK_64
+    hash ^= hash >> 29
+    hash = (hash * XXH_PRIME64_3) & MASK_64
+    hash ^= hash >> 32
+
+    return hash
+
+
+def xxh64_hash(key: Hashable, seed: int = 0) -> int:
+    """
+    Hashes a key with the 64 bits xxHash (XXH64) of its UTF-8 bytes, or of the key itself for bytes.
+    The other keys are hashed through _mix_int.
+    The xxhash package is used when it is installed, a pure Python implementation otherwise.
+
+    Parameters :
+        - key (Hashable) : The key to hash.
+        - seed (int) : The seed of the hash (Optional). Defaults to 0.
+
+    Returns :
+        The hashed value of the key.
+
+    References :
+        - https://github.com/Cyan4973/xxHash/blob/dev/doc/xxhash_spec.md
+    """
+    data = _key_bytes(key)
+
+    if data is None:
+        return _mix_int(key, seed)
+
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data, seed & MASK_64)
+
+    return _xxh64(data, seed & MASK_64)
+
+
+HASH_FUNCTIONS: Dict[str, Callable[[Hashable, int], int]] = {
+    "builtin": builtin_hash,
+    "polynomial": polynomial_hash,
+    "fnv1a": fnv1a_hash,
+    "xxhash": xxh64_hash,
+}
+
+
+def make_hash(name: str, seed: int = 0) -> Callable[[Hashable], int]:
+    """
+    Builds a hash function of one argument from a built-in hash function and a seed.
+
+    Parameters :
+        - name (str) : The name of the built-in hash function, one of HASH_FUNCTIONS.
+        - seed (int) : The seed of the hash function (Optional). Defaults to 0.
+
+    Returns :
+        The hash function, taking a key and returning its hashed value.
+
+    Behavior - The name is unknown :
+        Preconditions :
+            The name is not a key of HASH_FUNCTIONS.
+        Postconditions :
+            A value error is raised.
+    """
+    if name not in HASH_FUNCTIONS:
+        raise ValueError(f"Hash function is expected to be one of {', '.join(HASH_FUNCTIONS)}.")
+
+    if name == "builtin":
+        if seed == 0:
+            return hash
+
+        # _mix_int inlined, to keep a single Python call per hash on the default path
+        def seeded_builtin_hash(key: Hashable) -> int:
+            mixed = (hash(key) ^ seed) & MASK_64
+            mixed = ((mixed ^ (mixed >> 33)) * 0xFF51AFD7ED558CCD) & MASK_64
+            mixed = ((mixed ^ (mixed >> 33)) * 0xC4CEB9FE1A85EC53) & MASK_64
+
+            return mixed ^ (mixed >> 33)
+
+        return seeded_builtin_hash
+
+    function = HASH_FUNCTIONS[name]
+
+    return lambda key: function(key, seed)
+
+
+# The hash functions computed by make_batch_hash with array operations, the others have no vectorized form
+VECTORIZED_HASH_FUNCTIONS = ("polynomial", "fnv1a")
+
+BatchHash = Callable[[List[Hashable], int | None], Tuple[List[int], List[int] | None]]
+
+
+def is_vectorized(name: str) -> bool:
+    """ Checks if make_batch_hash hashes the batches of the given hash function with NumPy array operations. """
+    return numpy is not None and name in VECTORIZED_HASH_FUNCTIONS
+
+
+def _vectorized_hashes(name: str, data: List[bytes], seed: int) -> numpy.ndarray:
+    """
+    Hashes a batch of byte strings with NumPy, the same way as polynomial_hash or fnv1a_hash.
+    The byte strings are concatenated into a single buffer indexed by their offsets, and sorted by decreasing length :
+    the i-th byte of every key is then mixed in at once, the keys longer than i being the first ones of the sorted order.
+    The 64 bits arithmetic wraps around like the masks of the scalar hashes.
+    """
+    count = len(data)
+    lengths = numpy.fromiter(map(len, data), dtype=numpy.int64, count=count)
+    offsets = numpy.zeros(count, dtype=numpy.int64)
+    numpy.cumsum(lengths[:-1], out=offsets[1:])
+    buffer = numpy.frombuffer(b"".join(data), dtype=numpy.uint8).astype(numpy.uint64)
+
+    order = numpy.argsort(-lengths, kind="stable")
+    lengths = lengths[order]
+    offsets = offsets[order]
+    max_length = int(lengths[0]) if count > 0 else 0
+    # The number of keys longer than i, for each byte index i
+    active = numpy.searchsorted(-lengths, -numpy.arange(max_length), side="left")
+
+    if name == "polynomial":
+        hashes = numpy.full(count, (7 + seed) & MASK_64, dtype=numpy.uint64)
+        multiplier = numpy.uint64(31)
+
+        for index in range(max_length):
+            keys = int(active[index])
+            hashes[:keys] = hashes[:keys] * multiplier + buffer[offsets[:keys] + index]
+    else:
+        hashes = numpy.full(count, FNV_OFFSET_BASIS_64 ^ (seed & MASK_64), dtype=numpy.uint64)
+        multiplier = numpy.uint64(FNV_PRIME_64)
+
+        for index in range(max_length):
+            keys = int(active[index])
+            hashes[:keys] = (hashes[:keys] ^ buffer[offsets[:keys] + index]) * multiplier
+
+    result = numpy.empty(count, dtype=numpy.uint64)
+    result[order] = hashes
+
+    return result
+
+
+def make_batch_hash(name: str, seed: int = 0) -> BatchHash:
+    """
+    Builds a function hashing a batch of keys at once with a built-in hash function and a seed, also reducing the hashes
+    to slot indices. With NumPy installed, the polynomial and FNV-1a hashes of the string and bytes keys are computed
+    with array operations, see is_vectorized. Otherwise, or for the other keys, each key is hashed on its own.
+    Either way, every hash is the one make_hash gives.
+
+    Parameters :
+        - name (str) : The name of the built-in hash function, one of HASH_FUNCTIONS.
+        - seed (int) : The seed of the hash function (Optional). Defaults to 0.
+
+    Returns :
+        The batch hash function, taking a list of keys and a capacity (or None), and returning a tuple with the hash
+        of each key and, if a capacity was given, the slot index of each key (its hash modulo the capacity).
+
+    Behavior - The name is unknown :
+        Preconditions :
+            The name is not a key of HASH_FUNCTIONS.
+        Postconditions :
+            A value error is raised.
+    """
+    hash = make_hash(name, seed)
+
+    def scalar_batch_hash(keys: List[Hashable], capacity: int | None) -> Tuple[List[int], List[int] | None]:
+        hashes = [hash(key) for key in keys]
+
+        return hashes, [key_hash % capacity for key_hash in hashes] if capacity is not None else None
+
+    if not is_vectorized(name):
+        return scalar_batch_hash
+
+    def vectorized_batch_hash(keys: List[Hashable], capacity: int | None) -> Tuple[List[int], List[int] | None]:
+        if len(keys) < MIN_VECTORIZED_BATCH:
+            return scalar_batch_hash(keys, capacity)
+
+        data = [_key_bytes(key) for key in keys]
+        others = [index for index, key_data in enumerate(data) if key_data is None]
+
+        if not others:
+            hashes = _vectorized_hashes(name, data, seed) # type: ignore[arg-type]
+        else:
+            hashes = numpy.empty(len(keys), dtype=numpy.uint64)
+            vectorized = numpy.ones(len(keys), dtype=bool)
+            vectorized[others] = False
+            hashes[vectorized] = _vectorized_hashes(name, [key_data for key_data in data if key_data is not None], seed)
+            hashes[others] = [hash(keys[index]) for index in others]
+
+        return hashes.tolist(), (hashes % numpy.uint64(capacity)).tolist() if capacity is not None else None
+
+    return vectorized_batch_hash
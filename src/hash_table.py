@@ -1,34 +1,163 @@
 from __future__ import annotations
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Set, Tuple
+import functools
+import random
+import sys
+import time
 from linked_list import LinkedList
+from node import Node
+from hash_table_view import HashTableView
+from open_addressing import OpenAddressing
+from hash_functions import MIN_VECTORIZED_BATCH, BatchHash, is_vectorized, make_batch_hash, make_hash
+from hash_analysis import recommend
+from eviction import EvictionPolicy, make_policy
+from timing_wheel import TimingWheel
+from stats import GET, PUT, REMOVE, TableStats
+from bloom_filter import BloomFilter
+from frozen_hash_table import FrozenHashTable
+from sorted_index import SortedIndex
+from snapshot import FALLBACK_HASH, MappedHashTable, is_portable, read_header, records_offset, read_records, write_snapshot
+
+
+# Marks a missing entry, as None is a valid value
+_MISSING = object()
+
+# What HashTable.__iterate yields for each entry
+_KEYS = 0
+_VALUES = 1
+_ITEMS = 2
+
+# Shared by every empty slot, so that only the non-empty slots cost a linked list. It is never mutated
+_EMPTY_SLOT = LinkedList()
 
 
 class HashTable:
-    def __init__(self, capacity: int = 12, custom_hash: Callable[[str], int] | None = None):
+    def __init__(
+        self,
+        capacity: int = 12,
+        custom_hash: Callable[[Hashable], int] | None = None,
+        min_load_factor: float = 0.1,
+        max_load_factor: float = 1.0,
+        rehash_step: int = 1,
+        storage: str = "chained",
+        hash_function: str = "builtin",
+        seed: int | None = None,
+        max_entries: int | None = None,
+        policy: str = "lru",
+        on_evict: Callable[[Hashable, Any], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        ttl_resolution: float = 1.0
+    ):
         """
         Initialized a new empty hash table.
 
         Parameters :
-            - capacity (int) : The size of the slots list (Optional). Default to 12.
+            - capacity (int) : The initial size of the slots list (Optional). Default to 12.
             - custom_hash (HashFunction | None) : A custom hash to use instead of the default one (Optional). Defaults to None.
+              Its result is reduced modulo the capacity, so it may return any integer. It takes precedence over hash_function.
+            - min_load_factor (float) : The load factor under which the hash table shrinks (Optional). Defaults to 0.1.
+            - max_load_factor (float) : The load factor above which the hash table grows (Optional). Defaults to 1.0.
+            - rehash_step (int) : The number of non-empty slots moved per operation while resizing (Optional). Defaults to 1.
+            - storage (str) : The storage backend, "chained" for linked list slots or "open" for Robin Hood open addressing (Optional).
+              Defaults to "chained". The open storage caps the max load factor to 0.9 and resizes in one step.
+            - hash_function (str) : The name of the built-in hash function, "builtin", "polynomial", "fnv1a" or "xxhash" (Optional).
+              Defaults to "builtin", the interpreter's cached string hash.
+            - seed (int | None) : The seed of the hash function (Optional). Defaults to None, a random seed per hash table.
+            - max_entries (int | None) : The maximum number of entries, turning the hash table into a bounded cache (Optional).
+              Defaults to None, unbounded. Inserting a new key into a full hash table first evicts an entry chosen by the policy.
+            - policy (str) : The eviction policy of a bounded hash table, "lru", "lfu" or "tinylfu" (Optional). Defaults to "lru".
+              See the eviction module. Only get and the operations modifying a key count as accesses, contains doesn't.
+            - on_evict (Callable[[Hashable, Any], None] | None) : A function called with the key and value of each evicted entry (Optional).
+              Defaults to None. It is called in the middle of an insertion, so it must not modify the hash table.
+            - clock (Callable[[], float]) : The clock giving the current time in seconds, for the times to live (Optional).
+              Defaults to time.monotonic.
+            - ttl_resolution (float) : The tick duration in seconds of the timing wheel scheduling the expirations (Optional).
+              Defaults to 1.0. See sweep.
+
+        Behavior - The parameters are invalid :
+            Preconditions :
+                The capacity, the rehash step or the maximum number of entries is lower than 1,
+                the load factors are not 0 <= min < max, or the storage, the hash function or the policy is unknown.
+            Postconditions :
+                A value error is raised.
         """
+        if capacity < 1:
+            raise ValueError("Capacity is expected to be at least 1.")
+
+        if not 0 <= min_load_factor < max_load_factor:
+            raise ValueError("Load factors are expected to satisfy 0 <= min_load_factor < max_load_factor.")
+
+        if rehash_step < 1:
+            raise ValueError("Rehash step is expected to be at least 1.")
+
+        if storage not in ("chained", "open"):
+            raise ValueError("Storage is expected to be either \"chained\" or \"open\".")
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Max entries are expected to be at least 1.")
+
         self.__capacity = capacity
-        self.__slots: List[LinkedList] = [LinkedList() for _ in range(self.__capacity)]
-        self.__hash: Callable[[str], int] = custom_hash if custom_hash is not None else self.__default_hash
+        self.__initial_capacity = capacity
+        self.__min_load_factor = min_load_factor
+        self.__max_load_factor = max_load_factor
+        self.__rehash_step = rehash_step
+        self.__size = 0
+        self.__version = 0 # Incremented on each structural change, to detect changes during an iteration
+        self.__non_empty_slots = 0
+        self.__longest_chain = 0
+        self.__chain_lengths: List[int] = [0] # Number of slots per chain length, the empty slots aren't counted
+        self.__storage = storage
+        self.__open: OpenAddressing | None = None
 
-    def contains(self, key: str) -> bool:
+        if storage == "open":
+            self.__open = OpenAddressing(capacity, min_load_factor, max_load_factor)
+
+        self.__slots: List[LinkedList] = [_EMPTY_SLOT] * self.__capacity if self.__open is None else []
+        self.__old_slots: List[LinkedList] | None = None
+        self.__rehash_index = 0
+        self.__shared: bytearray | None = None # Flags the slots shared with a copy-on-write clone
+        self.__custom_hash = custom_hash
+        self.__hash_function = hash_function
+        self.__seed = seed if seed is not None else random.getrandbits(64)
+        self.__hash: Callable[[Hashable], int] = custom_hash if custom_hash is not None else make_hash(hash_function, self.__seed)
+        # Hashes the batches with NumPy when the hash function has a vectorized form, see hash_functions.make_batch_hash
+        self.__batch_hash: BatchHash | None = None
+
+        if custom_hash is None and is_vectorized(hash_function):
+            self.__batch_hash = make_batch_hash(hash_function, self.__seed)
+        self.__max_entries = max_entries
+        self.__policy_name = policy
+        self.__policy: EvictionPolicy | None = make_policy(policy, max_entries) if max_entries is not None else None
+        self.__on_evict = on_evict
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__clock = clock
+        self.__ttl_resolution = ttl_resolution
+        # Created by the first put with a time to live, so that the other hash tables only pay a None check
+        self.__deadlines: Dict[Hashable, float] | None = None
+        self.__timers: TimingWheel | None = None
+        # Created by enable_stats, so that the hash tables without stats only pay a None check
+        self.__stats: TableStats | None = None
+        # Created by enable_bloom_filter, likewise
+        self.__bloom: BloomFilter | None = None
+        self.__bloom_rejections = 0
+        # Created by enable_sorted_index, likewise
+        self.__index: SortedIndex | None = None
+
+    def contains(self, key: Hashable) -> bool:
         """
         Checks if a given key exists in the hash table.
         
         Parameters :
-            - key (str) : The key to check.
+            - key (Hashable) : The key to check.
         
         Returns :
             True if the key exists in the hash table, False otherwise.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None or unhashable :
             Preconditions :
-                The key is not of type string.
+                The key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
 
@@ -45,27 +174,36 @@ class HashTable:
                 True is returned.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
-        
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
-        
-        return self.__get_slot(key).contains(key)
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__deadlines is not None:
+            self.__expire(key)
+
+        hash = self.__hash(key)
+
+        if self.__bloom is not None and not self.__bloom.might_contain(hash):
+            self.__bloom_rejections += 1
+            return False
 
-    def get(self, key: str, default: Any | None = None) -> Any | None:
+        if self.__open is not None:
+            return self.__open.find(key, hash) != -1
+
+        return self.__get_slot(hash).contains(key, hash)
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
         """
         Retrieves the value with the given key, or a default value if the key doesn't exist.
         
         Parameters :
-            - key (str) : The key of the value to retrieve.
+            - key (Hashable) : The key of the value to retrieve.
             - default (Any | None) : A default value to return if the key doesn't exist (Optional). Defaults to None.
         
         Returns :
             If the key exists, the value of the key is returned. Else, the default value is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None or unhashable :
             Preconditions :
-                The key is not of type string.
+                The key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
 
@@ -82,43 +220,89 @@ class HashTable:
                 The value of given key is returned from the hash table.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
-        
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
-        
-        return self.__get_slot(key).get(key, default)
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__stats is not None and self.__stats.sample(GET):
+            return self.__sampled(GET, key, lambda: self.get(key, default))
+
+        if self.__deadlines is not None:
+            self.__expire(key)
+
+        hash = self.__hash(key)
+
+        if self.__bloom is not None and not self.__bloom.might_contain(hash):
+            self.__bloom_rejections += 1
+
+            if self.__policy is not None:
+                self.__misses += 1
+
+            return default
+
+        if self.__policy is not None:
+            return self.__cache_get(key, hash, default)
+
+        if self.__open is not None:
+            return self.__open.get(key, hash, default)
 
-    def put(self, key: str, value: Any | None, override: bool = True) -> Any | None:
+        return self.__get_slot(hash).get(key, default, hash)
+
+    def __cache_get(self, key: Hashable, hash: int, default: Any | None) -> Any | None:
+        """ Retrieves the value of a key in a bounded hash table, counting the hit or miss and recording the access. """
+        if self.__open is not None:
+            value = self.__open.get(key, hash, _MISSING)
+        else:
+            value = self.__get_slot(hash).get(key, _MISSING, hash)
+
+        if value is _MISSING:
+            self.__misses += 1
+            return default
+
+        self.__hits += 1
+        self.__policy.access(key) # type: ignore[union-attr]
+
+        return value
+
+    def put(self, key: Hashable, value: Any | None, override: bool = True, ttl: float | None = None) -> Any | None:
         """
          Adds a new value with the given key in the hash table.
         
         Parameters :
-            - key (str) : The key of the value to add.
+            - key (Hashable) : The key of the value to add.
             - value (Any | None) : The value to add in the linked list.
             - override (bool) : If the value should be overriden if the key already exists.
+            - ttl (float | None) : The time to live of the value in seconds, after which the key expires (Optional).
+              Defaults to None, never expiring. Writing a value replaces the time to live of the previous one.
+              An expired key is removed by the next operation on it, or by sweep.
         
         Returns :
             If the key doesn't exist or it exists and override is True, the old value is returned. Else, None is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None or unhashable :
             Preconditions :
-                The key is not of type string.
+                The key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
             Invariants :
                 The hash table is not modified.
 
+        Behavior - The time to live is invalid :
+            Preconditions :
+                The time to live is not positive.
+            Postconditions :
+                A value error is raised.
+            Invariants :
+                The hash table is not modified.
+
         Behavior - The key doesn't exist :
             Preconditions :
-                The key is of type string.
+                The key is hashable.
             Postconditions :
                 The key-value is inserted in the hash table.
                 None is returned.
 
         Behavior - The key doesn't exist and override is False :
             Preconditions :
-                The key is of type string.
+                The key is hashable.
                 The override parameter is False.
             Postconditions :
                 None is returned.
@@ -127,230 +311,2037 @@ class HashTable:
 
         Behavior - The key doesn't exist and override is True :
             Preconditions :
-                The key is of type string.
+                The key is hashable.
                 The override parameter is True.
             Postconditions :
                 The value of the key is updated in the hash table
                 The old value is returned.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
-        
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__stats is not None and self.__stats.sample(PUT):
+            return self.__sampled(PUT, key, lambda: self.put(key, value, override, ttl))
+
+        if ttl is None and self.__deadlines is None:
+            return self.__write(key, value, override)
+
+        writes = self.__prepare_put(key, override, ttl)
+        old_value = self.__write(key, value, override)
+
+        if writes:
+            self.__set_deadline(key, ttl)
+
+        return old_value
 
-        slot = self.__get_slot(key)
+    def __write(self, key: Hashable, value: Any | None, override: bool) -> Any | None:
+        """ Writes the value of a key, without any time to live bookkeeping. See put. """
+        hash = self.__hash(key)
 
-        if slot.get(key) is not None and override:
-            return slot.update(key, value)
-        elif slot.get(key) is None:
-            return slot.insert(key, value)
+        if self.__open is not None:
+            index, inserted = self.__open_probe(key, hash)
+
+            if inserted:
+                self.__open.replace_at(index, value)
+                return None
+            elif override:
+                return self.__open.replace_at(index, value)
+
+            return False
+
+        slot = self.__writable_slot(hash)
+        node = slot.find(key, hash)
+
+        if node is not None and self.__policy is not None:
+            self.__policy.access(key)
+
+        if node is None:
+            self.__insert(slot, key, value, hash)
+            return None
+        elif override:
+            old_value = node.value
+            node.value = value
+            return old_value
         
         return False
 
-    def __get_slot(self, key: str) -> LinkedList:
+    def __prepare_put(self, key: Hashable, override: bool, ttl: float | None) -> bool:
+        """
+        Validates the time to live of a put and removes the key first if it expired, before the put writes its value.
+        
+        Parameters :
+            - key (Hashable) : The key about to be written.
+            - override (bool) : If the put overrides the value of an existing key.
+            - ttl (float | None) : The time to live of the new value, None if it never expires.
+
+        Returns :
+            True if the put writes the value, so that its deadline is to be replaced once the write succeeded. False otherwise.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Time to live is expected to be positive.")
+
+        if self.__deadlines is not None:
+            self.__expire(key)
+
+        return override or not self.contains(key)
+
+    def __set_deadline(self, key: Hashable, ttl: float | None) -> None:
+        """ Replaces the deadline of a key whose value was just written, None meaning that it never expires. """
+        if ttl is None:
+            if self.__deadlines is not None:
+                self.__deadlines.pop(key, None)
+
+            return
+
+        if self.__deadlines is None or self.__timers is None:
+            self.__deadlines = {}
+            self.__timers = TimingWheel(self.__ttl_resolution, start=self.__clock())
+
+        deadline = self.__clock() + ttl
+        self.__deadlines[key] = deadline
+        self.__timers.schedule(key, deadline)
+
+    def __expire(self, key: Hashable) -> None:
+        """ Removes a key whose time to live is over, so that the operation about to run finds it missing. """
+        deadline = self.__deadlines.get(key) # type: ignore[union-attr]
+
+        if deadline is not None and deadline <= self.__clock():
+            self.__remove(key, self.__hash(key), None)
+
+    def __expired_keys(self) -> Set[Hashable]:
+        """ Returns the keys whose time to live is over, but which no operation on them nor sweep removed yet. """
+        if self.__deadlines is None:
+            return set()
+
+        now = self.__clock()
+
+        return {key for key, deadline in self.__deadlines.items() if deadline <= now}
+
+    def ttl(self, key: Hashable) -> float | None:
+        """
+        Returns the remaining time to live of a key in seconds, or None if the key doesn't exist or never expires.
+        
+        Behavior - The key is None or unhashable :
+            Preconditions :
+                The key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+        """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__deadlines is None:
+            return None
+
+        self.__expire(key)
+        deadline = self.__deadlines.get(key)
+
+        return None if deadline is None else deadline - self.__clock()
+
+    def sweep(self, max_slots: int = 64) -> int:
         """
-        Retrieves the slot in which the given key is stored.
+        Removes the expired keys, advancing the timing wheel of the deadlines by at most the given number of slots.
+        Each call does a bounded amount of work, so it can be called regularly by an asyncio task or a background thread,
+        see the sweeper module. A sweep lagging behind catches up over the following calls.
         
         Parameters :
-            - key (str) : The key whose slot to retrieve.
+            - max_slots (int) : The maximum number of wheel slots to visit (Optional). Defaults to 64.
         
         Returns :
-            The slot in which the key is stored.
+            The number of expired keys removed.
+        """
+        if self.__timers is None:
+            return 0
+
+        expired = 0
+
+        for _, key, deadline in self.__timers.advance(self.__clock(), max_slots):
+            # A timer is stale if its key was removed or written again meanwhile
+            if self.__deadlines is not None and self.__deadlines.get(key) == deadline:
+                self.__remove(key, self.__hash(key), None)
+                expired += 1
+
+        return expired
+
+    def setdefault(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """
+        Retrieves the value with the given key, inserting the default value first if the key doesn't exist.
+        The key is hashed once and its slot is walked once.
+        
+        Parameters :
+            - key (Hashable) : The key of the value to retrieve.
+            - default (Any | None) : The value to insert if the key doesn't exist (Optional). Defaults to None.
+        
+        Returns :
+            If the key exists, the value of the key is returned. Else, the default value is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None or unhashable :
             Preconditions :
-                The key is not of type string.
+                The key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
+            Invariants :
+                The hash table is not modified.
 
-        Behavior - The key is of type string :
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the hash table.
+            Postconditions :
+                The key is inserted with the default value.
+                The default value is returned.
+
+        Behavior - The key exists :
             Preconditions :
-                The key is of type string.
+                The key exists in the hash table.
             Postconditions :
-                The slot in which the key is stored is returned.
+                The value of the key is returned.
+            Invariants :
+                The hash table is not modified.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
-        
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
-        
-        return self.__slots[self.__hash(key)]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__deadlines is not None:
+            self.__expire(key)
+
+        hash = self.__hash(key)
+
+        if self.__open is not None:
+            index, inserted = self.__open_probe(key, hash)
+
+            if inserted:
+                self.__open.replace_at(index, default)
+                return default
+
+            return self.__open.value_at(index)
 
-    def remove(self, key: str) -> Any | None:
+        slot = self.__writable_slot(hash)
+        node = slot.find(key, hash)
+
+        if node is not None and self.__policy is not None:
+            self.__policy.access(key)
+
+        if node is None:
+            self.__insert(slot, key, default, hash)
+            return default
+
+        return node.value
+
+    def compute(self, key: Hashable, function: Callable[[Any | None], Any | None], default: Any | None = None) -> Any | None:
         """
-        Removes the key-value corresponding to the given key.
+        Replaces the value of the given key by the result of a function applied to it.
+        The key is hashed once and its slot is walked once.
         
         Parameters :
-            - key (str) : The key to remove.
+            - key (Hashable) : The key of the value to compute.
+            - function (Callable[[Any | None], Any | None]) : The function receiving the current value and returning the new one.
+            - default (Any | None) : The value given to the function if the key doesn't exist (Optional). Defaults to None.
         
         Returns :
-            If the key exists, the old value is returned. Else, None is returned.
+            The new value of the key.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None or unhashable :
             Preconditions :
-                The key is not of type string.
+                The key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
             Invariants :
                 The hash table is not modified.
 
-        Behavior - The key doesn't exist :
+        Behavior - The function raises an exception :
             Preconditions :
-                The key doesn't exist in the hash table.
+                The function raises an exception.
             Postconditions :
-                None is returned.
+                The exception is propagated.
             Invariants :
                 The hash table is not modified.
 
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the hash table.
+            Postconditions :
+                The key is inserted with the result of the function applied to the default value.
+                The new value is returned.
+
         Behavior - The key exists :
             Preconditions :
                 The key exists in the hash table.
             Postconditions :
-                The key-value corresponding to the given key is removed from the hash table.
-                The old value is returned.
+                The value of the key is replaced by the result of the function applied to it.
+                The new value is returned.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__deadlines is not None:
+            self.__expire(key)
+
+        hash = self.__hash(key)
+
+        if self.__open is not None:
+            index, inserted = self.__open_probe(key, hash)
+
+            try:
+                value = function(default if inserted else self.__open.value_at(index))
+            except BaseException:
+                if inserted:
+                    self.__remove(key, hash, None)
+                raise
+
+            self.__open.replace_at(index, value)
+            return value
+
+        slot = self.__writable_slot(hash)
+        node = slot.find(key, hash)
+
+        if node is not None and self.__policy is not None:
+            self.__policy.access(key)
+
+        if node is None:
+            value = function(default)
+            self.__insert(slot, key, value, hash)
+        else:
+            value = function(node.value)
+            node.value = value
+
+        return value
+
+    def increment(self, key: Hashable, delta: Any = 1) -> Any:
+        """
+        Adds a delta to the value of the given key, a missing key counting as 0.
+        The key is hashed once and its slot is walked once.
         
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
+        Parameters :
+            - key (Hashable) : The key of the value to increment.
+            - delta (Any) : The amount to add to the value (Optional). Defaults to 1.
         
-        return self.__get_slot(key).remove(key)
+        Returns :
+            The new value of the key.
+            
+        Behavior - The key is None or unhashable :
+            Preconditions :
+                The key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The hash table is not modified.
 
-    def size(self) -> int:
-        """ Returns the number of elements inside the hash table. """
-        size = 0
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the hash table.
+            Postconditions :
+                The key is inserted with the delta as value.
+                The delta is returned.
 
-        for slot in self.__slots:
-            size += slot.size()
+        Behavior - The key exists :
+            Preconditions :
+                The key exists in the hash table.
+            Postconditions :
+                The delta is added to the value of the key.
+                The new value is returned.
+        """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
 
-        return size
+        if self.__deadlines is not None:
+            self.__expire(key)
 
-    def is_empty(self) -> bool:
-        """ Checks if the hash table is empty or not. """
-        return self.size() == 0
+        hash = self.__hash(key)
 
-    def keys(self) -> List[str]:
-        """ Returns the keys of the hash table as a list. """
-        keys: List[str] = []
+        if self.__open is not None:
+            index, inserted = self.__open_probe(key, hash)
+            value = delta if inserted else self.__open.value_at(index) + delta
+            self.__open.replace_at(index, value)
+            return value
 
-        for slot in self.__slots:
-            keys.extend(slot.keys())
+        slot = self.__writable_slot(hash)
+        node = slot.find(key, hash)
 
-        return keys
+        if node is not None and self.__policy is not None:
+            self.__policy.access(key)
 
-    def values(self) -> List[Any]:
-        """ Returns the values of the hash table as a list. """
-        values: List[Any] = []
+        if node is None:
+            self.__insert(slot, key, delta, hash)
+            return delta
 
-        for slot in self.__slots:
-            values.extend(slot.values())
+        node.value = node.value + delta
 
-        return values
-    
-    def entries(self) -> List[Tuple[str, Any]]:
-        """ Returns the key-value pairs of the hash table as a list. """
-        entries: List[Tuple[str, Any]] = []
+        return node.value
 
-        for slot in self.__slots:
-            entries.extend(slot.entries())
+    def pop(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """
+        Removes the key-value corresponding to the given key, with a single walk of its slot.
+        
+        Parameters :
+            - key (Hashable) : The key to remove.
+            - default (Any | None) : A default value to return if the key doesn't exist (Optional). Defaults to None.
+        
+        Returns :
+            If the key exists, the old value is returned. Else, the default value is returned.
+            
+        Behavior - The key is None or unhashable :
+            Preconditions :
+                The key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The hash table is not modified.
 
-        return entries
-    
-    def clear(self) -> None:
-        """ Clears the hash table. """
-        for slot in self.__slots:
-            slot.clear()
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the hash table.
+            Postconditions :
+                If set, the default value is returned, otherwise returns None.
+            Invariants :
+                The hash table is not modified.
 
-    def clone(self) -> HashTable:
-        """ Deeply clones the current hash table. """
-        hash_table = HashTable()
-        hash_table.__slots = [slot.clone() for slot in self.__slots]
+        Behavior - The key exists :
+            Preconditions :
+                The key exists in the hash table.
+            Postconditions :
+                The key-value corresponding to the given key is removed from the hash table.
+                The old value is returned.
+        """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
 
-        return hash_table
-    
-    def load_factor(self) -> float:
-        """ Returns the load factor of the hash table. """
-        return self.size() / self.__capacity
-    
-    def average_slot_distribution(self) -> float:
-        """ Returns the average slot distribution of the hash table. """
-        total_elements = 0
-        non_empty_slots = 0
+        if self.__deadlines is not None:
+            self.__expire(key)
 
-        for slot in self.__slots:
-            if not slot.is_empty():
-                total_elements += slot.size()
-                non_empty_slots += 1
+        return self.__remove(key, self.__hash(key), default)
 
-        return total_elements / non_empty_slots
-    
-    def get_capacity(self) -> int:
-        """ Returns the capacity of the hash table. """
-        return self.__capacity
-    
-    def merge(self, hash_table: HashTable, override: bool = False) -> None:
+    def put_many(self, entries: Iterable[Tuple[Hashable, Any | None]], override: bool = True) -> None:
         """
-        Merges the given hash table's values with the current one.
+        Adds a batch of key-values in the hash table, as put would do for each of them in order.
+        The keys are validated and hashed before anything is inserted, and the table is grown once for the whole batch.
         
         Parameters :
-            - hash_table (HashTable) : The hash table whose values to add in the current one.
-            - override (bool) : If the value should be overriden if the key already exists (Optional). Defaults to False.
+            - entries (Iterable[Tuple[Hashable, Any | None]]) : The key-values to add.
+            - override (bool) : If the values should be overriden if the keys already exist (Optional). Defaults to True.
             
-        Behavior - The key is not of type hash table :
+        Behavior - A key is None or unhashable :
             Preconditions :
-                The key is not of type hash table.
+                At least one key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
-            Invariants:
-                The current hash table is not modified.
+            Invariants :
+                The hash table is not modified.
 
-        Behavior - The key is of type hash table :
+        Behavior - The keys are hashable :
             Preconditions :
-                The key is of type hash table
+                Every key is hashable.
             Postconditions :
-                All the values in the given hash table are added inside the current one.
+                Every key-value is inserted, or updated if override is True.
                 None is returned.
         """
-        if hash_table is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Hash table is expected to be of type HashTable, None received.")
-        
-        if type(hash_table) != HashTable:
-            raise TypeError("Hash table is expected to be of type HashTable.")
-        
-        for key, value in hash_table.entries():
-            self.put(key, value, override)
+        entries = list(entries)
+        keys = [key for key, _ in entries]
+        self.__validate_keys(keys)
+
+        if self.__index is not None:
+            for key in keys:
+                self.__check_indexable(key)
+
+        if self.__policy is not None or self.__deadlines is not None:
+            # Evictions keep a bounded hash table small, so it isn't grown for the whole batch,
+            # and each written key loses its time to live
+            for key, value in entries:
+                self.put(key, value, override)
+
+            return
+
+        self.__reserve(len(entries))
+        hashes, indices = self.__hash_batch(keys)
+
+        if self.__open is not None:
+            open_storage = self.__open
 
-    def __default_hash(self, key: str) -> int:
+            for (key, value), hash in zip(entries, hashes):
+                index, inserted = self.__open_probe(key, hash)
+
+                if inserted or override:
+                    open_storage.replace_at(index, value)
+
+            return
+
+        slots = self.__slots
+        capacity = self.__capacity
+
+        if indices is None:
+            indices = [hash % capacity for hash in hashes]
+
+        # The table was grown for the whole batch, so the slot indices stay valid during the insertions
+        for (key, value), hash, index in zip(entries, hashes, indices):
+            slot = slots[index] if self.__shared is None else self.__writable_slot(hash)
+            node = slot.find(key, hash)
+
+            if node is None:
+                self.__insert(slot, key, value, hash)
+            elif override:
+                node.value = value
+
+    def get_many(self, keys: Iterable[Hashable], default: Any | None = None) -> List[Any | None]:
         """
-        A static hash function to transform a given key into a valid index for the slots.
+        Retrieves the values of a batch of keys, or a default value for the keys that don't exist.
+        The keys are validated and hashed before any lookup.
         
         Parameters :
-            - key (str) : The key to hash.
+            - keys (Iterable[Hashable]) : The keys of the values to retrieve.
+            - default (Any | None) : A default value for the keys that don't exist (Optional). Defaults to None.
         
         Returns :
-            The hashed value of the key.
-
-        References :
-            - https://stackoverflow.com/a/2624210/20892950
+            The values of the keys, in the same order.
             
-        Behavior - The key is not of type string :
+        Behavior - A key is None or unhashable :
             Preconditions :
-                The key is not of type string.
+                At least one key is None, or is not hashable.
             Postconditions :
                 A type error is raised.
-
-        Behavior - The key is valid :
-            Preconditions :
-                The key is valid.
-            Postconditions :
-                The hashed value of the key is returned.
         """
-        hash = 7
+        keys = list(keys)
+        self.__validate_keys(keys)
+
+        if self.__deadlines is not None:
+            for key in keys:
+                self.__expire(key)
+
+        hashes, indices = self.__hash_batch(keys)
+
+        if self.__bloom is not None:
+            # The definite misses are answered at once, the other keys being looked up as a smaller batch
+            present = self.__filter_batch(hashes)
+
+            if len(present) < len(keys):
+                values = [default] * len(keys)
+                found = self.__lookup_batch([keys[i] for i in present], [hashes[i] for i in present], None, default)
+
+                for i, value in zip(present, found):
+                    values[i] = value
+
+                if self.__policy is not None:
+                    self.__misses += len(keys) - len(present)
+
+                return values
+
+        return self.__lookup_batch(keys, hashes, indices, default)
+
+    def __lookup_batch(self, keys: List[Hashable], hashes: List[int], indices: List[int] | None, default: Any | None) -> List[Any | None]:
+        """ Retrieves the values of a batch of hashed keys. See get_many. """
+        if self.__policy is not None:
+            return [self.__cache_get(key, hash, default) for key, hash in zip(keys, hashes)]
+
+        if self.__open is not None:
+            get = self.__open.get
+            return [get(key, hash, default) for key, hash in zip(keys, hashes)]
+
+        values: List[Any | None] = []
+
+        if indices is not None:
+            slots = self.__slots
+
+            for key, hash, index in zip(keys, hashes, indices):
+                node = slots[index].find(key, hash)
+                values.append(default if node is None else node.value)
+
+            return values
+
+        for key, hash in zip(keys, hashes):
+            node = self.__batch_slot(hash).find(key, hash)
+            values.append(default if node is None else node.value)
+
+        return values
+
+    def contains_many(self, keys: Iterable[Hashable]) -> List[bool]:
+        """
+        Checks if each key of a batch exists in the hash table.
+        The keys are validated and hashed before any lookup.
+        
+        Parameters :
+            - keys (Iterable[Hashable]) : The keys to check.
+        
+        Returns :
+            For each key in the same order, True if it exists in the hash table, False otherwise.
+            
+        Behavior - A key is None or unhashable :
+            Preconditions :
+                At least one key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+        """
+        keys = list(keys)
+        self.__validate_keys(keys)
+
+        if self.__deadlines is not None:
+            for key in keys:
+                self.__expire(key)
+
+        hashes, indices = self.__hash_batch(keys)
+
+        if self.__bloom is not None:
+            present = self.__filter_batch(hashes)
+
+            if len(present) < len(keys):
+                found = [False] * len(keys)
+
+                for i, exists in zip(present, self.__contains_batch([keys[i] for i in present], [hashes[i] for i in present], None)):
+                    found[i] = exists
+
+                return found
+
+        return self.__contains_batch(keys, hashes, indices)
+
+    def __contains_batch(self, keys: List[Hashable], hashes: List[int], indices: List[int] | None) -> List[bool]:
+        """ Checks if each key of a batch of hashed keys exists. See contains_many. """
+        if self.__open is not None:
+            find = self.__open.find
+            return [find(key, hash) != -1 for key, hash in zip(keys, hashes)]
+
+        if indices is not None:
+            slots = self.__slots
+            return [slots[index].find(key, hash) is not None for key, hash, index in zip(keys, hashes, indices)]
+
+        return [self.__batch_slot(hash).find(key, hash) is not None for key, hash in zip(keys, hashes)]
+
+    def remove_many(self, keys: Iterable[Hashable]) -> List[Any | None]:
+        """
+        Removes the key-values of a batch of keys.
+        The keys are validated and hashed before anything is removed.
+        
+        Parameters :
+            - keys (Iterable[Hashable]) : The keys to remove.
+        
+        Returns :
+            For each key in the same order, its old value if it existed, None otherwise.
+            
+        Behavior - A key is None or unhashable :
+            Preconditions :
+                At least one key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The hash table is not modified.
+        """
+        keys = list(keys)
+        self.__validate_keys(keys)
+
+        if self.__deadlines is not None:
+            for key in keys:
+                self.__expire(key)
+
+        hashes, _ = self.__hash_batch(keys)
+
+        return [self.__remove(key, hash, None) for key, hash in zip(keys, hashes)]
+
+    def __filter_batch(self, hashes: List[int]) -> List[int]:
+        """ Returns the positions of the hashes that the Bloom filter may contain, counting the others as rejected. """
+        might_contain = self.__bloom.might_contain # type: ignore[union-attr]
+        present = [i for i, hash in enumerate(hashes) if might_contain(hash)]
+        self.__bloom_rejections += len(hashes) - len(present)
+
+        return present
+
+    def __hash_batch(self, keys: List[Hashable]) -> Tuple[List[int], List[int] | None]:
+        """
+        Hashes a batch of keys, vectorized when possible. See hash_functions.make_batch_hash.
+
+        Parameters :
+            - keys (List[Hashable]) : The keys to hash.
+
+        Returns :
+            A tuple with the full hash of each key, and the index of its slot when it was computed along the hashes,
+            None otherwise. The indices are only computed for the chained storage while no resize is in progress,
+            the slots list not changing during the batch.
+        """
+        if self.__batch_hash is None or len(keys) < MIN_VECTORIZED_BATCH:
+            return [self.__hash(key) for key in keys], None
+
+        capacity = self.__capacity if self.__open is None and self.__old_slots is None else None
+
+        return self.__batch_hash(keys, capacity)
+
+    def __validate_keys(self, keys: List[Hashable]) -> None:
+        """ Raises a type error if any key of a batch is None or not hashable, before the batch modifies anything. """
+        for key in keys:
+            if key is None:
+                raise TypeError("Key is expected to be hashable, None received.")
+
+            # The common key types are known to be hashable, the others are hashed once to find out
+            if type(key) not in (str, int, bytes):
+                hash(key)
+
+    def __writable_slot(self, hash: int) -> LinkedList:
+        """
+        Retrieves the slot in which a key of the given hash is stored like __get_slot, before modifying it.
+        If the slot is still shared with a copy-on-write clone, it is copied first.
+        
+        Parameters :
+            - hash (int) : The full hash of the key whose slot to retrieve.
+        
+        Returns :
+            The slot in which the key is stored, owned by the current hash table.
+        """
+        slot = self.__get_slot(hash)
+
+        if self.__shared is not None:
+            index = hash % self.__capacity
+
+            if self.__shared[index]:
+                self.__shared[index] = 0
+
+                if slot is not _EMPTY_SLOT:
+                    slot = slot.clone()
+                    self.__slots[index] = slot
+
+        return slot
+
+    def __batch_slot(self, hash: int) -> LinkedList:
+        """ Retrieves the slot of a hash inside a batch, going through __get_slot only while a resize is in progress. """
+        if self.__old_slots is None:
+            return self.__slots[hash % self.__capacity]
+
+        return self.__get_slot(hash)
+
+    def __open_probe(self, key: Hashable, hash: int) -> Tuple[int, bool]:
+        """ Searches the index of a key in the open addressing storage, inserting it if it doesn't exist. See OpenAddressing.probe_insert. """
+        if self.__index is not None:
+            self.__check_indexable(key)
+
+        if self.__policy is not None and self.__size >= self.__max_entries and self.__open.find(key, hash) == -1: # type: ignore[operator, union-attr]
+            self.__evict()
+
+        index, inserted = self.__open.probe_insert(key, hash) # type: ignore[union-attr]
+
+        if inserted:
+            self.__size += 1
+            self.__version += 1
+
+            if self.__bloom is not None and self.__bloom.add(hash):
+                self.__rebuild_bloom_filter()
+
+            if self.__index is not None:
+                self.__index.add(key) # type: ignore[arg-type]
+
+            if self.__policy is not None:
+                self.__policy.insert(key)
+
+            if self.__stats is not None:
+                self.__stats.insert(index != hash % self.__open.capacity()) # type: ignore[union-attr]
+        elif self.__policy is not None:
+            self.__policy.access(key)
+
+        return index, inserted
+
+    def __insert(self, slot: LinkedList, key: Hashable, value: Any | None, hash: int) -> None:
+        """
+        Inserts a key that doesn't exist yet in its slot, updating the counters and starting a resize if needed.
+        
+        Parameters :
+            - slot (LinkedList) : The slot of the key, in the current slots list.
+            - key (Hashable) : The key of the value to add.
+            - value (Any | None) : The value to add.
+            - hash (int) : The full hash of the key.
+        """
+        if self.__index is not None:
+            self.__check_indexable(key)
+
+        if self.__policy is not None:
+            if self.__size >= self.__max_entries: # type: ignore[operator]
+                self.__evict()
+                # The eviction may have emptied the slot, or started a resize
+                slot = self.__writable_slot(hash)
+
+            self.__policy.insert(key)
+
+        if self.__stats is not None:
+            self.__stats.insert(slot.size() > 0)
+
+        if slot is _EMPTY_SLOT:
+            slot = LinkedList()
+            self.__slots[hash % self.__capacity] = slot
+
+        self.__count_insert(slot.size())
+        slot.insert(key, value, hash)
+        self.__size += 1
+        self.__version += 1
+
+        if self.__bloom is not None and self.__bloom.add(hash):
+            self.__rebuild_bloom_filter()
+
+        if self.__index is not None:
+            self.__index.add(key) # type: ignore[arg-type]
+
+        if self.__old_slots is None and self.__size > self.__capacity * self.__max_load_factor:
+            self.__start_resize(self.__capacity * 2)
+
+    def __remove(self, key: Hashable, hash: int, default: Any | None) -> Any | None:
+        """
+        Removes a key from the storage, updating the counters and starting a resize if needed.
+        
+        Parameters :
+            - key (Hashable) : The key to remove.
+            - hash (int) : The full hash of the key.
+            - default (Any | None) : The value to return if the key doesn't exist.
+        
+        Returns :
+            If the key exists, the old value is returned. Else, the default value is returned.
+        """
+        if self.__open is not None:
+            removed, value = self.__open.remove(key, hash)
+
+            if not removed:
+                return default
+
+            self.__size -= 1
+            self.__version += 1
+
+            if self.__bloom is not None and self.__bloom.remove():
+                self.__rebuild_bloom_filter()
+
+            if self.__index is not None:
+                self.__index.remove(key) # type: ignore[arg-type]
+
+            if self.__policy is not None:
+                self.__policy.remove(key)
+
+            if self.__deadlines is not None:
+                self.__deadlines.pop(key, None)
+
+            return value
+
+        slot = self.__writable_slot(hash)
+        value = slot.remove(key, hash, _MISSING)
+
+        if value is _MISSING:
+            return default
+
+        self.__size -= 1
+        self.__version += 1
+        self.__count_remove(slot.size())
+
+        if self.__bloom is not None and self.__bloom.remove():
+            self.__rebuild_bloom_filter()
+
+        if self.__index is not None:
+            self.__index.remove(key) # type: ignore[arg-type]
+
+        if self.__policy is not None:
+            self.__policy.remove(key)
+
+        if self.__deadlines is not None:
+            self.__deadlines.pop(key, None)
+
+        if slot.is_empty():
+            self.__slots[hash % self.__capacity] = _EMPTY_SLOT
+
+        if (
+            self.__old_slots is None
+            and self.__capacity > self.__initial_capacity
+            and self.__size < self.__capacity * self.__min_load_factor
+        ):
+            self.__start_resize(max(self.__initial_capacity, self.__capacity // 2))
+
+        return value
+
+    def __evict(self) -> None:
+        """ Removes the entry chosen by the eviction policy, and passes it to the eviction callback. """
+        key = self.__policy.victim() # type: ignore[union-attr]
+        value = self.__remove(key, self.__hash(key), None)
+        self.__evictions += 1
+
+        if self.__on_evict is not None:
+            self.__on_evict(key, value)
+
+    def __get_slot(self, hash: int) -> LinkedList:
+        """
+        Retrieves the slot in which a key of the given hash is stored, moving it first if a resize is in progress.
+        
+        Parameters :
+            - hash (int) : The full hash of the key whose slot to retrieve.
+        
+        Returns :
+            The slot in which the key is stored.
+        """
+        if self.__old_slots is not None:
+            self.__rehash()
+
+        if self.__old_slots is not None:
+            old_index = hash % len(self.__old_slots)
+
+            # The key may still live in a slot the incremental rehash hasn't reached yet
+            if old_index >= self.__rehash_index:
+                self.__move_slot(old_index)
+
+        return self.__slots[hash % self.__capacity]
+
+    def __start_resize(self, capacity: int) -> None:
+        """
+        Starts an incremental resize of the hash table to the given capacity.
+        The entries are moved lazily by the following operations, see __rehash.
+        
+        Parameters :
+            - capacity (int) : The new size of the slots list.
+        """
+        if self.__stats is not None:
+            self.__stats.resize_started(self.__capacity, capacity)
+
+        self.__version += 1
+        self.__old_slots = self.__slots
+        self.__slots = [_EMPTY_SLOT] * capacity
+        self.__shared = None # The old linked lists are only read, the new ones are owned
+        self.__capacity = capacity
+        self.__rehash_index = 0
+
+    def __reserve(self, count: int) -> None:
+        """
+        Grows the hash table at once so that the given number of additional elements fits under the max load factor.
+        Unlike the automatic growth, the entries are moved immediately, since the batch about to be inserted
+        costs more than moving them.
+        
+        Parameters :
+            - count (int) : The number of elements about to be inserted.
+        """
+        if self.__open is not None:
+            self.__version += 1
+            self.__open.reserve(count)
+            return
+
+        capacity = self.__capacity
+
+        while self.__size + count > capacity * self.__max_load_factor:
+            capacity *= 2
+
+        if self.__old_slots is None and capacity == self.__capacity:
+            return
+
+        self.__finish_rehash()
+
+        if capacity != self.__capacity:
+            self.__start_resize(capacity)
+            self.__finish_rehash()
+
+    def __finish_rehash(self) -> None:
+        """ Moves every remaining slot of a resize in progress. """
+        if self.__old_slots is None:
+            return
+
+        for index in range(self.__rehash_index, len(self.__old_slots)):
+            self.__move_slot(index)
+
+        self.__old_slots = None
+        self.__rehash_index = 0
+
+        if self.__stats is not None:
+            self.__stats.resize_finished()
+
+    def __rehash(self) -> None:
+        """
+        Moves at most `rehash_step` non-empty slots from the old slots list to the new one.
+        Empty slots are skipped, but at most ten times the rehash step are visited per call so that a
+        sparse table never stalls a single operation. Once every slot is moved, the old slots list is released.
+        """
+        old_slots: List[LinkedList] = self.__old_slots # type: ignore[assignment]
+        moved = 0
+        empty_visits = self.__rehash_step * 10
+
+        while moved < self.__rehash_step and self.__rehash_index < len(old_slots):
+            slot = old_slots[self.__rehash_index]
+            self.__rehash_index += 1
+
+            if slot.is_empty():
+                empty_visits -= 1
+
+                if empty_visits == 0:
+                    break
+            else:
+                self.__move_slot(self.__rehash_index - 1)
+                moved += 1
+
+        if self.__rehash_index >= len(old_slots):
+            self.__old_slots = None
+            self.__rehash_index = 0
+
+            if self.__stats is not None:
+                self.__stats.resize_finished()
+
+    def __move_slot(self, index: int) -> None:
+        """
+        Moves every key-value of a slot from the old slots list into the new one.
+        The old linked list is left untouched, as it may be shared with a copy-on-write clone.
+        
+        Parameters :
+            - index (int) : The index of the old slot to empty.
+        """
+        slot = self.__old_slots[index] # type: ignore[index]
+
+        if slot.is_empty():
+            return
+
+        self.__old_slots[index] = _EMPTY_SLOT # type: ignore[index]
+
+        self.__count_clear(slot.size())
+
+        for hash, key, value in slot.hashed_entries():
+            index = hash % self.__capacity # type: ignore[operator]
+            new_slot = self.__slots[index]
+
+            if new_slot is _EMPTY_SLOT:
+                new_slot = LinkedList()
+                self.__slots[index] = new_slot
+
+            self.__count_insert(new_slot.size())
+            new_slot.insert(key, value, hash)
+
+    def __count_insert(self, length: int) -> None:
+        """
+        Updates the slot counters before an element is inserted in a slot.
+        
+        Parameters :
+            - length (int) : The length of the slot's chain before the insertion.
+        """
+        chain_lengths = self.__chain_lengths
+
+        if length == 0:
+            self.__non_empty_slots += 1
+        else:
+            chain_lengths[length] -= 1
+
+        if length + 1 == len(chain_lengths):
+            chain_lengths.append(0)
+
+        chain_lengths[length + 1] += 1
+
+        if length + 1 > self.__longest_chain:
+            self.__longest_chain = length + 1
+
+    def __count_remove(self, length: int) -> None:
+        """
+        Updates the slot counters after an element is removed from a slot.
+        
+        Parameters :
+            - length (int) : The length of the slot's chain after the removal.
+        """
+        chain_lengths = self.__chain_lengths
+        chain_lengths[length + 1] -= 1
+
+        if length == 0:
+            self.__non_empty_slots -= 1
+        else:
+            chain_lengths[length] += 1
+
+        if length + 1 == self.__longest_chain and chain_lengths[length + 1] == 0:
+            self.__longest_chain = length
+
+    def __count_clear(self, length: int) -> None:
+        """
+        Updates the slot counters before a whole slot is emptied.
+        
+        Parameters :
+            - length (int) : The length of the slot's chain before it is emptied.
+        """
+        chain_lengths = self.__chain_lengths
+        chain_lengths[length] -= 1
+        self.__non_empty_slots -= 1
+
+        while self.__longest_chain > 0 and chain_lengths[self.__longest_chain] == 0:
+            self.__longest_chain -= 1
+
+    def remove(self, key: Hashable) -> Any | None:
+        """
+        Removes the key-value corresponding to the given key.
+        
+        Parameters :
+            - key (Hashable) : The key to remove.
+        
+        Returns :
+            If the key exists, the old value is returned. Else, None is returned.
+            
+        Behavior - The key is None or unhashable :
+            Preconditions :
+                The key is None, or is not hashable.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The hash table is not modified.
+
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the hash table.
+            Postconditions :
+                None is returned.
+            Invariants :
+                The hash table is not modified.
+
+        Behavior - The key exists :
+            Preconditions :
+                The key exists in the hash table.
+            Postconditions :
+                The key-value corresponding to the given key is removed from the hash table.
+                The old value is returned.
+        """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        if self.__stats is not None and self.__stats.sample(REMOVE):
+            return self.__sampled(REMOVE, key, lambda: self.remove(key))
+
+        if self.__deadlines is not None:
+            self.__expire(key)
+        
+        return self.__remove(key, self.__hash(key), None)
+
+    def size(self) -> int:
+        """
+        Returns the number of elements inside the hash table, in constant time.
+        Like the DBSIZE of Redis, the keys whose time to live is over still count until an operation on them or sweep
+        removes them, while the iterations already skip them.
+        """
+        return self.__size
+
+    def is_empty(self) -> bool:
+        """ Checks if the hash table is empty or not. """
+        return self.size() == 0
+
+    def __len__(self) -> int:
+        """ Returns the number of elements inside the hash table. See size. """
+        return self.__size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """ Lazily iterates over the keys of the hash table. See keys_view. """
+        return self.__iterate(_KEYS)
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of the hash table as a list. """
+        if self.__open is not None and self.__deadlines is None:
+            return self.__open.keys()
+
+        return list(self.__iterate(_KEYS))
+
+    def values(self) -> List[Any]:
+        """ Returns the values of the hash table as a list. """
+        if self.__open is not None and self.__deadlines is None:
+            return self.__open.values()
+
+        return list(self.__iterate(_VALUES))
+    
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """ Returns the key-value pairs of the hash table as a list. """
+        if self.__open is not None and self.__deadlines is None:
+            return self.__open.entries()
+
+        return list(self.__iterate(_ITEMS))
+
+    def keys_view(self) -> HashTableView:
+        """
+        Returns a live view over the keys of the hash table, walking the slots lazily without any intermediate list.
+        Its length is computed in constant time, and iterating it raises a runtime error if the hash table changes size meanwhile.
+        Like size, the length counts the keys whose time to live is over until they are removed, while iterating skips them.
+        """
+        return HashTableView(lambda: self.__iterate(_KEYS), self.size, self.contains)
+
+    def values_view(self) -> HashTableView:
+        """ Returns a live view over the values of the hash table. See keys_view. """
+        return HashTableView(lambda: self.__iterate(_VALUES), self.size, lambda value: any(value == other for other in self.__iterate(_VALUES)))
+
+    def items(self) -> HashTableView:
+        """ Returns a live view over the key-value pairs of the hash table. See keys_view. """
+        return HashTableView(lambda: self.__iterate(_ITEMS), self.size, self.__contains_item)
+
+    def __contains_item(self, item: Tuple[Hashable, Any]) -> bool:
+        """ Checks if a key-value pair exists in the hash table. """
+        value = self.get(item[0], _MISSING)
+
+        return value is not _MISSING and value == item[1]
+
+    def __iterate(self, part: int) -> Iterator[Any]:
+        """
+        Lazily walks every entry of the hash table, without any intermediate list.
+        A resize in progress is finished first, so that the lookups made during the iteration never move entries.
+        The keys whose time to live is over when the iteration starts are skipped, without being removed.
+        
+        Parameters :
+            - part (int) : What to yield for each entry, _KEYS, _VALUES or _ITEMS.
+        
+        Returns :
+            An iterator over the keys, values or key-value pairs of the hash table.
+
+        Behavior - The hash table changes size during the iteration :
+            Preconditions :
+                An element is inserted or removed, the hash table is cleared or resized during the iteration.
+            Postconditions :
+                A runtime error is raised.
+        """
+        self.__finish_rehash()
+        version = self.__version
+        expired = self.__expired_keys()
+
+        if self.__open is not None:
+            for key, value in self.__open.items():
+                if expired and key in expired:
+                    continue
+
+                yield key if part == _KEYS else value if part == _VALUES else (key, value)
+
+                if self.__version != version:
+                    raise RuntimeError("Hash table changed size during iteration.")
+
+            return
+
+        for slot in self.__slots:
+            node = slot.head()
+
+            while node is not None:
+                if expired and node.key in expired:
+                    node = node.next
+                    continue
+
+                yield node.key if part == _KEYS else node.value if part == _VALUES else (node.key, node.value)
+
+                if self.__version != version:
+                    raise RuntimeError("Hash table changed size during iteration.")
+
+                node = node.next
+    
+    def clear(self) -> None:
+        """ Clears the hash table. """
+        self.__version += 1
+        self.__capacity = self.__initial_capacity
+        self.__old_slots = None
+        self.__rehash_index = 0
+        self.__size = 0
+        self.__non_empty_slots = 0
+        self.__longest_chain = 0
+        self.__chain_lengths = [0]
+        self.__shared = None
+
+        self.__deadlines = None
+        self.__timers = None
+
+        if self.__policy is not None:
+            self.__policy.clear()
+
+        if self.__stats is not None:
+            # A resize in progress ends here, its remaining slots being dropped
+            self.__stats.resize_finished()
+
+        if self.__open is not None:
+            self.__open.clear()
+        else:
+            self.__slots = [_EMPTY_SLOT] * self.__capacity
+
+        if self.__bloom is not None:
+            self.__rebuild_bloom_filter()
+
+        if self.__index is not None:
+            self.__index.clear()
+
+    def clone(self, copy_on_write: bool = False) -> HashTable:
+        """
+        Clones the current hash table, retaining its capacity, hash function and resizing state.
+        The slots are copied as they are, so nothing is hashed again.
+        
+        Parameters :
+            - copy_on_write (bool) : If the linked lists should be shared between both hash tables until either
+              modifies them (Optional). Defaults to False, deeply copying every linked list. The open addressing
+              storage always copies its flat lists.
+        
+        Returns :
+            The clone of the hash table.
+        """
+        if copy_on_write:
+            # The shared linked lists are never moved by a resize of the clone
+            self.__finish_rehash()
+
+        hash_table = HashTable(
+            self.__initial_capacity,
+            self.__custom_hash,
+            self.__min_load_factor,
+            self.__max_load_factor,
+            self.__rehash_step,
+            self.__storage,
+            self.__hash_function,
+            self.__seed,
+            self.__max_entries,
+            self.__policy_name,
+            self.__on_evict,
+            self.__clock,
+            self.__ttl_resolution
+        )
+        hash_table.__deadlines = self.__deadlines.copy() if self.__deadlines is not None else None
+        hash_table.__timers = self.__timers.clone() if self.__timers is not None else None
+        hash_table.__policy = self.__policy.clone() if self.__policy is not None else None
+        hash_table.__bloom = self.__bloom.clone() if self.__bloom is not None else None
+        hash_table.__index = self.__index.clone() if self.__index is not None else None
+        hash_table.__hits = self.__hits
+        hash_table.__misses = self.__misses
+        hash_table.__evictions = self.__evictions
+        hash_table.__size = self.__size
+        hash_table.__non_empty_slots = self.__non_empty_slots
+        hash_table.__longest_chain = self.__longest_chain
+        hash_table.__chain_lengths = self.__chain_lengths.copy()
+
+        if self.__open is not None:
+            hash_table.__open = self.__open.clone()
+            return hash_table
+
+        hash_table.__capacity = self.__capacity
+
+        if copy_on_write:
+            hash_table.__slots = self.__slots.copy()
+            self.__shared = bytearray(b"\x01") * self.__capacity
+            hash_table.__shared = bytearray(b"\x01") * self.__capacity
+            return hash_table
+
+        hash_table.__slots = [_EMPTY_SLOT if slot.is_empty() else slot.clone() for slot in self.__slots]
+
+        if self.__old_slots is not None:
+            hash_table.__old_slots = [_EMPTY_SLOT if slot.is_empty() else slot.clone() for slot in self.__old_slots]
+            hash_table.__rehash_index = self.__rehash_index
+
+        return hash_table
+    
+    def save(self, path: str) -> None:
+        """
+        Saves the hash table to a binary snapshot file, which HashTable.open loads back.
+        The file holds a header (capacity, hash function and seed), the offset of each slot, and the packed key-value records
+        of each slot, the values being pickled. The hashes stored in the nodes are written as they are when the hash function
+        gives the same hashes in every process. Otherwise, the records are indexed with the FNV-1a hash under the same seed.
+        The file is written next to the given path first, and only replaces it once complete.
+        
+        Parameters :
+            - path (str) : The path of the snapshot file.
+
+        Behavior - A key can't be saved :
+            Preconditions :
+                A key of the hash table is not of type string, bytes or integer.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The file at the given path is not modified.
+
+        Behavior - A value can't be pickled :
+            Preconditions :
+                A value of the hash table can't be pickled.
+            Postconditions :
+                A pickling error is raised.
+            Invariants :
+                The file at the given path is not modified.
+        """
+        hash_function = None if self.__custom_hash is not None else self.__hash_function
+        capacity = self.get_capacity()
+        # The keys whose time to live is over are left out, and the loaded hash table never expires anything
+        expired = self.__expired_keys()
+
+        if is_portable(hash_function) and self.__open is None:
+            self.__finish_rehash()
+            slots: Iterable[Iterable[Tuple[int, Hashable, Any]]] = (
+                [entry for entry in slot.hashed_entries() if entry[1] not in expired] if expired else slot.hashed_entries()
+                for slot in self.__slots
+            )
+            index_hash_function = hash_function
+        else:
+            index_hash_function = hash_function if is_portable(hash_function) else FALLBACK_HASH
+            index_hash = make_hash(index_hash_function, self.__seed) # type: ignore[arg-type]
+            buckets: List[List[Tuple[int, Hashable, Any]]] = [[] for _ in range(capacity)]
+
+            for key, value in self.__iterate(_ITEMS):
+                hash = index_hash(key)
+                buckets[hash % capacity].append((hash, key, value))
+
+            slots = buckets
+
+        write_snapshot(path, capacity, self.__size - len(expired), self.__storage, hash_function, index_hash_function, self.__seed, slots) # type: ignore[arg-type]
+
+    def freeze(self) -> FrozenHashTable:
+        """
+        Builds a read-only copy of the hash table, with a minimal perfect hash of its keys : every lookup probes a single
+        slot, and the entries are stored in flat lists without any node. See FrozenHashTable.from_entries.
+        The hashes stored in the nodes are reused, so no key is hashed again. The keys whose time to live is over
+        are left out, and the frozen copy never expires anything.
+
+        Returns :
+            The frozen hash table, using the same hash function. The hash table itself is not modified.
+        """
+        if self.__open is not None:
+            hashed_entries = self.__open.hashed_entries()
+        else:
+            self.__finish_rehash()
+            hashed_entries = [entry for slot in self.__slots for entry in slot.hashed_entries()]
+
+        if self.__deadlines is not None:
+            now = self.__clock()
+            deadlines = self.__deadlines
+            hashed_entries = [entry for entry in hashed_entries if deadlines.get(entry[1], now + 1) > now]
+
+        return FrozenHashTable(hashed_entries, self.__hash) # type: ignore[arg-type]
+
+    @staticmethod
+    def from_sample(keys: Iterable[Hashable], expected_size: int | None = None, **options: Any) -> HashTable:
+        """
+        Builds an empty hash table whose hash function and capacity are chosen from a sample of its future keys.
+        Each built-in hash function is measured on the sample, see hash_analysis.analyze : the fastest of the ones
+        spreading the keys evenly with a sound avalanche is picked. The capacity is the smallest prime keeping the
+        load factor under 0.75 for the expected size.
+        
+        Parameters :
+            - keys (Iterable[Hashable]) : A sample of the keys the hash table will hold.
+            - expected_size (int | None) : The number of keys the hash table will hold (Optional). Defaults to None, the sample size.
+            - options (Any) : The other parameters of the hash table, see __init__. The capacity, hash function
+              and custom hash can't be given. The seed is the one the hash functions are measured with.
+        
+        Returns :
+            The new empty hash table.
+
+        Behavior - The sample is empty :
+            Preconditions :
+                The sample holds no key.
+            Postconditions :
+                A value error is raised.
+
+        Behavior - The options are invalid :
+            Preconditions :
+                The options hold the capacity, hash function or custom hash, or a parameter of __init__ is invalid.
+            Postconditions :
+                A type error or value error is raised.
+        """
+        for name in ("capacity", "hash_function", "custom_hash"):
+            if name in options:
+                raise TypeError(f"The {name} is chosen from the sample, it is not expected as an option.")
+
+        seed = options.pop("seed", None)
+        seed = seed if seed is not None else random.getrandbits(64)
+        hash_function, capacity = recommend(list(keys), expected_size, seed)
+
+        return HashTable(capacity, hash_function=hash_function, seed=seed, **options)
+
+    @staticmethod
+    def open(path: str, mmap: bool = True, custom_hash: Callable[[Hashable], int] | None = None) -> HashTable | MappedHashTable:
+        """
+        Opens a snapshot file written by HashTable.save.
+        
+        Parameters :
+            - path (str) : The path of the snapshot file.
+            - mmap (bool) : If the snapshot should be served read-only straight from a memory map of the file (Optional).
+              Defaults to True : only the header is read, so opening takes the same time whatever the size of the snapshot.
+              Otherwise, every record is loaded in a new hash table, reusing the stored hashes when possible.
+            - custom_hash (HashFunction | None) : The custom hash of the saved hash table, which a file can't hold (Optional).
+              Defaults to None. It is only needed to load a hash table saved with a custom hash.
+        
+        Returns :
+            A MappedHashTable if mmap is True, a HashTable otherwise.
+
+        Behavior - The file is not a snapshot :
+            Preconditions :
+                The file doesn't start with the snapshot magic, or has an unknown format version.
+            Postconditions :
+                A value error is raised.
+
+        Behavior - The custom hash is missing :
+            Preconditions :
+                mmap is False, the snapshot was saved with a custom hash and no custom hash is given.
+            Postconditions :
+                A value error is raised.
+        """
+        if mmap:
+            return MappedHashTable(path)
+
+        with open(path, "rb") as file:
+            buffer = file.read()
+
+        storage, hash_function, index_hash_function, capacity, size, seed = read_header(buffer)
+
+        if hash_function is None and custom_hash is None:
+            raise ValueError("Snapshot was saved with a custom hash, which is expected to be given.")
+
+        # The initial capacity is the default one, so that the loaded hash table can shrink below the saved capacity,
+        # which only sizes the slots the records are linked into
+        hash_table = HashTable(custom_hash=custom_hash, storage=storage, hash_function=hash_function or "builtin", seed=seed)
+        hash = hash_table.__hash
+        reuse_hashes = custom_hash is None and hash_function == index_hash_function
+        records = read_records(buffer, records_offset(capacity), len(buffer))
+
+        if hash_table.__open is not None:
+            hash_table.__open.reserve(size)
+
+            for record_hash, key, value in records:
+                hash_table.__open.insert(key, record_hash if reuse_hashes else hash(key), value)
+
+            hash_table.__size = size
+            return hash_table
+
+        hash_table.__capacity = capacity
+        hash_table.__slots = [_EMPTY_SLOT] * capacity
+
+        for record_hash, key, value in records:
+            if not reuse_hashes:
+                record_hash = hash(key)
+
+            # The records hold distinct keys and the capacity already fits them, so they are linked without any lookup
+            index = record_hash % capacity
+            slot = hash_table.__slots[index]
+
+            if slot is _EMPTY_SLOT:
+                slot = LinkedList()
+                hash_table.__slots[index] = slot
+
+            hash_table.__count_insert(slot.size())
+            slot.insert(key, value, record_hash)
+
+        hash_table.__size = size
+
+        return hash_table
+
+    def load_factor(self) -> float:
+        """ Returns the load factor of the hash table. """
+        return self.size() / self.get_capacity()
+    
+    def average_slot_distribution(self) -> float:
+        """ Returns the average slot distribution of the hash table. """
+        if self.__size == 0:
+            return 0.0
+
+        if self.__open is not None:
+            # Each slot of the open addressing storage holds at most one element
+            return 1.0
+
+        return self.__size / self.__non_empty_slots
+
+    def non_empty_slots(self) -> int:
+        """ Returns the number of slots holding at least one element. """
+        if self.__open is not None:
+            return self.__size
+
+        return self.__non_empty_slots
+
+    def longest_chain(self) -> int:
+        """ Returns the number of elements of the longest slot. """
+        if self.__open is not None:
+            return min(self.__size, 1)
+
+        return self.__longest_chain
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Reports how well a bounded hash table works as a cache.
+        
+        Returns :
+            A dictionary with the number of get hits ("hits"), get misses ("misses"), evicted entries ("evictions"),
+            and the share of hits among the gets ("hit_rate"). Every counter stays 0 for an unbounded hash table.
+        """
+        lookups = self.__hits + self.__misses
+
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "hit_rate": self.__hits / lookups if lookups > 0 else 0.0,
+        }
+
+    def enable_bloom_filter(self, false_positive_rate: float = 0.01) -> None:
+        """
+        Puts a Bloom filter in front of the lookups, rebuilding it if it already exists. See bloom_filter.BloomFilter.
+        get, contains and their batch versions check the hash of a key against the filter first : a key the filter
+        surely doesn't contain is a miss without walking its chain or probing the open storage.
+        Every insert adds its hash to the filter. The bits of the removed keys stay set, so the filter is rebuilt
+        from the stored hashes once the removals make up half of it, and rebuilt larger once it holds more keys than it
+        was sized for (twice the size, as a power of 2). Until it is called, its only cost is a None check per operation.
+        The check costs about as much as a miss on a short chain, so the filter pays off when the misses are common and
+        expensive : long chains (a high max load factor, a weak custom hash), or keys slow to compare.
+
+        Parameters :
+            - false_positive_rate (float) : The share of the absent keys that still go through a lookup (Optional).
+              Defaults to 0.01. A lower rate costs more bits per key. See bloom_filter_stats for the current rate.
+
+        Behavior - The false positive rate is invalid :
+            Preconditions :
+                The false positive rate is not strictly between 0 and 1.
+            Postconditions :
+                A value error is raised.
+            Invariants :
+                The hash table is not modified.
+        """
+        self.__rebuild_bloom_filter(false_positive_rate)
+        self.__bloom_rejections = 0
+
+    def disable_bloom_filter(self) -> None:
+        """ Drops the Bloom filter, the lookups going straight to the storage again. """
+        self.__bloom = None
+
+    def bloom_filter_stats(self) -> Dict[str, Any]:
+        """
+        Reports the state of the Bloom filter.
+
+        Returns :
+            A dictionary with "enabled", if the filter exists, and "rejected", the number of lookups it answered as misses
+            since enable_bloom_filter. Once enabled, the state of the filter follows, see BloomFilter.stats : in particular
+            its estimated "false_positive_rate" and its "target_false_positive_rate".
+        """
+        report: Dict[str, Any] = {"enabled": self.__bloom is not None, "rejected": self.__bloom_rejections}
+
+        if self.__bloom is not None:
+            report.update(self.__bloom.stats())
+
+        return report
+
+    def __rebuild_bloom_filter(self, false_positive_rate: float | None = None) -> None:
+        """
+        Builds a new Bloom filter from the stored hashes, sized for twice the current size.
+
+        Parameters :
+            - false_positive_rate (float | None) : The false positive rate of the new filter (Optional).
+              Defaults to None, the rate of the current filter.
+        """
+        if false_positive_rate is None:
+            false_positive_rate = self.__bloom.target_false_positive_rate() # type: ignore[union-attr]
+
+        bloom = BloomFilter(max(64, 1 << (2 * self.__size).bit_length()), false_positive_rate)
+
+        if self.__open is not None:
+            for hash in self.__open.hashes():
+                bloom.add(hash)
+        else:
+            # The slots an incremental resize hasn't moved yet still hold their entries
+            slots = self.__slots if self.__old_slots is None else self.__slots + self.__old_slots[self.__rehash_index:]
+
+            for slot in slots:
+                node = slot.head()
+
+                while node is not None:
+                    bloom.add(node.hash) # type: ignore[arg-type]
+                    node = node.next
+
+        self.__bloom = bloom
+
+    def enable_sorted_index(self) -> None:
+        """
+        Maintains a sorted index of the keys, backing prefix_scan, range and sorted_keys. See sorted_index.SortedIndex.
+        Every insert and removal updates the index, shifting at most 1024 keys of a sorted chunk, so that a scan costs
+        O(log n + matches) instead of sorting every key. The index only holds strings : while it is enabled, the keys are expected to be
+        strings. Until it is called, its only cost is a None check per insert and removal.
+
+        Behavior - A key is not a string :
+            Preconditions :
+                The hash table holds a key that is not a string.
+            Postconditions :
+                A type error is raised.
+            Invariants :
+                The hash table is not modified.
+        """
+        keys = self.keys()
+
+        for key in keys:
+            self.__check_indexable(key)
+
+        self.__index = SortedIndex(keys) # type: ignore[arg-type]
+
+    def disable_sorted_index(self) -> None:
+        """ Drops the sorted index, the keys being free to be of any hashable type again. """
+        self.__index = None
+
+    def __check_indexable(self, key: Hashable) -> None:
+        """ Raises a type error if a key can't be held by the sorted index. """
+        if not isinstance(key, str):
+            raise TypeError("Key is expected to be a string while the sorted index is enabled.")
+
+    def __indexed(self, keys: Iterator[str]) -> Iterator[str]:
+        """ Yields the keys of a scan of the sorted index, skipping the keys whose time to live is over. """
+        if self.__deadlines is None:
+            yield from keys
+            return
+
+        for key in keys:
+            deadline = self.__deadlines.get(key)
+
+            if deadline is None or deadline > self.__clock():
+                yield key
+
+    def __sorted_index(self) -> SortedIndex:
+        """ Returns the sorted index, raising a runtime error if it isn't enabled. """
+        if self.__index is None:
+            raise RuntimeError("Sorted index is expected to be enabled, see enable_sorted_index.")
+
+        return self.__index
+
+    def prefix_scan(self, prefix: str) -> Iterator[str]:
+        """
+        Lazily iterates in order over the keys starting with the given prefix, like "tenant:42:".
+        
+        Parameters :
+            - prefix (str) : The prefix of the keys.
+        
+        Returns :
+            An iterator over the matching keys in order, costing O(log n + matches). See get for their values.
+
+        Behavior - The sorted index is disabled :
+            Preconditions :
+                enable_sorted_index wasn't called.
+            Postconditions :
+                A runtime error is raised.
+
+        Behavior - The hash table changes size during the iteration :
+            Preconditions :
+                A key is inserted or removed, or the hash table is cleared during the iteration.
+            Postconditions :
+                A runtime error is raised.
+        """
+        return self.__indexed(self.__sorted_index().prefix(prefix))
+
+    def range(self, low: str | None = None, high: str | None = None) -> Iterator[str]:
+        """
+        Lazily iterates in order over the keys between two bounds. See prefix_scan.
+        
+        Parameters :
+            - low (str | None) : The lowest key, included (Optional). Defaults to None, from the first key.
+            - high (str | None) : The highest key, excluded (Optional). Defaults to None, up to the last key.
+        
+        Returns :
+            An iterator over the keys such that low <= key < high, in order.
+        """
+        return self.__indexed(self.__sorted_index().range(low, high))
+
+    def sorted_keys(self, reverse: bool = False) -> Iterator[str]:
+        """
+        Lazily iterates over every key in order. See prefix_scan.
+        
+        Parameters :
+            - reverse (bool) : If the keys should come in reverse order (Optional). Defaults to False.
+        
+        Returns :
+            An iterator over the keys, in order.
+        """
+        index = self.__sorted_index()
+
+        return self.__indexed(reversed(index) if reverse else iter(index))
+
+    def enable_stats(
+        self,
+        sample_every: int = 64,
+        max_samples: int = 1024,
+        on_report: Callable[[Dict[str, Any]], None] | None = None,
+        report_every: int = 10000
+    ) -> None:
+        """
+        Starts collecting statistics on the hash table, restarting them if they were already collected. See stats.
+        Every get, put and remove is counted, and one out of sample_every is measured : the number of nodes or slots
+        it probes and its latency are recorded. Inserts count the collisions, and resizes are timed.
+        Until it is called, the only cost of the statistics is a None check per operation.
+        
+        Parameters :
+            - sample_every (int) : The number of operations per measured one (Optional). Defaults to 64.
+            - max_samples (int) : The number of latest samples kept per operation (Optional). Defaults to 1024.
+            - on_report (Callable[[Dict[str, Any]], None] | None) : A function called with the result of stats regularly (Optional).
+              Defaults to None. It is called in the middle of an operation, so it must not modify the hash table.
+            - report_every (int) : The number of operations between two reports (Optional). Defaults to 10000.
+
+        Behavior - The parameters are invalid :
+            Preconditions :
+                The sampling period, the number of samples or the report period is lower than 1.
+            Postconditions :
+                A value error is raised.
+            Invariants :
+                The hash table is not modified.
+        """
+        self.__stats = TableStats(sample_every, max_samples, on_report, report_every)
+
+        if self.__open is not None:
+            self.__open.set_resize_listeners(self.__stats.resize_started, self.__stats.resize_finished)
+
+    def disable_stats(self) -> None:
+        """ Stops collecting statistics, dropping the ones collected. """
+        self.__stats = None
+
+        if self.__open is not None:
+            self.__open.set_resize_listeners(None, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Reports the shape of the hash table, and the statistics collected since enable_stats.
+        
+        Returns :
+            A dictionary with :
+                - "enabled" : If the statistics are collected.
+                - "size", "capacity", "load_factor", "longest_chain" : See the methods of the same names.
+                - "chain_lengths" : The number of slots per chain length, for the chained storage.
+                  "probe_distances" : The number of entries per distance to their home slot, for the open storage.
+            And once enabled :
+                - "operations" : Per operation ("get", "put", "remove"), its "count", the number of "samples" measured,
+                  their "average_probes", and the "probes" and "latency" in seconds of the samples as their
+                  "p50", "p90", "p99" and "max".
+                - "inserts", "collisions", "collision_rate" : The new keys, and the ones that didn't get a slot of their own.
+                - "resizes", "resize_seconds", "recent_resizes" : The completed resizes, their total duration, and the latest
+                  ones with their capacities ("from", "to") and duration ("seconds"). An incremental resize lasts until
+                  its last slot is moved.
+                - "resizing" : If an incremental resize is in progress.
+        """
+        report: Dict[str, Any] = {
+            "enabled": self.__stats is not None,
+            "size": self.__size,
+            "capacity": self.get_capacity(),
+            "load_factor": self.load_factor(),
+            "longest_chain": self.longest_chain(),
+        }
+
+        if self.__open is not None:
+            report["probe_distances"] = dict(enumerate(self.__open.distance_histogram()))
+        else:
+            report["chain_lengths"] = {length: slots for length, slots in enumerate(self.__chain_lengths) if slots > 0}
+
+        if self.__stats is not None:
+            report.update(self.__stats.snapshot())
+
+        return report
+
+    def __sampled(self, operation: int, key: Hashable, call: Callable[[], Any]) -> Any:
+        """
+        Runs an operation chosen to be measured, recording its probe count and latency.
+        
+        Parameters :
+            - operation (int) : The operation, GET, PUT or REMOVE.
+            - key (Hashable) : The key of the operation.
+            - call (Callable[[], Any]) : Runs the operation again, its stats check being skipped this time.
+        
+        Returns :
+            The result of the operation.
+        """
+        stats: TableStats = self.__stats # type: ignore[assignment]
+
+        try:
+            probes = self.__probe_length(key, self.__hash(key))
+            start = stats.now()
+            result = call()
+        except BaseException:
+            stats.abort()
+            raise
+
+        if stats.record(operation, probes, stats.now() - start):
+            stats.report(self.stats())
+
+        return result
+
+    def __probe_length(self, key: Hashable, hash: int) -> int:
+        """ Returns the number of nodes or slots a search of the given key visits, without moving anything. """
+        if self.__open is not None:
+            return self.__open.probe_length(key, hash)
+
+        if self.__old_slots is not None and hash % len(self.__old_slots) >= self.__rehash_index:
+            slot = self.__old_slots[hash % len(self.__old_slots)]
+
+            # The key may still be in a slot the incremental rehash hasn't reached yet
+            if not slot.is_empty():
+                return slot.probe_length(key, hash)
+
+        return self.__slots[hash % self.__capacity].probe_length(key, hash)
+
+    def memoize(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Decorates a function so that its results are stored in the hash table, the calls with the same arguments
+        returning the stored result. With max_entries, the hash table is a bounded cache of the most useful results.
+        
+        Parameters :
+            - function (Callable[..., Any]) : The function to memoize.
+        
+        Returns :
+            The memoized function. The key of a call is the tuple of its arguments, so they must be hashable.
+        """
+        @functools.wraps(function)
+        def memoized(*arguments: Any, **keyword_arguments: Any) -> Any:
+            key = (arguments, frozenset(keyword_arguments.items())) if keyword_arguments else arguments
+            value = self.get(key, _MISSING)
+
+            if value is _MISSING:
+                value = function(*arguments, **keyword_arguments)
+                self.put(key, value)
+
+            return value
+
+        return memoized
+
+    def memory_usage(self, include_data: bool = False) -> Dict[str, float]:
+        """
+        Reports the memory used by the hash table, to plan its capacity.
+        
+        Parameters :
+            - include_data (bool) : If the keys and values themselves should be counted (Optional). Defaults to False.
+              Counting them walks every entry, otherwise the report is computed in constant time.
+        
+        Returns :
+            A dictionary with the bytes used by the slots lists ("slots"), the linked lists ("chains"),
+            the nodes ("nodes"), the keys and values ("data"), their sum ("total") and the bytes per entry ("bytes_per_entry").
+            The integers of the stored hashes aren't counted.
+        """
+        if self.__open is not None:
+            slots = self.__open.memory_usage()
+            chains = 0
+            nodes = 0
+        else:
+            slots = sys.getsizeof(self.__slots) + (sys.getsizeof(self.__old_slots) if self.__old_slots is not None else 0)
+            chains = self.non_empty_slots() * sys.getsizeof(_EMPTY_SLOT)
+            nodes = self.__size * sys.getsizeof(Node(("", None)))
+
+        data = 0
+
+        if include_data:
+            for key, value in self.entries():
+                data += sys.getsizeof(key) + sys.getsizeof(value)
+
+        total = slots + chains + nodes + data
+
+        return {
+            "slots": slots,
+            "chains": chains,
+            "nodes": nodes,
+            "data": data,
+            "total": total,
+            "bytes_per_entry": total / self.__size if self.__size > 0 else 0.0,
+        }
+
+    def get_capacity(self) -> int:
+        """ Returns the capacity of the hash table. """
+        if self.__open is not None:
+            return self.__open.capacity()
+
+        return self.__capacity
+    
+    def merge(self, hash_table: HashTable, override: bool = False) -> None:
+        """
+        Merges the given hash table's values with the current one.
+        The keys are written as put would : a written key takes the remaining time to live it has in the given hash table,
+        and the keys whose time to live is over in either hash table count as missing.
+        When both hash tables are chained, unbounded, and hash with the same custom hash, or the same hash function and seed,
+        the hashes stored in the nodes are reused instead of hashing every key again. Since the seed is random per hash table
+        by default, this only holds for clones, or for hash tables built with the same explicit seed : two hash tables built
+        independently are merged key by key.
+        
+        Parameters :
+            - hash_table (HashTable) : The hash table whose values to add in the current one.
+            - override (bool) : If the value should be overriden if the key already exists (Optional). Defaults to False.
+            
+        Behavior - The key is not of type hash table :
+            Preconditions :
+                The key is not of type hash table.
+            Postconditions :
+                A type error is raised.
+            Invariants:
+                The current hash table is not modified.
+
+        Behavior - The key is of type hash table :
+            Preconditions :
+                The key is of type hash table
+            Postconditions :
+                All the values in the given hash table are added inside the current one.
+                None is returned.
+        """
+        if hash_table is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Hash table is expected to be of type HashTable, None received.")
+        
+        if type(hash_table) != HashTable:
+            raise TypeError("Hash table is expected to be of type HashTable.")
+        
+        if hash_table is self:
+            return
+
+        if self.__open is None and hash_table.__open is None and self.__policy is None and self.__same_hash(hash_table):
+            self.__merge_slots(hash_table, override)
+            return
+
+        deadlines = hash_table.__deadlines
+
+        if deadlines is None:
+            for key, value in hash_table.items():
+                self.put(key, value, override)
+
+            return
+
+        now = hash_table.__clock()
+
+        for key, value in hash_table.items():
+            deadline = deadlines.get(key)
+            self.put(key, value, override, None if deadline is None else deadline - now)
+
+    def __same_hash(self, hash_table: HashTable) -> bool:
+        """ Checks if the given hash table hashes the keys exactly like the current one. """
+        if self.__custom_hash is not None or hash_table.__custom_hash is not None:
+            return self.__custom_hash is hash_table.__custom_hash
+
+        return self.__hash_function == hash_table.__hash_function and self.__seed == hash_table.__seed
+
+    def __merge_slots(self, hash_table: HashTable, override: bool) -> None:
+        """
+        Merges a chained hash table using the same hash function, reusing the hashes stored in its nodes.
+        When both hash tables have the same capacity, each slot is merged into the slot of same index.
+        The time to live rule is the one of put : the expired keys of the given hash table are skipped, an expired key
+        of the current one counts as missing, and a written key takes the remaining time to live of the merged one.
+        
+        Parameters :
+            - hash_table (HashTable) : The hash table whose values to add in the current one.
+            - override (bool) : If the value should be overriden if the key already exists.
+        """
+        hash_table.__finish_rehash()
+
+        if hash_table.__capacity != self.__capacity:
+            self.__reserve(hash_table.__size)
+
+        self.__finish_rehash()
+        same_capacity = hash_table.__capacity == self.__capacity
+        timed = self.__deadlines is not None or hash_table.__deadlines is not None
+        expired = self.__expired_keys()
+        other_deadlines = hash_table.__deadlines
+        other_expired = hash_table.__expired_keys()
+        other_now = hash_table.__clock()
+
+        for index, other_slot in enumerate(hash_table.__slots):
+            node = other_slot.head()
+
+            while node is not None:
+                if other_expired and node.key in other_expired:
+                    node = node.next
+                    continue
+
+                hash: int = node.hash # type: ignore[assignment]
+                slot = self.__slots[index if same_capacity else hash % self.__capacity]
+
+                if self.__shared is not None:
+                    slot = self.__writable_slot(hash)
+
+                existing_node = slot.find(node.key, hash)
+
+                if existing_node is None:
+                    if self.__index is not None:
+                        self.__check_indexable(node.key)
+
+                    if self.__stats is not None:
+                        self.__stats.insert(slot.size() > 0)
+
+                    if slot is _EMPTY_SLOT:
+                        slot = LinkedList()
+                        self.__slots[hash % self.__capacity] = slot
+
+                    # The growth is checked once the whole hash table is merged, so that the slots don't move meanwhile
+                    self.__count_insert(slot.size())
+                    slot.insert(node.key, node.value, hash)
+                    self.__size += 1
+                    self.__version += 1
+
+                    if self.__bloom is not None and self.__bloom.add(hash):
+                        self.__rebuild_bloom_filter()
+
+                    if self.__index is not None:
+                        self.__index.add(node.key) # type: ignore[arg-type]
+                elif override or (expired and node.key in expired):
+                    existing_node.value = node.value
+                else:
+                    node = node.next
+                    continue
+
+                if timed:
+                    deadline = other_deadlines.get(node.key) if other_deadlines is not None else None
+                    self.__set_deadline(node.key, None if deadline is None else deadline - other_now)
+
+                node = node.next
+
+        capacity = self.__capacity
 
-        for char in key:
-            hash = hash * 31 + ord(char.encode("utf-8"))
+        while self.__size > capacity * self.__max_load_factor:
+            capacity *= 2
 
-        return hash % self.__capacity
+        if capacity != self.__capacity:
+            self.__start_resize(capacity)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterator
+
+
+class HashTableView:
+    def __init__(self, iterate: Callable[[], Iterator[Any]], size: Callable[[], int], contains: Callable[[Any], bool]) -> None:
+        """
+        Initializes a live view over the keys, values or key-value pairs of a hash table.
+        Nothing is copied : each iteration lazily walks the slots of the hash table, and reflects its current content.
+
+        Parameters :
+            - iterate (Callable[[], Iterator[Any]]) : The function starting a new walk of the hash table.
+            - size (Callable[[], int]) : The function returning the number of elements of the hash table.
+            - contains (Callable[[Any], bool]) : The function checking if an element is in the view.
+        """
+        self.__iterate = iterate
+        self.__size = size
+        self.__contains = contains
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Lazily iterates over the view. A runtime error is raised if the hash table changes size during the iteration. """
+        return self.__iterate()
+
+    def __len__(self) -> int:
+        """ Returns the number of elements of the view, in constant time. """
+        return self.__size()
+
+    def __contains__(self, element: Any) -> bool:
+        """ Checks if an element is in the view. """
+        return self.__contains(element)
+
+    def __repr__(self) -> str:
+        """ Returns the representation of the view, listing its elements. """
+        return f"{type(self).__name__}({list(self)})"
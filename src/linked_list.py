@@ -1,105 +1,109 @@
 from __future__ import annotations
-from typing import Any, List, Tuple
+from typing import Any, Hashable, List, Tuple
 from node import Node
 
 class LinkedList:
+    # No per-instance dictionary, a hash table holds one linked list per non-empty slot
+    __slots__ = ("__head", "__tail", "__size")
+
     def __init__(self) -> None:
-        """ Initialization of an empty linked list. """
+        """ Initialization of an empty singly linked list, keeping its tail to append in constant time. """
         self.__head: Node | None = None
         self.__tail: Node | None = None
+        self.__size = 0
 
-    def insert(self, key: str, value: Any | None) -> None:
+    def insert(self, key: Hashable, value: Any | None, hash: int | None = None) -> None:
         """
         Inserts a new node at the end of the linked list.
         
         Parameters :
-            - key (str) : The key of the value to add.
+            - key (Hashable) : The key of the value to add.
             - value (Any | None) : The value to add in the linked list.
+            - hash (int | None) : The full hash of the key to store in the node (Optional). Defaults to None.
         
         Returns :
             None is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None :
             Preconditions :
-                The key is not of type string.
+                The key is None.
             Postconditions :
                 A type error is raised.
             Invariants :
                 The linked list is not modified.
 
-        Behavior - The key is of type string :
+        Behavior - The key is not None :
             Preconditions :
-                The key is of type string.
+                The key is not None.
             Postconditions :
                 The key-value is inserted in the linked list as the new tail.
                 None is returned.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
             raise TypeError("Key is None")
-            
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string")
         
-        new_node = Node((key, value))
+        new_node = Node((key, value), hash=hash)
         if self.__head is None:
             self.__head = new_node
             self.__tail = new_node
         else:
             self.__tail.next = new_node # type: ignore[reportOptionalMemberAccess]
-            new_node.prev = self.__tail
             self.__tail = new_node
 
-    def update(self, key: str, value: Any | None) -> Any | None:
+        self.__size += 1
+
+    def update(self, key: Hashable, value: Any | None, hash: int | None = None) -> Any | None:
         """
         Updates a given key with the new value.
         
         Parameters :
-            - key (str) : The key of the value to update.
+            - key (Hashable) : The key of the value to update.
             - value (Any | None) : The new value of the key.
+            - hash (int | None) : The full hash of the key, compared before the key itself (Optional). Defaults to None.
         
         Returns :
             The old value is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None :
             Preconditions :
-                The key is not of type string.
+                The key is None.
             Postconditions :
                 A type error is raised.
             Invariants :
                 The linked list is not modified.
 
-        Behavior - The key is of type string :
+        Behavior - The key is not None :
             Preconditions :
-                The key is of type string.
+                The key is not None.
             Postconditions :
                 The value of the key is updated.
                 The old value of the key is returned.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
             raise TypeError("Key is None")
-            
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string")
         
-        for node in self.__as_list():
-            if node.key == key:
-                old_value = node.value
-                node.value = value
-                return old_value
+        node = self.find(key, hash)
+
+        if node is not None:
+            old_value = node.value
+            node.value = value
+            return old_value
     
-    def remove(self, key: str) -> Any | None:
+    def remove(self, key: Hashable, hash: int | None = None, default: Any | None = None) -> Any | None:
         """
         Removes the key-value corresponding to the given key.
         
         Parameters :
-            - key (str) : The key to remove.
+            - key (Hashable) : The key to remove.
+            - hash (int | None) : The full hash of the key, compared before the key itself (Optional). Defaults to None.
+            - default (Any | None) : A default value to return if the key doesn't exist (Optional). Defaults to None.
         
         Returns :
-            If the key exists, the old value is returned. Else, None is returned.
+            If the key exists, the old value is returned. Else, the default value is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None :
             Preconditions :
-                The key is not of type string.
+                The key is None.
             Postconditions :
                 A type error is raised.
             Invariants :
@@ -109,7 +113,7 @@ class LinkedList:
             Preconditions :
                 The key doesn't exist in the linked list.
             Postconditions :
-                None is returned.
+                If set, the default value is returned, otherwise returns None.
             Invariants :
                 The linked list is not modified.
 
@@ -121,42 +125,46 @@ class LinkedList:
                 The old value is returned.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
-        
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
+            raise TypeError("Key is expected to be hashable, None received.")
         
-        for node in self.__as_list():
-            if node.key == key:
-                if node.has_prev() and node.has_next():   # In the middle
-                    node.prev.next = node.next # type: ignore[reportOptionalMemberAccess]
-                    node.next.prev = node.prev # type: ignore[reportOptionalMemberAccess]
-                elif node.has_prev():                    # Last element
-                    self.__tail = node.prev
-                    self.__tail.next = None # type: ignore[reportOptionalMemberAccess]
-                elif node.has_next():                    # First element
-                    self.__head = node.next
-                    self.__head.prev = None # type: ignore[reportOptionalMemberAccess]
-                else:                                   # Only element
-                    self.__head = None
-                    self.__tail = None
-
-                return node.value
-
-    def get(self, key: str, default: Any | None = None) -> Any | None:
+        previous_node = None
+        node = self.__head
+
+        # Without previous references, the predecessor is tracked during the walk
+        while node is not None and not ((hash is None or node.hash == hash) and node.key == key):
+            previous_node = node
+            node = node.next
+
+        if node is None:
+            return default
+
+        if previous_node is None:   # First element
+            self.__head = node.next
+        else:
+            previous_node.next = node.next
+
+        if node is self.__tail:     # Last element
+            self.__tail = previous_node
+
+        self.__size -= 1
+
+        return node.value
+
+    def get(self, key: Hashable, default: Any | None = None, hash: int | None = None) -> Any | None:
         """
         Retrieves the value with the given key, or a default value if the key doesn't exist.
         
         Parameters :
-            - key (str) : The key of the value to retrieve.
+            - key (Hashable) : The key of the value to retrieve.
             - default (Any | None) : A default value to return if the key doesn't exist (Optional). Defaults to None.
+            - hash (int | None) : The full hash of the key, compared before the key itself (Optional). Defaults to None.
         
         Returns :
             If the key exists, the value of the key is returned. Else, the default value is returned.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None :
             Preconditions :
-                The key is not of type string.
+                The key is None.
             Postconditions :
                 A type error is raised.
 
@@ -173,42 +181,77 @@ class LinkedList:
                 The value of given key is returned from the linked list.
         """
         if key is None: # type: ignore[reportOptionalMemberAccess]
-            raise TypeError("Key is expected to be of type string, None received.")
-        
-        if type(key) != str:
-            raise TypeError("Key is expected to be of type string.")
+            raise TypeError("Key is expected to be hashable, None received.")
             
-        for node in self.__as_list():
-            if node.key == key:
-                return node.value
-            
-        return default
+        node = self.find(key, hash)
+
+        if node is None:
+            return default
+
+        return node.value
 
-    def __as_list(self) -> List[Node]:
-        """ Returns the nodes of the linked list as a list. """
-        nodes_list: List[Node] = []
+    def find(self, key: Hashable, hash: int | None = None) -> Node | None:
+        """
+        Walks the linked list until the node of the given key, without allocating anything.
+        
+        Parameters :
+            - key (Hashable) : The key of the node to find.
+            - hash (int | None) : The full hash of the key, compared before the key itself (Optional). Defaults to None, comparing the keys only.
+        
+        Returns :
+            The node of the key if it exists, None otherwise.
+        """
+        current_node = self.__head
+
+        if hash is None:
+            while current_node is not None:
+                if current_node.key == key:
+                    return current_node
+                current_node = current_node.next
+        else:
+            while current_node is not None:
+                if current_node.hash == hash and current_node.key == key:
+                    return current_node
+                current_node = current_node.next
+
+        return None
+
+    def probe_length(self, key: Hashable, hash: int | None = None) -> int:
+        """ Returns the number of nodes a search of the given key visits : its position, or the size if it doesn't exist. """
         current_node = self.__head
+        probes = 0
 
         while current_node is not None:
-            nodes_list.append(current_node)
+            probes += 1
+
+            if current_node.key == key and (hash is None or current_node.hash == hash):
+                return probes
+
             current_node = current_node.next
 
-        return nodes_list
+        return probes
+
+    def head(self) -> Node | None:
+        """ Returns the first node of the linked list, to walk it without any allocation. """
+        return self.__head
 
     def size(self) -> int:
         """ Returns the number of elements inside the linked list. """
-        return len(self.__as_list())
+        return self.__size
     
     def is_empty(self) -> bool:
         """ Checks if the linked list is empty or not. """
-        return self.size() == 0
+        return self.__head is None
     
-    def keys(self) -> List[str]:
+    def keys(self) -> List[Hashable]:
         """ Returns the keys of the linked list as a list. """
-        keys: List[str] = []
+        keys: List[Hashable] = []
+
+        node = self.__head
 
-        for node in self.__as_list():
+        while node is not None:
             keys.append(node.key)
+            node = node.next
 
         return keys
     
@@ -216,17 +259,35 @@ class LinkedList:
         """ Returns the values of the linked list as a list. """
         values: List[Any] = []
 
-        for node in self.__as_list():
+        node = self.__head
+
+        while node is not None:
             values.append(node.value)
+            node = node.next
 
         return values
     
-    def entries(self) -> List[Tuple[str, Any]]:
+    def entries(self) -> List[Tuple[Hashable, Any]]:
         """ Returns the key-value pairs of the linked list as a list. """
-        entries: List[Tuple[str, Any]] = []
+        entries: List[Tuple[Hashable, Any]] = []
+
+        node = self.__head
 
-        for node in self.__as_list():
+        while node is not None:
             entries.append((node.key, node.value))
+            node = node.next
+
+        return entries
+    
+    def hashed_entries(self) -> List[Tuple[int | None, Hashable, Any]]:
+        """ Returns the stored hashes along with the key-value pairs of the linked list as a list. """
+        entries: List[Tuple[int | None, Hashable, Any]] = []
+
+        node = self.__head
+
+        while node is not None:
+            entries.append((node.hash, node.key, node.value))
+            node = node.next
 
         return entries
     
@@ -234,29 +295,42 @@ class LinkedList:
         """ Clears the linked list. """
         self.__head = None
         self.__tail = None
+        self.__size = 0
 
     def clone(self) -> LinkedList:
         """ Deeply clones the current linked list as a new one. """
         clone = LinkedList()
+        node = self.__head
         
-        for node in self.__as_list():
-            clone.insert(node.key, node.value)
+        while node is not None:
+            new_node = Node((node.key, node.value), None, node.hash)
+
+            if clone.__tail is None:
+                clone.__head = new_node
+            else:
+                clone.__tail.next = new_node
+
+            clone.__tail = new_node
+            node = node.next
+
+        clone.__size = self.__size
 
         return clone
     
-    def contains(self, key: str) -> bool:
+    def contains(self, key: Hashable, hash: int | None = None) -> bool:
         """
         Checks if a given key exists in the linked list.
         
         Parameters :
-            - key (str) : The key to check.
+            - key (Hashable) : The key to check.
+            - hash (int | None) : The full hash of the key, compared before the key itself (Optional). Defaults to None.
         
         Returns :
             True if the key exists in the linked list, False otherwise.
             
-        Behavior - The key is not of type string :
+        Behavior - The key is None :
             Preconditions :
-                The key is not of type string.
+                The key is None.
             Postconditions :
                 A type error is raised.
 
@@ -272,8 +346,4 @@ class LinkedList:
             Postconditions :
                 True is returned.
         """
-        for k in self.keys():
-            if k == key:
-                return True
-            
-        return False
+        return self.find(key, hash) is not None
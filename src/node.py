@@ -1,30 +1,29 @@
 from __future__ import annotations
-from typing import Any, Tuple
+from typing import Any, Hashable, Tuple
 
 
 class Node:
-    def __init__(self, value: Tuple[str, Any | None], prev: Node | None = None, next: Node | None = None) -> None:
+    # No per-instance dictionary, each node only holds these four references
+    __slots__ = ("key", "value", "next", "hash")
+
+    def __init__(self, value: Tuple[Hashable, Any | None], next: Node | None = None, hash: int | None = None) -> None:
         """
-        Initializes an element of a linked list.
+        Initializes an element of a singly linked list.
 
-        Parameters : 
-            - value (Tuple[str, Any | None]) : The key-value to store in the node.
-            - prev (Node | None) : The reference to the previous node (Optional). Defaults to None.
+        Parameters :
+            - value (Tuple[Hashable, Any | None]) : The key-value to store in the node.
             - next (Node | None) :The reference to the next node (Optional). Defaults to None.
+            - hash (int | None) : The full hash of the key, kept so it is never recomputed (Optional). Defaults to None.
         """
-        self.key: str = value[0]
+        self.key: Hashable = value[0]
         self.value: Any = value[1]
-        self.prev: Node | None = prev
         self.next: Node | None = next
-
-    def has_prev(self) -> bool:
-        """ Checks if the current node references a previous node. """
-        return self.prev is not None
+        self.hash: int | None = hash
 
     def has_next(self) -> bool:
         """ Checks if the current node references a next node. """
         return self.next is not None
-    
+
     def clone(self):
-        """ Deeply clones the current node as a new one, retaining its previous and next node references. """
-        return Node((self.key, self.value), self.prev, self.next)
+        """ Deeply clones the current node as a new one, retaining its next node reference. """
+        return Node((self.key, self.value), self.next, self.hash)
@@ -0,0 +1,363 @@
+from __future__ import annotations
+from typing import Any, Callable, Hashable, Iterator, List, Tuple
+import sys
+
+
+class OpenAddressing:
+    # Probe sequences of a linear probing table degrade quickly once it is almost full
+    MAX_LOAD_FACTOR = 0.9
+
+    def __init__(self, capacity: int = 12, min_load_factor: float = 0.1, max_load_factor: float = MAX_LOAD_FACTOR) -> None:
+        """
+        Initialization of an empty open addressing storage, using Robin Hood linear probing.
+        The entries are stored in three flat parallel lists of hashes, keys and values, an empty slot having a None hash.
+
+        Parameters :
+            - capacity (int) : The initial number of slots (Optional). Defaults to 12.
+            - min_load_factor (float) : The load factor under which the storage shrinks (Optional). Defaults to 0.1.
+            - max_load_factor (float) : The load factor above which the storage grows (Optional). Capped to 0.9.
+        """
+        self.__initial_capacity = capacity
+        self.__min_load_factor = min_load_factor
+        self.__max_load_factor = min(max_load_factor, OpenAddressing.MAX_LOAD_FACTOR)
+        self.__size = 0
+        # Called with the old and new capacities before a resize, then with nothing once it is done
+        self.__resize_listeners: Tuple[Callable[[int, int], None], Callable[[], None]] | None = None
+        self.__allocate(capacity)
+
+    def __allocate(self, capacity: int) -> None:
+        """ Replaces the parallel lists by empty ones of the given capacity. """
+        self.__capacity = capacity
+        self.__hashes: List[int | None] = [None] * capacity
+        self.__keys: List[Hashable | None] = [None] * capacity
+        self.__values: List[Any] = [None] * capacity
+
+    def find(self, key: Hashable, hash: int) -> int:
+        """
+        Searches the slot index of the given key.
+
+        Parameters :
+            - key (Hashable) : The key to search.
+            - hash (int) : The full hash of the key.
+
+        Returns :
+            The index of the slot holding the key, or -1 if the key doesn't exist.
+
+        Behavior - The key doesn't exist :
+            Preconditions :
+                The key doesn't exist in the storage.
+            Postconditions :
+                -1 is returned as soon as an empty slot or a slot closer to its home than the probed key is reached.
+        """
+        hashes = self.__hashes
+        capacity = self.__capacity
+        index = hash % capacity
+        distance = 0
+
+        while True:
+            current_hash = hashes[index]
+
+            if current_hash is None or (index - current_hash) % capacity < distance:
+                return -1
+
+            if current_hash == hash and self.__keys[index] == key:
+                return index
+
+            index = (index + 1) % capacity
+            distance += 1
+
+    def probe_length(self, key: Hashable, hash: int) -> int:
+        """ Returns the number of slots a search of the given key visits, the last one included. """
+        hashes = self.__hashes
+        capacity = self.__capacity
+        index = hash % capacity
+        distance = 0
+
+        while True:
+            current_hash = hashes[index]
+
+            if current_hash is None or (index - current_hash) % capacity < distance:
+                return distance + 1
+
+            if current_hash == hash and self.__keys[index] == key:
+                return distance + 1
+
+            index = (index + 1) % capacity
+            distance += 1
+
+    def get(self, key: Hashable, hash: int, default: Any | None = None) -> Any | None:
+        """
+        Retrieves the value with the given key, or a default value if the key doesn't exist.
+
+        Parameters :
+            - key (Hashable) : The key of the value to retrieve.
+            - hash (int) : The full hash of the key.
+            - default (Any | None) : A default value to return if the key doesn't exist (Optional). Defaults to None.
+
+        Returns :
+            If the key exists, the value of the key is returned. Else, the default value is returned.
+        """
+        index = self.find(key, hash)
+
+        return default if index == -1 else self.__values[index]
+
+    def value_at(self, index: int) -> Any | None:
+        """ Returns the value stored in the slot at the given index. """
+        return self.__values[index]
+
+    def replace_at(self, index: int, value: Any | None) -> Any | None:
+        """ Replaces the value stored in the slot at the given index and returns the old one. """
+        old_value = self.__values[index]
+        self.__values[index] = value
+
+        return old_value
+
+    def insert(self, key: Hashable, hash: int, value: Any | None) -> None:
+        """
+        Inserts a new key-value, the key being expected not to exist yet.
+        Richer entries (far from their home slot) take the place of poorer ones along the probe sequence.
+
+        Parameters :
+            - key (Hashable) : The key of the value to add.
+            - hash (int) : The full hash of the key.
+            - value (Any | None) : The value to add.
+        """
+        if self.__size + 1 > self.__capacity * self.__max_load_factor:
+            self.__resize(self.__capacity * 2)
+
+        self.__place(hash, key, value, hash % self.__capacity, 0)
+        self.__size += 1
+
+    def probe_insert(self, key: Hashable, hash: int) -> Tuple[int, bool]:
+        """
+        Searches the slot index of the given key, inserting the key with a None value where the search stopped if it doesn't exist.
+        Both the search and the insertion are done with a single probe sequence.
+
+        Parameters :
+            - key (Hashable) : The key to search.
+            - hash (int) : The full hash of the key.
+
+        Returns :
+            A tuple with the index of the slot holding the key, and whether the key was inserted.
+        """
+        hashes = self.__hashes
+        capacity = self.__capacity
+        index = hash % capacity
+        distance = 0
+
+        while True:
+            current_hash = hashes[index]
+
+            if current_hash is None or (index - current_hash) % capacity < distance:
+                break
+
+            if current_hash == hash and self.__keys[index] == key:
+                return index, False
+
+            index = (index + 1) % capacity
+            distance += 1
+
+        self.__size += 1
+
+        if self.__size > self.__capacity * self.__max_load_factor:
+            self.__resize(self.__capacity * 2)
+            return self.__place(hash, key, None, hash % self.__capacity, 0), True
+
+        return self.__place(hash, key, None, index, distance), True
+
+    def __place(self, hash: int, key: Hashable | None, value: Any | None, index: int, distance: int) -> int:
+        """
+        Places an entry with Robin Hood probing, without checking the load factor.
+
+        Parameters :
+            - hash (int) : The full hash of the entry's key.
+            - key (Hashable) : The key of the entry.
+            - value (Any | None) : The value of the entry.
+            - index (int) : The index of the slot from which to probe.
+            - distance (int) : The distance between this slot and the home slot of the entry.
+
+        Returns :
+            The index of the slot in which the entry was placed.
+        """
+        hashes = self.__hashes
+        keys = self.__keys
+        values = self.__values
+        capacity = self.__capacity
+        placed_index = -1
+
+        while True:
+            current_hash = hashes[index]
+
+            if current_hash is None:
+                hashes[index] = hash
+                keys[index] = key
+                values[index] = value
+                return index if placed_index == -1 else placed_index
+
+            current_distance = (index - current_hash) % capacity
+
+            if current_distance < distance:
+                hashes[index], hash = hash, current_hash
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                distance = current_distance
+
+                if placed_index == -1:
+                    placed_index = index
+
+            index = (index + 1) % capacity
+            distance += 1
+
+    def remove(self, key: Hashable, hash: int) -> Tuple[bool, Any | None]:
+        """
+        Removes the key-value corresponding to the given key.
+        The following entries of the probe sequence are shifted backward, so no tombstone is left behind.
+
+        Parameters :
+            - key (Hashable) : The key to remove.
+            - hash (int) : The full hash of the key.
+
+        Returns :
+            A tuple telling if the key existed, and its old value (None if it didn't exist).
+        """
+        index = self.find(key, hash)
+
+        if index == -1:
+            return False, None
+
+        hashes = self.__hashes
+        keys = self.__keys
+        values = self.__values
+        capacity = self.__capacity
+        old_value = values[index]
+        next_index = (index + 1) % capacity
+
+        while hashes[next_index] is not None and (next_index - hashes[next_index]) % capacity != 0: # type: ignore[operator]
+            hashes[index] = hashes[next_index]
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            index = next_index
+            next_index = (next_index + 1) % capacity
+
+        hashes[index] = None
+        keys[index] = None
+        values[index] = None
+        self.__size -= 1
+
+        if self.__capacity > self.__initial_capacity and self.__size < self.__capacity * self.__min_load_factor:
+            self.__resize(max(self.__initial_capacity, self.__capacity // 2))
+
+        return True, old_value
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the storage at once so that the given number of additional entries fits without any resize.
+
+        Parameters :
+            - count (int) : The number of entries about to be inserted.
+        """
+        capacity = self.__capacity
+
+        while self.__size + count > capacity * self.__max_load_factor:
+            capacity *= 2
+
+        if capacity != self.__capacity:
+            self.__resize(capacity)
+
+    def __resize(self, capacity: int) -> None:
+        """ Reinserts every entry in new parallel lists of the given capacity, reusing the stored hashes. """
+        hashes = self.__hashes
+        keys = self.__keys
+        values = self.__values
+        listeners = self.__resize_listeners
+
+        if listeners is not None:
+            listeners[0](self.__capacity, capacity)
+
+        self.__allocate(capacity)
+
+        for index, hash in enumerate(hashes):
+            if hash is not None:
+                self.__place(hash, keys[index], values[index], hash % capacity, 0)
+
+        if listeners is not None:
+            listeners[1]()
+
+    def set_resize_listeners(self, on_start: Callable[[int, int], None] | None, on_finish: Callable[[], None] | None) -> None:
+        """ Sets the functions called before each resize with the old and new capacities, and after it. None removes them. """
+        self.__resize_listeners = (on_start, on_finish) if on_start is not None and on_finish is not None else None
+
+    def distance_histogram(self) -> List[int]:
+        """ Returns the number of entries per distance from their home slot, the entries in their home slot being at index 0. """
+        histogram = [0]
+        capacity = self.__capacity
+
+        for index, hash in enumerate(self.__hashes):
+            if hash is not None:
+                distance = (index - hash) % capacity
+
+                while distance >= len(histogram):
+                    histogram.append(0)
+
+                histogram[distance] += 1
+
+        return histogram
+
+    def size(self) -> int:
+        """ Returns the number of elements inside the storage. """
+        return self.__size
+
+    def memory_usage(self) -> int:
+        """ Returns the bytes used by the parallel lists, without the keys and values themselves. """
+        return sys.getsizeof(self.__hashes) + sys.getsizeof(self.__keys) + sys.getsizeof(self.__values)
+
+    def capacity(self) -> int:
+        """ Returns the number of slots of the storage. """
+        return self.__capacity
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of the storage as a list. """
+        return [key for key in self.__keys if key is not None]
+
+    def values(self) -> List[Any]:
+        """ Returns the values of the storage as a list. """
+        return [self.__values[index] for index, hash in enumerate(self.__hashes) if hash is not None]
+
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """ Returns the key-value pairs of the storage as a list. """
+        return [(self.__keys[index], self.__values[index]) for index, hash in enumerate(self.__hashes) if hash is not None] # type: ignore[misc]
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """ Lazily iterates over the key-value pairs of the storage. """
+        keys = self.__keys
+        values = self.__values
+
+        for index, hash in enumerate(self.__hashes):
+            if hash is not None:
+                yield keys[index], values[index] # type: ignore[misc]
+
+    def hashed_entries(self) -> List[Tuple[int, Hashable, Any]]:
+        """ Returns the stored hashes along with the key-value pairs of the storage as a list. """
+        return [(hash, self.__keys[index], self.__values[index]) for index, hash in enumerate(self.__hashes) if hash is not None] # type: ignore[misc]
+
+    def hashes(self) -> Iterator[int]:
+        """ Lazily iterates over the full hashes stored for the keys. """
+        for hash in self.__hashes:
+            if hash is not None:
+                yield hash
+
+    def clear(self) -> None:
+        """ Clears the storage, going back to its initial capacity. """
+        self.__size = 0
+        self.__allocate(self.__initial_capacity)
+
+    def clone(self) -> OpenAddressing:
+        """ Clones the current storage, copying the parallel lists as they are. """
+        clone = OpenAddressing(self.__initial_capacity, self.__min_load_factor, self.__max_load_factor)
+        clone.__capacity = self.__capacity
+        clone.__hashes = self.__hashes.copy()
+        clone.__keys = self.__keys.copy()
+        clone.__values = self.__values.copy()
+        clone.__size = self.__size
+
+        return clone
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import Any, List, Tuple
+import asyncio
+
+
+# RESP (REdis Serialization Protocol) version 2 : every command is an array of bulk strings, so that Redis clients
+# and redis-cli can talk to the server too
+CRLF = b"\r\n"
+OK = b"+OK\r\n"
+NULL = b"$-1\r\n"
+# A bulk string or array longer than this is rejected, so that a malformed header can't make the server buffer forever
+MAX_LENGTH = 512 * 2**20
+
+
+class ReplyError(Exception):
+    """ Raised by the client when the server answers a command with an error. """
+
+
+def encode_command(*arguments: bytes | str | int) -> bytes:
+    """ Encodes a command as an array of bulk strings, strings being encoded in UTF-8 and integers in decimal. """
+    parts = [b"*%d\r\n" % len(arguments)]
+
+    for argument in arguments:
+        if isinstance(argument, str):
+            argument = argument.encode("utf-8")
+        elif isinstance(argument, int):
+            argument = b"%d" % argument
+
+        parts.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+
+    return b"".join(parts)
+
+
+def _read_length(buffer: bytearray, offset: int, prefix: int) -> Tuple[int, int] | None:
+    """ Reads a "<prefix><length>\\r\\n" header, returning the length and the offset after it, or None if incomplete. """
+    end = buffer.find(CRLF, offset)
+
+    if end == -1:
+        if len(buffer) - offset > 32:
+            raise ValueError("Protocol error : header line too long.")
+
+        return None
+
+    if buffer[offset] != prefix:
+        raise ValueError(f"Protocol error : expected '{chr(prefix)}', got '{chr(buffer[offset])}'.")
+
+    try:
+        length = int(buffer[offset + 1:end])
+    except ValueError:
+        raise ValueError("Protocol error : invalid length.") from None
+
+    if length < 0:
+        raise ValueError("Protocol error : negative length.")
+
+    if length > MAX_LENGTH:
+        raise ValueError("Protocol error : length too large.")
+
+    return length, end + 2
+
+
+def parse_command(buffer: bytearray, offset: int = 0) -> Tuple[List[bytes], int] | None:
+    """
+    Parses a command sent as an array of bulk strings.
+
+    Parameters :
+        - buffer (bytearray) : The bytes received.
+        - offset (int) : The offset at which the command starts (Optional). Defaults to 0.
+
+    Returns :
+        A tuple with the arguments of the command and the offset right after it, or None if the command isn't complete yet.
+
+    Behavior - The bytes are not a command :
+        Preconditions :
+            The bytes at the offset are not an array of bulk strings, or a length is negative.
+        Postconditions :
+            A value error is raised.
+    """
+    header = _read_length(buffer, offset, ord("*"))
+
+    if header is None:
+        return None
+
+    count, offset = header
+    arguments: List[bytes] = []
+
+    for _ in range(count):
+        if offset >= len(buffer):
+            return None
+
+        header = _read_length(buffer, offset, ord("$"))
+
+        if header is None:
+            return None
+
+        length, offset = header
+
+        if offset + length + 2 > len(buffer):
+            return None
+
+        arguments.append(bytes(buffer[offset:offset + length]))
+        offset += length + 2
+
+    return arguments, offset
+
+
+def encode_bulk(value: bytes | None) -> bytes:
+    """ Encodes a bulk string reply, None being the null bulk string. """
+    if value is None:
+        return NULL
+
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def encode_integer(value: int) -> bytes:
+    """ Encodes an integer reply. """
+    return b":%d\r\n" % value
+
+
+def encode_array(values: List[bytes | None]) -> bytes:
+    """ Encodes an array reply of bulk strings. """
+    return b"*%d\r\n" % len(values) + b"".join(encode_bulk(value) for value in values)
+
+
+def encode_error(message: str) -> bytes:
+    """ Encodes an error reply, on a single line. """
+    return b"-ERR %s\r\n" % message.replace("\r", " ").replace("\n", " ").encode("utf-8")
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """
+    Reads a reply of the server.
+
+    Parameters :
+        - reader (asyncio.StreamReader) : The stream of the connection.
+
+    Returns :
+        The bytes of a bulk string, None for the null bulk string, a string for a simple string, an integer,
+        or a list of replies for an array. An error reply is returned as a ReplyError, to be raised by the caller.
+
+    Behavior - The connection is closed :
+        Preconditions :
+            The server closes the connection before the reply is complete.
+        Postconditions :
+            An asyncio.IncompleteReadError is raised.
+    """
+    line = await reader.readuntil(CRLF)
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix == b"$":
+        length = int(payload)
+
+        if length == -1:
+            return None
+
+        return (await reader.readexactly(length + 2))[:-2]
+
+    if prefix == b":":
+        return int(payload)
+
+    if prefix == b"+":
+        return payload.decode("utf-8")
+
+    if prefix == b"-":
+        return ReplyError(payload.decode("utf-8"))
+
+    if prefix == b"*":
+        count = int(payload)
+
+        if count == -1:
+            return None
+
+        return [await read_reply(reader) for _ in range(count)]
+
+    raise ValueError(f"Protocol error : unexpected reply {line!r}.")
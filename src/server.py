@@ -0,0 +1,262 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List
+import argparse
+import asyncio
+import os
+from hash_table import HashTable
+from resp import OK, encode_array, encode_bulk, encode_error, encode_integer, parse_command
+
+
+# Marks a missing entry, as None is a valid value
+_MISSING = object()
+
+
+class _WrongArity(Exception):
+    """ Raised by a command receiving the wrong number of arguments. """
+
+
+class _Connection(asyncio.Protocol):
+    """ Serves the commands of a client connection, answering a whole pipelined batch with a single write. """
+
+    def __init__(self, server: HashTableServer) -> None:
+        self.__server = server
+        self.__buffer = bytearray()
+        self.__transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """ Keeps the transport of the new connection. """
+        self.__transport = transport # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        """ Runs every complete command received, keeping an incomplete one for the next data. """
+        buffer = self.__buffer
+        buffer += data
+        replies: List[bytes] = []
+        offset = 0
+
+        while offset < len(buffer):
+            try:
+                command = parse_command(buffer, offset)
+
+                # A command always moves forward, otherwise the same bytes would be parsed forever
+                if command is not None and command[1] <= offset:
+                    raise ValueError("Protocol error : command didn't advance.")
+            except ValueError as error:
+                # The rest of the stream can't be framed anymore, so the connection is closed after the error
+                replies.append(encode_error(str(error)))
+                self.__transport.write(b"".join(replies)) # type: ignore[union-attr]
+                self.__transport.close() # type: ignore[union-attr]
+                return
+
+            if command is None:
+                break
+
+            arguments, offset = command
+            replies.append(self.__server.execute(arguments))
+
+        del buffer[:offset]
+
+        if replies:
+            self.__transport.write(b"".join(replies)) # type: ignore[union-attr]
+
+
+class HashTableServer:
+    def __init__(self, hash_table: HashTable | None = None) -> None:
+        """
+        Initializes a server sharing a single hash table with its clients, over TCP or a Unix socket.
+        The protocol is RESP version 2 : each command is an array of bulk strings, so Redis clients work too.
+        A client may send many commands without waiting for their replies (pipelining), the replies coming back in order.
+        Every command runs on the event loop's thread, one after the other, so the hash table needs no lock.
+
+        The keys are decoded as UTF-8 strings, the values are stored as the bytes received.
+        Commands (a Redis name, and the HashTable one when it differs) :
+            - PING : Replies PONG.
+            - GET / get key : The value, or a null bulk string if the key doesn't exist.
+            - SET / put key value : Stores the value, replies OK.
+            - DEL / remove key [key ...] : Removes the keys, replies the number that existed.
+            - EXISTS / contains key [key ...] : Replies the number of keys that exist.
+            - MGET / get_many key [key ...] : The values, as an array.
+            - MSET / put_many key value [key value ...] : Stores the values, replies OK.
+            - DBSIZE / size : Replies the number of keys.
+            - FLUSHDB / clear : Removes every key, replies OK.
+
+        Parameters :
+            - hash_table (HashTable | None) : The hash table to serve (Optional). Defaults to None, a new empty one.
+        """
+        self.__hash_table = hash_table if hash_table is not None else HashTable()
+        self.__server: asyncio.AbstractServer | None = None
+        self.__commands: Dict[bytes, Callable[[List[str], List[bytes]], bytes]] = {}
+
+        for names, command in (
+            ((b"GET",), self.__get),
+            ((b"SET", b"PUT"), self.__put),
+            ((b"DEL", b"REMOVE"), self.__remove),
+            ((b"EXISTS", b"CONTAINS"), self.__contains),
+            ((b"MGET", b"GET_MANY"), self.__get_many),
+            ((b"MSET", b"PUT_MANY"), self.__put_many),
+            ((b"DBSIZE", b"SIZE"), self.__size),
+            ((b"FLUSHDB", b"CLEAR"), self.__clear),
+            ((b"PING",), self.__ping),
+        ):
+            for name in names:
+                self.__commands[name] = command
+
+    def execute(self, arguments: List[bytes]) -> bytes:
+        """
+        Runs a command on the hash table.
+
+        Parameters :
+            - arguments (List[bytes]) : The name of the command followed by its arguments.
+
+        Returns :
+            The encoded reply, an error reply if the command is unknown, has the wrong number of arguments,
+            or if the hash table raises an exception, with its message.
+        """
+        if not arguments:
+            return encode_error("empty command")
+
+        command = self.__commands.get(arguments[0].upper())
+
+        if command is None:
+            return encode_error(f"unknown command '{arguments[0].decode('utf-8', 'replace')}'")
+
+        try:
+            return command([argument.decode("utf-8", "surrogateescape") for argument in arguments[1:]], arguments[1:])
+        except _WrongArity:
+            return encode_error(f"wrong number of arguments for '{arguments[0].decode('utf-8', 'replace').lower()}'")
+        except Exception as error:
+            return encode_error(f"{type(error).__name__}: {error}")
+
+    @staticmethod
+    def __expect(condition: bool) -> None:
+        """ Rejects a command whose number of arguments is wrong. """
+        if not condition:
+            raise _WrongArity()
+
+    @staticmethod
+    def __encode_value(value: Any) -> bytes | None:
+        """ Returns the bytes sent for a stored value : the value itself if it is bytes, its text otherwise. """
+        if value is None or isinstance(value, bytes):
+            return value
+
+        return str(value).encode("utf-8")
+
+    def __get(self, keys: List[str], _: List[bytes]) -> bytes:
+        """ GET key : replies the value of the key, or a null bulk string. """
+        self.__expect(len(keys) == 1)
+        return encode_bulk(self.__encode_value(self.__hash_table.get(keys[0])))
+
+    def __put(self, keys: List[str], raw: List[bytes]) -> bytes:
+        """ SET key value : stores the value. """
+        self.__expect(len(keys) == 2)
+        self.__hash_table.put(keys[0], raw[1])
+        return OK
+
+    def __remove(self, keys: List[str], _: List[bytes]) -> bytes:
+        """ DEL key [key ...] : removes the keys, replying how many existed. """
+        self.__expect(len(keys) >= 1)
+        return encode_integer(sum(self.__hash_table.pop(key, _MISSING) is not _MISSING for key in keys))
+
+    def __contains(self, keys: List[str], _: List[bytes]) -> bytes:
+        """ EXISTS key [key ...] : replies how many of the keys exist. """
+        self.__expect(len(keys) >= 1)
+        return encode_integer(sum(self.__hash_table.contains_many(keys)))
+
+    def __get_many(self, keys: List[str], _: List[bytes]) -> bytes:
+        """ MGET key [key ...] : replies the values of the keys. """
+        self.__expect(len(keys) >= 1)
+        return encode_array([self.__encode_value(value) for value in self.__hash_table.get_many(keys)])
+
+    def __put_many(self, keys: List[str], raw: List[bytes]) -> bytes:
+        """ MSET key value [key value ...] : stores the values. """
+        self.__expect(len(keys) >= 2 and len(keys) % 2 == 0)
+        self.__hash_table.put_many(zip(keys[::2], raw[1::2]))
+        return OK
+
+    def __size(self, keys: List[str], _: List[bytes]) -> bytes:
+        """ DBSIZE : replies the number of keys. """
+        self.__expect(len(keys) == 0)
+        return encode_integer(self.__hash_table.size())
+
+    def __clear(self, keys: List[str], _: List[bytes]) -> bytes:
+        """ FLUSHDB : removes every key. """
+        self.__expect(len(keys) == 0)
+        self.__hash_table.clear()
+        return OK
+
+    def __ping(self, keys: List[str], raw: List[bytes]) -> bytes:
+        """ PING [message] : replies PONG, or the message. """
+        self.__expect(len(keys) <= 1)
+        return encode_bulk(raw[0]) if raw else b"+PONG\r\n"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 6380, path: str | None = None) -> None:
+        """
+        Starts listening, the connections being served by the running event loop.
+
+        Parameters :
+            - host (str) : The TCP address to listen on (Optional). Defaults to "127.0.0.1".
+            - port (int) : The TCP port (Optional). Defaults to 6380. With 0, a free port is picked, see address.
+            - path (str | None) : The path of a Unix socket to listen on instead of TCP (Optional). Defaults to None.
+        """
+        loop = asyncio.get_running_loop()
+
+        if path is not None:
+            if os.path.exists(path):
+                os.remove(path)
+
+            self.__server = await loop.create_unix_server(lambda: _Connection(self), path)
+        else:
+            self.__server = await loop.create_server(lambda: _Connection(self), host, port)
+
+    def address(self) -> Any:
+        """ Returns the address the server listens on : a (host, port) tuple for TCP, the socket path for a Unix socket. """
+        return self.__server.sockets[0].getsockname() # type: ignore[union-attr]
+
+    async def serve_forever(self) -> None:
+        """ Serves the connections until the task running it is cancelled. """
+        await self.__server.serve_forever() # type: ignore[union-attr]
+
+    async def close(self) -> None:
+        """ Stops listening and waits for the server to be closed. """
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    async def __aenter__(self) -> HashTableServer:
+        """ Returns the server, to be closed when leaving the async with statement. """
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        """ Stops listening. """
+        await self.close()
+
+
+def main() -> None:
+    """ Serves a hash table from the command line, loaded from a snapshot if one is given. """
+    parser = argparse.ArgumentParser(description="Serves a HashTable over the RESP protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6380)
+    parser.add_argument("--unix", default=None, help="The path of a Unix socket to listen on instead of TCP.")
+    parser.add_argument("--snapshot", default=None, help="A snapshot written by HashTable.save to serve.")
+    parser.add_argument("--storage", default="chained", choices=("chained", "open"))
+    arguments = parser.parse_args()
+
+    if arguments.snapshot is not None:
+        hash_table: HashTable = HashTable.open(arguments.snapshot, mmap=False) # type: ignore[assignment]
+    else:
+        hash_table = HashTable(storage=arguments.storage)
+
+    async def serve() -> None:
+        server = HashTableServer(hash_table)
+        await server.start(arguments.host, arguments.port, arguments.unix)
+        print(f"Serving on {server.address()}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
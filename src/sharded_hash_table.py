@@ -0,0 +1,295 @@
+from __future__ import annotations
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+import multiprocessing
+import os
+from hash_table import HashTable
+
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_64 = 0x9E3779B97F4A7C15
+
+# The hash table methods a shard accepts to run
+_COMMANDS = (
+    "get", "put", "remove", "contains", "size", "keys", "values", "entries", "clear",
+    "put_many", "get_many", "contains_many", "remove_many",
+)
+
+
+def _serve(connection: Connection, capacity: int, storage: str, hash_function: str, seed: int | None) -> None:
+    """
+    Runs a shard : a hash table living in its own process, executing the commands received on the connection.
+    An exception raised by a command is sent back instead of its result.
+
+    Parameters :
+        - connection (Connection) : The end of the pipe connected to the sharded hash table.
+        - capacity (int) : The initial capacity of the shard.
+        - storage (str) : The storage backend of the shard.
+        - hash_function (str) : The name of the built-in hash function of the shard.
+        - seed (int | None) : The seed of the hash function.
+    """
+    table = HashTable(capacity, storage=storage, hash_function=hash_function, seed=seed)
+
+    while True:
+        try:
+            command, arguments = connection.recv()
+        except EOFError:
+            return
+
+        if command == "close":
+            return
+
+        if command not in _COMMANDS:
+            connection.send((False, ValueError(f"Unknown command {command}.")))
+            continue
+
+        try:
+            connection.send((True, getattr(table, command)(*arguments)))
+        except Exception as exception:
+            connection.send((False, exception))
+
+
+class ShardedHashTable:
+    def __init__(
+        self,
+        shards: int | None = None,
+        capacity: int = 12,
+        storage: str = "chained",
+        hash_function: str = "builtin",
+        seed: int | None = None
+    ) -> None:
+        """
+        Initializes a new empty hash table partitioned across worker processes, each owning one shard.
+        A key always belongs to the same shard, chosen in this process from the high bits of the interpreter's hash of
+        the key multiplied by a 64 bits odd constant. The forked shards share the hash secret of this process, and index
+        their slots with the low bits of the hash : choosing the shard from them too would leave most of their slots empty.
+        The batch operations are split per shard and run by every shard in parallel.
+
+        Parameters :
+            - shards (int | None) : The number of shards, and so of processes (Optional). Defaults to the number of CPUs.
+            - capacity (int) : The initial capacity of each shard (Optional). Default to 12.
+            - storage (str) : The storage backend of the shards, "chained" or "open" (Optional). Defaults to "chained".
+            - hash_function (str) : The name of the built-in hash function of the shards (Optional). Defaults to "builtin".
+            - seed (int | None) : The seed of the hash function (Optional). Defaults to None, a random seed per shard.
+
+        Behavior - The number of shards is invalid :
+            Preconditions :
+                The number of shards is lower than 1.
+            Postconditions :
+                A value error is raised.
+        """
+        shards = shards if shards is not None else (os.cpu_count() or 1)
+
+        if shards < 1:
+            raise ValueError("Shards are expected to be at least 1.")
+
+        self.__shards = shards
+        self.__connections: List[Connection] = []
+        self.__processes: List[multiprocessing.Process] = []
+        # The number of replies each shard owes, a call interrupted before reading its reply leaving it in the pipe
+        self.__pending: List[int] = [0] * shards
+
+        for _ in range(shards):
+            connection, shard_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve,
+                args=(shard_connection, capacity, storage, hash_function, seed),
+                daemon=True
+            )
+            process.start()
+            shard_connection.close()
+            self.__connections.append(connection)
+            self.__processes.append(process)
+
+    def __shard(self, key: Hashable) -> int:
+        """ Returns the index of the shard owning the given key. """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        return (((hash(key) * GOLDEN_64) & MASK_64) >> 32) % self.__shards
+
+    def __call(self, shard: int, command: str, *arguments: Any) -> Any:
+        """ Runs a command on a shard and waits for its result. """
+        self.__send(shard, ForkingPickler.dumps((command, arguments)))
+
+        return self.__receive(shard)
+
+    def __broadcast(self, commands: Dict[int, Tuple[str, Tuple[Any, ...]]]) -> Dict[int, Any]:
+        """
+        Sends a command to several shards before waiting for any result, so that they run in parallel.
+        Every command is pickled before any is sent, so that a value that can't be pickled reaches no shard. Every result
+        is received before the first exception of a shard is raised.
+        """
+        payloads = {shard: ForkingPickler.dumps(command) for shard, command in commands.items()}
+
+        for shard, payload in payloads.items():
+            self.__send(shard, payload)
+
+        results: Dict[int, Any] = {}
+        error: Exception | None = None
+
+        for shard in commands:
+            try:
+                results[shard] = self.__receive(shard)
+            except Exception as exception:
+                if error is None:
+                    error = exception
+
+        if error is not None:
+            raise error
+
+        return results
+
+    def __send(self, shard: int, payload: bytes) -> None:
+        """
+        Sends a pickled command to a shard. The replies still owed by the shard are read and dropped first, so that
+        a reply left in the pipe by an interrupted call is never read as the result of a later command.
+        """
+        connection = self.__connections[shard]
+
+        while self.__pending[shard] > 0:
+            connection.recv()
+            self.__pending[shard] -= 1
+
+        connection.send_bytes(payload)
+        self.__pending[shard] += 1
+
+    def __receive(self, shard: int) -> Any:
+        """ Waits for the result of a command, raising the exception of the shard if the command failed. """
+        succeeded, result = self.__connections[shard].recv()
+        self.__pending[shard] -= 1
+
+        if not succeeded:
+            raise result
+
+        return result
+
+    def __partition(self, keys: List[Hashable]) -> Dict[int, List[int]]:
+        """ Groups the positions of a batch of keys by the shard owning them. """
+        positions: Dict[int, List[int]] = {}
+
+        for position, key in enumerate(keys):
+            positions.setdefault(self.__shard(key), []).append(position)
+
+        return positions
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """ Retrieves the value with the given key from its shard. See HashTable.get. """
+        return self.__call(self.__shard(key), "get", key, default)
+
+    def put(self, key: Hashable, value: Any | None, override: bool = True) -> Any | None:
+        """ Adds a new value with the given key in its shard. See HashTable.put. """
+        return self.__call(self.__shard(key), "put", key, value, override)
+
+    def remove(self, key: Hashable) -> Any | None:
+        """ Removes the key-value corresponding to the given key from its shard. See HashTable.remove. """
+        return self.__call(self.__shard(key), "remove", key)
+
+    def contains(self, key: Hashable) -> bool:
+        """ Checks if a given key exists in its shard. See HashTable.contains. """
+        return self.__call(self.__shard(key), "contains", key)
+
+    def put_many(self, entries: Iterable[Tuple[Hashable, Any | None]], override: bool = True) -> None:
+        """
+        Adds a batch of key-values, every shard inserting its own part in parallel. See HashTable.put_many.
+        Every key is validated before any shard is modified.
+        """
+        entries = list(entries)
+        positions = self.__partition([key for key, _ in entries])
+        self.__broadcast({
+            shard: ("put_many", ([entries[position] for position in shard_positions], override))
+            for shard, shard_positions in positions.items()
+        })
+
+    def get_many(self, keys: Iterable[Hashable], default: Any | None = None) -> List[Any | None]:
+        """ Retrieves the values of a batch of keys, every shard looking up its own part in parallel. See HashTable.get_many. """
+        return self.__gather("get_many", list(keys), default)
+
+    def contains_many(self, keys: Iterable[Hashable]) -> List[bool]:
+        """ Checks if each key of a batch exists, every shard checking its own part in parallel. See HashTable.contains_many. """
+        return self.__gather("contains_many", list(keys))
+
+    def remove_many(self, keys: Iterable[Hashable]) -> List[Any | None]:
+        """ Removes a batch of keys, every shard removing its own part in parallel. See HashTable.remove_many. """
+        return self.__gather("remove_many", list(keys))
+
+    def __gather(self, command: str, keys: List[Hashable], *arguments: Any) -> List[Any]:
+        """ Runs a batch command on every shard in parallel, and puts the results back in the order of the keys. """
+        positions = self.__partition(keys)
+        results = self.__broadcast({
+            shard: (command, ([keys[position] for position in shard_positions], *arguments))
+            for shard, shard_positions in positions.items()
+        })
+        ordered_results: List[Any] = [None] * len(keys)
+
+        for shard, shard_positions in positions.items():
+            for position, result in zip(shard_positions, results[shard]):
+                ordered_results[position] = result
+
+        return ordered_results
+
+    def __all(self, command: str) -> List[Any]:
+        """ Runs a command without arguments on every shard in parallel. """
+        return list(self.__broadcast({shard: (command, ()) for shard in range(self.__shards)}).values())
+
+    def size(self) -> int:
+        """ Returns the number of elements inside every shard. """
+        return sum(self.__all("size"))
+
+    def __len__(self) -> int:
+        """ Returns the number of elements inside every shard. """
+        return self.size()
+
+    def is_empty(self) -> bool:
+        """ Checks if every shard is empty. """
+        return self.size() == 0
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of every shard as a list. """
+        return self.__concatenate("keys")
+
+    def values(self) -> List[Any]:
+        """ Returns the values of every shard as a list. """
+        return self.__concatenate("values")
+
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """ Returns the key-value pairs of every shard as a list. """
+        return self.__concatenate("entries")
+
+    def __concatenate(self, command: str) -> List[Any]:
+        """ Concatenates the lists returned by a command run on every shard. """
+        result: List[Any] = []
+
+        for shard_result in self.__all(command):
+            result.extend(shard_result)
+
+        return result
+
+    def clear(self) -> None:
+        """ Clears every shard. """
+        self.__all("clear")
+
+    def close(self) -> None:
+        """ Stops the processes of the shards. The hash table can't be used anymore. """
+        for connection in self.__connections:
+            try:
+                connection.send(("close", ()))
+            except (BrokenPipeError, OSError):
+                pass
+
+            connection.close()
+
+        for process in self.__processes:
+            process.join()
+
+        self.__connections = []
+        self.__processes = []
+
+    def __enter__(self) -> ShardedHashTable:
+        """ Returns the sharded hash table, to be closed when leaving the with statement. """
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """ Stops the processes of the shards. """
+        self.close()
@@ -0,0 +1,339 @@
+from __future__ import annotations
+from typing import Any, Hashable, Iterable, Iterator, List, Tuple
+import mmap
+import os
+import pickle
+import struct
+from hash_functions import HASH_FUNCTIONS, MASK_64, make_hash
+
+
+# Snapshot layout :
+#   - header : magic, format version, storage, hash id, index hash id, capacity, size, seed
+#   - slot offset index : capacity + 1 offsets, the records of slot i spanning [offsets[i], offsets[i + 1])
+#   - records : hash, key type, key length, value length, encoded key, pickled value
+MAGIC = b"HTSN"
+VERSION = 2
+HEADER = struct.Struct("<4sBBBBQQQ")
+OFFSET = struct.Struct("<Q")
+RECORD = struct.Struct("<QBII")
+
+STORAGES = ("chained", "open")
+HASH_NAMES = tuple(HASH_FUNCTIONS)
+CUSTOM_HASH_ID = 0xFF
+
+# The key types a snapshot can hold, each with its own encoding : UTF-8 strings, raw bytes, signed little-endian integers
+KEY_STR = 0
+KEY_BYTES = 1
+KEY_INT = 2
+
+# Indexes the snapshot when the hash of the hash table can't be computed again by another process
+FALLBACK_HASH = "fnv1a"
+
+
+def hash_id(hash_function: str | None) -> int:
+    """ Returns the identifier stored in a snapshot for a built-in hash function, or for a custom hash if None. """
+    return CUSTOM_HASH_ID if hash_function is None else HASH_NAMES.index(hash_function)
+
+
+def hash_name(identifier: int) -> str | None:
+    """ Returns the built-in hash function of an identifier stored in a snapshot, or None for a custom hash. """
+    return None if identifier == CUSTOM_HASH_ID else HASH_NAMES[identifier]
+
+
+def is_portable(hash_function: str | None) -> bool:
+    """ Checks if a hash function gives the same hashes in every process, so that they can be stored. """
+    return hash_function is not None and hash_function != "builtin"
+
+
+def encode_key(key: Hashable) -> Tuple[int, bytes] | None:
+    """ Returns the type and bytes a key is stored with, or None if its type can't be stored. """
+    if type(key) == str:
+        return KEY_STR, key.encode("utf-8") # type: ignore[union-attr]
+
+    if type(key) == bytes:
+        return KEY_BYTES, key # type: ignore[return-value]
+
+    if type(key) == int:
+        return KEY_INT, key.to_bytes(key.bit_length() // 8 + 1, "little", signed=True) # type: ignore[union-attr]
+
+    return None
+
+
+def decode_key(key_type: int, key_bytes: bytes) -> Hashable:
+    """ Returns the key stored with the given type and bytes. """
+    if key_type == KEY_STR:
+        return key_bytes.decode("utf-8")
+
+    if key_type == KEY_BYTES:
+        return key_bytes
+
+    return int.from_bytes(key_bytes, "little", signed=True)
+
+
+def records_offset(capacity: int) -> int:
+    """ Returns the offset of the first record of a snapshot, right after its slot offset index. """
+    return HEADER.size + OFFSET.size * (capacity + 1)
+
+
+def write_snapshot(
+    path: str,
+    capacity: int,
+    size: int,
+    storage: str,
+    hash_function: str | None,
+    index_hash_function: str,
+    seed: int,
+    slots: Iterable[Iterable[Tuple[int, Hashable, Any]]]
+) -> None:
+    """
+    Writes a snapshot file, atomically replacing the given path once it is complete.
+
+    Parameters :
+        - path (str) : The path of the snapshot file.
+        - capacity (int) : The number of slots of the offset index.
+        - size (int) : The number of records.
+        - storage (str) : The storage backend of the saved hash table.
+        - hash_function (str | None) : The built-in hash function of the saved hash table, None for a custom hash.
+        - index_hash_function (str) : The built-in hash function giving the hashes of the records.
+        - seed (int) : The seed of both hash functions.
+        - slots (Iterable[Iterable[Tuple[int, Hashable, Any]]]) : The (hash, key, value) records of each slot, in slot order.
+          A record belongs to the slot of index hash % capacity.
+
+    Behavior - A key can't be stored :
+        Preconditions :
+            A key is not of type string, bytes or integer.
+        Postconditions :
+            A type error is raised.
+        Invariants :
+            The file at the given path is not modified.
+    """
+    temporary_path = f"{path}.tmp"
+    records_start = records_offset(capacity)
+    offsets: List[int] = []
+
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER.pack(
+                MAGIC,
+                VERSION,
+                STORAGES.index(storage),
+                hash_id(hash_function),
+                hash_id(index_hash_function),
+                capacity,
+                size,
+                seed & MASK_64
+            ))
+            file.seek(records_start)
+            offset = records_start
+
+            for slot in slots:
+                offsets.append(offset)
+
+                for hash, key, value in slot:
+                    encoded_key = encode_key(key)
+
+                    if encoded_key is None:
+                        raise TypeError(f"Key of type {type(key).__name__} can't be saved, only strings, bytes and integers can.")
+
+                    key_type, key_bytes = encoded_key
+                    value_bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                    file.write(RECORD.pack(hash, key_type, len(key_bytes), len(value_bytes)))
+                    file.write(key_bytes)
+                    file.write(value_bytes)
+                    offset += RECORD.size + len(key_bytes) + len(value_bytes)
+
+            offsets.append(offset)
+            file.seek(HEADER.size)
+            file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+        raise
+
+
+def read_header(buffer: Any) -> Tuple[str, str | None, str, int, int, int]:
+    """
+    Reads the header of a snapshot.
+
+    Parameters :
+        - buffer (Any) : The bytes of the snapshot, or a memory map over them.
+
+    Returns :
+        The storage, the hash function (None for a custom hash), the index hash function, the capacity, the size and the seed.
+
+    Behavior - The buffer is not a snapshot :
+        Preconditions :
+            The buffer doesn't start with the snapshot magic, or has an unknown format version.
+        Postconditions :
+            A value error is raised.
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("File is not a hash table snapshot.")
+
+    magic, version, storage, hash_function, index_hash_function, capacity, size, seed = HEADER.unpack_from(buffer, 0)
+
+    if magic != MAGIC:
+        raise ValueError("File is not a hash table snapshot.")
+
+    if version != VERSION:
+        raise ValueError(f"Snapshot format version {version} is not supported.")
+
+    return STORAGES[storage], hash_name(hash_function), HASH_NAMES[index_hash_function], capacity, size, seed
+
+
+def read_records(buffer: Any, start: int, end: int) -> Iterator[Tuple[int, Hashable, Any]]:
+    """ Lazily decodes the (hash, key, value) records between two offsets of a snapshot. """
+    while start < end:
+        hash, key_type, key_length, value_length = RECORD.unpack_from(buffer, start)
+        start += RECORD.size
+        key = decode_key(key_type, bytes(buffer[start:start + key_length]))
+        start += key_length
+        value = pickle.loads(buffer[start:start + value_length])
+        start += value_length
+
+        yield hash, key, value
+
+
+class MappedHashTable:
+    def __init__(self, path: str) -> None:
+        """
+        Opens a snapshot as a read-only hash table, served straight from a memory map of the file.
+        Only the header is read here : a lookup reads the offsets of a single slot and decodes the value it finds,
+        so opening takes the same time whatever the size of the snapshot.
+
+        Parameters :
+            - path (str) : The path of the snapshot file, written by HashTable.save.
+
+        Behavior - The file is not a snapshot :
+            Preconditions :
+                The file doesn't start with the snapshot magic, or has an unknown format version.
+            Postconditions :
+                A value error is raised.
+        """
+        with open(path, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            _, _, index_hash_function, self.__capacity, self.__size, seed = read_header(self.__map)
+        except ValueError:
+            self.__map.close()
+            raise
+
+        self.__hash = make_hash(index_hash_function, seed)
+
+    def __records(self, slot: int) -> Tuple[int, int]:
+        """ Returns the offsets between which the records of a slot are stored. """
+        return struct.unpack_from("<QQ", self.__map, HEADER.size + OFFSET.size * slot)
+
+    def __find(self, key: Hashable) -> int:
+        """ Returns the offset of the record holding the given key, or -1 if it doesn't exist. """
+        if key is None: # type: ignore[reportOptionalMemberAccess]
+            raise TypeError("Key is expected to be hashable, None received.")
+
+        hash = self.__hash(key)
+        encoded_key = encode_key(key)
+
+        # A key of a type a snapshot can't hold is never in it
+        if encoded_key is None:
+            return -1
+
+        key_type, key_bytes = encoded_key
+        start, end = self.__records(hash % self.__capacity)
+        buffer = self.__map
+
+        while start < end:
+            record_hash, record_key_type, key_length, value_length = RECORD.unpack_from(buffer, start)
+            key_start = start + RECORD.size
+
+            if (
+                record_hash == hash
+                and record_key_type == key_type
+                and key_length == len(key_bytes)
+                and buffer[key_start:key_start + key_length] == key_bytes
+            ):
+                return start
+
+            start = key_start + key_length + value_length
+
+        return -1
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """ Retrieves the value with the given key, decoding only this value. See HashTable.get. """
+        start = self.__find(key)
+
+        if start == -1:
+            return default
+
+        _, _, key_length, value_length = RECORD.unpack_from(self.__map, start)
+        value_start = start + RECORD.size + key_length
+
+        return pickle.loads(self.__map[value_start:value_start + value_length])
+
+    def contains(self, key: Hashable) -> bool:
+        """ Checks if a given key exists in the snapshot, without decoding its value. See HashTable.contains. """
+        return self.__find(key) != -1
+
+    def get_many(self, keys: Iterable[Hashable], default: Any | None = None) -> List[Any | None]:
+        """ Retrieves the values of a batch of keys. See HashTable.get_many. """
+        return [self.get(key, default) for key in keys]
+
+    def contains_many(self, keys: Iterable[Hashable]) -> List[bool]:
+        """ Checks if each key of a batch exists. See HashTable.contains_many. """
+        return [self.contains(key) for key in keys]
+
+    def size(self) -> int:
+        """ Returns the number of elements inside the snapshot. """
+        return self.__size
+
+    def __len__(self) -> int:
+        """ Returns the number of elements inside the snapshot. """
+        return self.__size
+
+    def is_empty(self) -> bool:
+        """ Checks if the snapshot is empty or not. """
+        return self.__size == 0
+
+    def get_capacity(self) -> int:
+        """ Returns the number of slots of the snapshot. """
+        return self.__capacity
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """ Lazily iterates over the key-value pairs of the snapshot, in file order. """
+        start, _ = self.__records(0)
+        _, end = self.__records(self.__capacity - 1)
+
+        for _, key, value in read_records(self.__map, start, end):
+            yield key, value
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """ Iterates over the keys of the snapshot. """
+        return (key for key, _ in self.items())
+
+    def keys(self) -> List[Hashable]:
+        """ Returns the keys of the snapshot as a list. """
+        return list(self)
+
+    def values(self) -> List[Any]:
+        """ Returns the values of the snapshot as a list. """
+        return [value for _, value in self.items()]
+
+    def entries(self) -> List[Tuple[Hashable, Any]]:
+        """ Returns the key-value pairs of the snapshot as a list. """
+        return list(self.items())
+
+    def close(self) -> None:
+        """ Releases the memory map. The hash table can't be used anymore. """
+        self.__map.close()
+
+    def __enter__(self) -> MappedHashTable:
+        """ Returns the mapped hash table, to be closed when leaving the with statement. """
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """ Releases the memory map. """
+        self.close()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, List
+from bisect import bisect_left, bisect_right, insort
+
+
+# The number of keys per chunk : an insertion or removal shifts at most twice as many keys
+CHUNK_SIZE = 512
+
+
+class SortedIndex:
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        """
+        Initializes a sorted index of string keys, to scan them in order, by range or by prefix.
+        The keys are kept in a sorted array cut into chunks of CHUNK_SIZE to 2 * CHUNK_SIZE keys, along with the last
+        key of each chunk : an insertion or removal bisects the last keys to find its chunk, then shifts the keys of
+        that chunk only. A scan bisects to its first key, then walks the chunks, costing O(log n + matches).
+
+        Parameters :
+            - keys (Iterable[str]) : The distinct keys to index (Optional). Defaults to none.
+        """
+        keys = sorted(keys)
+        self.__chunks: List[List[str]] = [keys[start:start + CHUNK_SIZE] for start in range(0, len(keys), CHUNK_SIZE)]
+        self.__maxes: List[str] = [chunk[-1] for chunk in self.__chunks]
+        self.__size = len(keys)
+        self.__version = 0 # Incremented on each change, to detect changes during a scan
+
+    def add(self, key: str) -> None:
+        """ Adds a key that isn't indexed yet. """
+        self.__size += 1
+        self.__version += 1
+
+        if not self.__chunks:
+            self.__chunks.append([key])
+            self.__maxes.append(key)
+            return
+
+        # A key greater than every other one goes at the end of the last chunk
+        index = min(bisect_left(self.__maxes, key), len(self.__chunks) - 1)
+        chunk = self.__chunks[index]
+        insort(chunk, key)
+        self.__maxes[index] = chunk[-1]
+
+        if len(chunk) > 2 * CHUNK_SIZE:
+            self.__chunks[index:index + 1] = [chunk[:CHUNK_SIZE], chunk[CHUNK_SIZE:]]
+            self.__maxes[index:index + 1] = [chunk[CHUNK_SIZE - 1], chunk[-1]]
+
+    def remove(self, key: str) -> None:
+        """ Removes an indexed key. """
+        index = bisect_left(self.__maxes, key)
+        chunk = self.__chunks[index]
+        del chunk[bisect_left(chunk, key)]
+        self.__size -= 1
+        self.__version += 1
+
+        if chunk:
+            self.__maxes[index] = chunk[-1]
+        else:
+            del self.__chunks[index]
+            del self.__maxes[index]
+
+    def __scan(self, index: int, position: int) -> Iterator[str]:
+        """
+        Lazily walks the keys in order from the given chunk and position inside it.
+
+        Behavior - The index changes during the scan :
+            Preconditions :
+                A key is added or removed, or the index is cleared during the scan.
+            Postconditions :
+                A runtime error is raised.
+        """
+        version = self.__version
+        chunks = self.__chunks
+
+        while index < len(chunks):
+            chunk = chunks[index]
+
+            while position < len(chunk):
+                yield chunk[position]
+
+                if self.__version != version:
+                    raise RuntimeError("Hash table changed size during iteration.")
+
+                position += 1
+
+            index += 1
+            position = 0
+
+    def __start(self, low: str) -> Iterator[str]:
+        """ Lazily walks the keys in order, from the first one greater than or equal to the given one. """
+        index = bisect_left(self.__maxes, low)
+
+        if index == len(self.__chunks):
+            return iter(())
+
+        return self.__scan(index, bisect_left(self.__chunks[index], low))
+
+    def range(self, low: str | None = None, high: str | None = None) -> Iterator[str]:
+        """ Lazily iterates in order over the keys from low (included) to high (excluded), None leaving a side open. """
+        keys = self.__scan(0, 0) if low is None else self.__start(low)
+
+        for key in keys:
+            if high is not None and key >= high:
+                return
+
+            yield key
+
+    def prefix(self, prefix: str) -> Iterator[str]:
+        """ Lazily iterates in order over the keys starting with the given prefix, which are contiguous in the order. """
+        for key in self.__start(prefix):
+            if not key.startswith(prefix):
+                return
+
+            yield key
+
+    def __iter__(self) -> Iterator[str]:
+        """ Lazily iterates over the keys in order. """
+        return self.__scan(0, 0)
+
+    def __reversed__(self) -> Iterator[str]:
+        """ Lazily iterates over the keys in reverse order. """
+        version = self.__version
+
+        for chunk in reversed(self.__chunks):
+            for position in range(len(chunk) - 1, -1, -1):
+                yield chunk[position]
+
+                if self.__version != version:
+                    raise RuntimeError("Hash table changed size during iteration.")
+
+    def __contains__(self, key: str) -> bool:
+        """ Checks if a key is indexed. """
+        index = bisect_left(self.__maxes, key)
+
+        if index == len(self.__chunks):
+            return False
+
+        chunk = self.__chunks[index]
+        position = bisect_right(chunk, key) - 1
+
+        return position >= 0 and chunk[position] == key
+
+    def __len__(self) -> int:
+        """ Returns the number of indexed keys. """
+        return self.__size
+
+    def clear(self) -> None:
+        """ Removes every key. """
+        self.__chunks = []
+        self.__maxes = []
+        self.__size = 0
+        self.__version += 1
+
+    def clone(self) -> SortedIndex:
+        """ Clones the index, copying its chunks. """
+        clone = SortedIndex()
+        clone.__chunks = [chunk.copy() for chunk in self.__chunks]
+        clone.__maxes = self.__maxes.copy()
+        clone.__size = self.__size
+
+        return clone
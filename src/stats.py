@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import Any, Callable, Deque, Dict, List, Tuple
+from collections import deque
+import time
+
+
+# The operations whose probes and latencies are sampled
+GET = 0
+PUT = 1
+REMOVE = 2
+OPERATIONS = ("get", "put", "remove")
+
+# The percentiles reported for the sampled latencies
+PERCENTILES = (50, 90, 99)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """ Returns the 50th, 90th and 99th percentiles and the maximum of some samples, or an empty dictionary if there are none. """
+    if not samples:
+        return {}
+
+    ordered = sorted(samples)
+    report = {f"p{percentile}": ordered[min(len(ordered) - 1, len(ordered) * percentile // 100)] for percentile in PERCENTILES}
+    report["max"] = ordered[-1]
+
+    return report
+
+
+class TableStats:
+    def __init__(
+        self,
+        sample_every: int = 64,
+        max_samples: int = 1024,
+        on_report: Callable[[Dict[str, Any]], None] | None = None,
+        report_every: int = 10000,
+        clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        """
+        Initializes the statistics of a hash table. Every get, put and remove is counted, and one out of sample_every
+        of each is measured : its probe count and its latency are recorded. Only the latest samples of each operation are kept,
+        so the memory used stays bounded however long the hash table lives.
+
+        Parameters :
+            - sample_every (int) : The number of operations per measured one (Optional). Defaults to 64.
+            - max_samples (int) : The number of latest samples kept per operation (Optional). Defaults to 1024.
+            - on_report (Callable[[Dict[str, Any]], None] | None) : A function called with a stats snapshot regularly (Optional).
+              Defaults to None.
+            - report_every (int) : The number of operations between two reports (Optional). Defaults to 10000.
+              A report is made by the first measured operation once they are reached.
+            - clock (Callable[[], float]) : The clock measuring the latencies and resizes, in seconds (Optional).
+              Defaults to time.perf_counter.
+
+        Behavior - The parameters are invalid :
+            Preconditions :
+                The sampling period, the number of samples or the report period is lower than 1.
+            Postconditions :
+                A value error is raised.
+        """
+        if sample_every < 1 or max_samples < 1 or report_every < 1:
+            raise ValueError("Sampling and report periods are expected to be at least 1.")
+
+        self.__sample_every = sample_every
+        self.__on_report = on_report
+        self.__report_every = report_every
+        self.__clock = clock
+        self.__countdowns = [sample_every] * len(OPERATIONS) # Per operation, so that interleaved operations are sampled evenly
+        self.__sampling = False
+        self.__operations = [0] * len(OPERATIONS)
+        self.__unreported = 0
+        self.__probes: List[Deque[int]] = [deque(maxlen=max_samples) for _ in OPERATIONS]
+        self.__latencies: List[Deque[float]] = [deque(maxlen=max_samples) for _ in OPERATIONS]
+        self.__inserts = 0
+        self.__collisions = 0
+        self.__resizes = 0
+        self.__resize_seconds = 0.0
+        self.__recent_resizes: Deque[Tuple[int, int, float]] = deque(maxlen=64)
+        self.__resize_start: Tuple[int, int, float] | None = None
+
+    def now(self) -> float:
+        """ Returns the current time of the stats clock. """
+        return self.__clock()
+
+    def sample(self, operation: int) -> bool:
+        """ Counts an operation, and tells if it should be measured. The operations run by a measured one aren't counted. """
+        if self.__sampling:
+            return False
+
+        self.__operations[operation] += 1
+        self.__countdowns[operation] -= 1
+
+        if self.__countdowns[operation] > 0:
+            return False
+
+        self.__countdowns[operation] = self.__sample_every
+        self.__sampling = True
+
+        return True
+
+    def record(self, operation: int, probes: int, seconds: float) -> bool:
+        """ Records the probe count and latency of a measured operation, and tells if a report is due. """
+        self.__sampling = False
+        self.__probes[operation].append(probes)
+        self.__latencies[operation].append(seconds)
+        self.__unreported += self.__sample_every
+
+        if self.__on_report is None or self.__unreported < self.__report_every:
+            return False
+
+        self.__unreported = 0
+
+        return True
+
+    def abort(self) -> None:
+        """ Ends a measured operation that raised, without recording it. """
+        self.__sampling = False
+
+    def report(self, snapshot: Dict[str, Any]) -> None:
+        """ Passes a stats snapshot to the report callback. """
+        self.__on_report(snapshot) # type: ignore[misc]
+
+    def insert(self, collision: bool) -> None:
+        """ Counts the insertion of a new key, and whether it collided with another key for its slot. """
+        self.__inserts += 1
+
+        if collision:
+            self.__collisions += 1
+
+    def resize_started(self, old_capacity: int, new_capacity: int) -> None:
+        """ Records the start of an incremental resize. """
+        self.__resize_start = (old_capacity, new_capacity, self.__clock())
+
+    def resize_finished(self) -> None:
+        """ Records the end of the incremental resize in progress, if any. """
+        if self.__resize_start is None:
+            return
+
+        old_capacity, new_capacity, start = self.__resize_start
+        seconds = self.__clock() - start
+        self.__resize_start = None
+        self.__resizes += 1
+        self.__resize_seconds += seconds
+        self.__recent_resizes.append((old_capacity, new_capacity, seconds))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the counters and sample summaries, see HashTable.stats.
+        The probe and latency summaries of an operation never measured are empty dictionaries.
+        """
+        operations: Dict[str, Any] = {}
+
+        for operation, name in enumerate(OPERATIONS):
+            probes = self.__probes[operation]
+
+            operations[name] = {
+                "count": self.__operations[operation],
+                "samples": len(probes),
+                "average_probes": sum(probes) / len(probes) if probes else 0.0,
+                "probes": percentiles(list(probes)),
+                "latency": percentiles(list(self.__latencies[operation])),
+            }
+
+        return {
+            "operations": operations,
+            "inserts": self.__inserts,
+            "collisions": self.__collisions,
+            "collision_rate": self.__collisions / self.__inserts if self.__inserts > 0 else 0.0,
+            "resizes": self.__resizes,
+            "resize_seconds": self.__resize_seconds,
+            "recent_resizes": [
+                {"from": old_capacity, "to": new_capacity, "seconds": seconds}
+                for old_capacity, new_capacity, seconds in self.__recent_resizes
+            ],
+            "resizing": self.__resize_start is not None,
+        }
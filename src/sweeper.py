@@ -0,0 +1,72 @@
+from __future__ import annotations
+from typing import Any, ContextManager
+import asyncio
+import contextlib
+import threading
+from hash_table import HashTable
+
+
+async def sweep_periodically(hash_table: HashTable, interval: float = 1.0, max_slots: int = 64) -> None:
+    """
+    Removes the expired keys of a hash table every interval, until the task running it is cancelled.
+    Each sweep does a bounded amount of work, so the event loop is never blocked for long. See HashTable.sweep.
+
+    Parameters :
+        - hash_table (HashTable) : The hash table to sweep.
+        - interval (float) : The seconds between two sweeps (Optional). Defaults to 1.0.
+        - max_slots (int) : The maximum number of wheel slots visited per sweep (Optional). Defaults to 64.
+    """
+    while True:
+        hash_table.sweep(max_slots)
+        await asyncio.sleep(interval)
+
+
+class Sweeper:
+    def __init__(
+        self,
+        hash_table: HashTable,
+        interval: float = 1.0,
+        max_slots: int = 64,
+        lock: ContextManager[Any] | None = None
+    ) -> None:
+        """
+        Initializes a background thread removing the expired keys of a hash table every interval. See HashTable.sweep.
+
+        Parameters :
+            - hash_table (HashTable) : The hash table to sweep.
+            - interval (float) : The seconds between two sweeps (Optional). Defaults to 1.0.
+            - max_slots (int) : The maximum number of wheel slots visited per sweep (Optional). Defaults to 64.
+            - lock (ContextManager[Any] | None) : The lock the other threads take to use the hash table (Optional).
+              Defaults to None, for a hash table only used by the sweeper's own thread otherwise, as a hash table
+              is not thread-safe.
+        """
+        self.__hash_table = hash_table
+        self.__interval = interval
+        self.__max_slots = max_slots
+        self.__lock = lock if lock is not None else contextlib.nullcontext()
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+    def __run(self) -> None:
+        """ Sweeps the hash table every interval, until the sweeper is stopped. """
+        while not self.__stopped.wait(self.__interval):
+            with self.__lock:
+                self.__hash_table.sweep(self.__max_slots)
+
+    def start(self) -> None:
+        """ Starts the background thread. """
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """ Stops the background thread, waiting for the sweep in progress. """
+        self.__stopped.set()
+        self.__thread.join()
+
+    def __enter__(self) -> Sweeper:
+        """ Starts the background thread, to be stopped when leaving the with statement. """
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """ Stops the background thread. """
+        self.stop()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import Hashable, List, Tuple
+import math
+
+
+# (tick, key, deadline)
+Timer = Tuple[int, Hashable, float]
+
+
+class TimingWheel:
+    # Each level has 64 slots, a slot of level l spanning 64 ** l ticks
+    BITS = 6
+    SLOTS = 1 << BITS
+
+    def __init__(self, resolution: float = 1.0, levels: int = 4, start: float = 0.0) -> None:
+        """
+        Initializes a hierarchical timing wheel, which schedules key deadlines in constant time.
+        The time is cut in ticks of the given resolution. A timer due within 64 ticks is stored in the slot of its tick
+        in the first level. Further timers are stored in coarser levels, and cascade into the finer ones as their tick
+        comes closer. Advancing the wheel by one tick visits a single slot of the first level, plus one slot of the
+        next levels every 64 ticks.
+
+        Parameters :
+            - resolution (float) : The duration of a tick, in seconds (Optional). Defaults to 1.0.
+              A timer fires at the first tick following its deadline.
+            - levels (int) : The number of levels (Optional). Defaults to 4, spanning 64 ** 4 ticks.
+              Further timers are kept in the last level, and placed again each time it cascades.
+            - start (float) : The time of the tick 0 (Optional). Defaults to 0.0.
+        """
+        self.__resolution = resolution
+        self.__levels = levels
+        self.__start = start
+        self.__tick = 0
+        self.__count = 0
+        self.__wheels: List[List[List[Timer]]] = [[[] for _ in range(TimingWheel.SLOTS)] for _ in range(levels)]
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """ Schedules a timer firing the given key once the deadline is over. """
+        tick = max(math.ceil((deadline - self.__start) / self.__resolution), self.__tick + 1)
+        self.__place((tick, key, deadline))
+        self.__count += 1
+
+    def __place(self, timer: Timer) -> None:
+        """ Stores a timer in the slot of the finest level covering its tick. """
+        delta = timer[0] - self.__tick
+
+        for level in range(self.__levels):
+            if delta < 1 << (TimingWheel.BITS * (level + 1)):
+                self.__wheels[level][(timer[0] >> (TimingWheel.BITS * level)) & (TimingWheel.SLOTS - 1)].append(timer)
+                return
+
+        # Too far for every level, the timer waits in the last slot the last level reaches
+        level = self.__levels - 1
+        tick = self.__tick + (1 << (TimingWheel.BITS * self.__levels)) - 1
+        self.__wheels[level][(tick >> (TimingWheel.BITS * level)) & (TimingWheel.SLOTS - 1)].append(timer)
+
+    def advance(self, now: float, max_slots: int = 64) -> List[Timer]:
+        """
+        Advances the wheel towards the given time, visiting at most the given number of slots.
+
+        Parameters :
+            - now (float) : The current time.
+            - max_slots (int) : The maximum number of slots to visit (Optional). Defaults to 64.
+              A wheel lagging behind catches up over the following calls.
+
+        Returns :
+            The timers whose tick was reached, whose deadline is over.
+        """
+        target = math.floor((now - self.__start) / self.__resolution)
+
+        if self.__count == 0:
+            # Nothing to fire, so the empty ticks are skipped at once
+            self.__tick = max(self.__tick, target)
+            return []
+
+        fired: List[Timer] = []
+        visited = 0
+        mask = TimingWheel.SLOTS - 1
+
+        while self.__tick < target and visited < max_slots:
+            self.__tick += 1
+            visited += 1
+            level = 1
+
+            # Each time a level wraps around, the next slot of the level above is spread over the finer levels
+            while level < self.__levels and (self.__tick >> (TimingWheel.BITS * (level - 1))) & mask == 0:
+                index = (self.__tick >> (TimingWheel.BITS * level)) & mask
+                timers = self.__wheels[level][index]
+                self.__wheels[level][index] = []
+                visited += 1
+
+                for timer in timers:
+                    self.__place(timer)
+
+                level += 1
+
+            index = self.__tick & mask
+            timers = self.__wheels[0][index]
+
+            if timers:
+                self.__wheels[0][index] = []
+                fired.extend(timers)
+
+        self.__count -= len(fired)
+
+        return fired
+
+    def size(self) -> int:
+        """ Returns the number of scheduled timers. """
+        return self.__count
+
+    def clear(self) -> None:
+        """ Removes every timer. """
+        self.__count = 0
+        self.__wheels = [[[] for _ in range(TimingWheel.SLOTS)] for _ in range(self.__levels)]
+
+    def clone(self) -> TimingWheel:
+        """ Clones the wheel with its timers. """
+        clone = TimingWheel(self.__resolution, self.__levels, self.__start)
+        clone.__tick = self.__tick
+        clone.__count = self.__count
+        clone.__wheels = [[slot.copy() for slot in wheel] for wheel in self.__wheels]
+
+        return clone
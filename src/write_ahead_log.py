@@ -0,0 +1,148 @@
+from __future__ import annotations
+from typing import Any, BinaryIO, Hashable, Iterator, List, Tuple
+import os
+import pickle
+import struct
+import zlib
+
+
+# Record layout : operation, key type, key length, value length, CRC-32 of the key and value, key, pickled value
+RECORD = struct.Struct("<BBIII")
+
+PUT = 1
+REMOVE = 2
+CLEAR = 3
+
+# String keys are stored in UTF-8, the other keys are pickled
+KEY_STR = 0
+KEY_PICKLED = 1
+
+
+def encode(operation: int, key: Hashable = "", value: Any | None = None) -> bytes:
+    """ Encodes a mutation as a log record. Only the put records hold a value. """
+    if type(key) == str:
+        key_type, key_bytes = KEY_STR, key.encode("utf-8") # type: ignore[union-attr]
+    else:
+        key_type, key_bytes = KEY_PICKLED, pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+
+    value_bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL) if operation == PUT else b""
+    payload = key_bytes + value_bytes
+
+    return RECORD.pack(operation, key_type, len(key_bytes), len(value_bytes), zlib.crc32(payload)) + payload
+
+
+def read_log(path: str) -> Tuple[List[Tuple[int, Hashable, Any]], int]:
+    """
+    Decodes every complete record of a log file.
+
+    Parameters :
+        - path (str) : The path of the log file.
+
+    Returns :
+        A tuple with the (operation, key, value) records, and the offset right after the last valid record.
+        Reading stops at the first truncated or corrupted record, which a crash during a write leaves at the end of the log.
+    """
+    with open(path, "rb") as file:
+        buffer = file.read()
+
+    records: List[Tuple[int, Hashable, Any]] = []
+    offset = 0
+
+    while offset + RECORD.size <= len(buffer):
+        operation, key_type, key_length, value_length, checksum = RECORD.unpack_from(buffer, offset)
+        start = offset + RECORD.size
+        end = start + key_length + value_length
+
+        if operation not in (PUT, REMOVE, CLEAR) or end > len(buffer) or zlib.crc32(buffer[start:end]) != checksum:
+            break
+
+        key_bytes = buffer[start:start + key_length]
+        key = key_bytes.decode("utf-8") if key_type == KEY_STR else pickle.loads(key_bytes)
+        value = pickle.loads(buffer[start + key_length:end]) if operation == PUT else None
+        records.append((operation, key, value))
+        offset = end
+
+    return records, offset
+
+
+class WriteAheadLog:
+    def __init__(self, path: str, group_commit: int = 128, sync: bool = True) -> None:
+        """
+        Opens an append-only log of mutations, creating the file if needed.
+        The records are buffered, and written together by a single write and fsync once enough of them are pending.
+
+        Parameters :
+            - path (str) : The path of the log file.
+            - group_commit (int) : The number of pending records that triggers a commit (Optional). Defaults to 128.
+              With 1, every record is written and synced before append returns.
+            - sync (bool) : If each commit should wait for the records to reach the disk with fsync (Optional). Defaults to True.
+              Otherwise, the records are only handed to the operating system, which survives a process crash but not a power loss.
+
+        Behavior - The group commit is invalid :
+            Preconditions :
+                The group commit is lower than 1.
+            Postconditions :
+                A value error is raised.
+        """
+        if group_commit < 1:
+            raise ValueError("Group commit is expected to be at least 1.")
+
+        self.__path = path
+        self.__group_commit = group_commit
+        self.__sync = sync
+        self.__pending: List[bytes] = []
+        self.__file: BinaryIO = open(path, "ab")
+        self.__bytes = self.__file.tell()
+
+    def append(self, record: bytes) -> None:
+        """ Appends an encoded record, committing the pending records if the group is complete. """
+        self.__pending.append(record)
+
+        if len(self.__pending) >= self.__group_commit:
+            self.commit()
+
+    def commit(self) -> None:
+        """ Writes every pending record with a single write, then syncs the file if enabled. """
+        if not self.__pending:
+            return
+
+        data = b"".join(self.__pending)
+        self.__pending = []
+        self.__file.write(data)
+        self.__file.flush()
+        self.__bytes += len(data)
+
+        if self.__sync:
+            os.fsync(self.__file.fileno())
+
+    def size(self) -> int:
+        """ Returns the number of bytes written to the log file, the pending records excluded. """
+        return self.__bytes
+
+    def path(self) -> str:
+        """ Returns the path of the log file. """
+        return self.__path
+
+    def close(self) -> None:
+        """ Commits the pending records and closes the log file. """
+        self.commit()
+        self.__file.close()
+
+
+def replay(path: str) -> Iterator[Tuple[int, Hashable, Any]]:
+    """
+    Reads the records of a log file to replay them, truncating a torn record left at its end by a crash.
+
+    Parameters :
+        - path (str) : The path of the log file.
+
+    Returns :
+        An iterator over the (operation, key, value) records, in the order they were appended.
+    """
+    records, offset = read_log(path)
+
+    if offset != os.path.getsize(path):
+        with open(path, "r+b") as file:
+            file.truncate(offset)
+
+    return iter(records)
@@ -0,0 +1,26 @@
+import unittest
+from src.bloom_filter import BloomFilter
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        for i in range(1000):
+            self.assertFalse(bloom.add(hash(f"key{i}")))
+        self.assertTrue(all(bloom.might_contain(hash(f"key{i}")) for i in range(1000)))
+        self.assertTrue(bloom.add(hash("one too many")))
+
+    def test_false_positive_rate(self):
+        for rate in (0.1, 0.01):
+            bloom = BloomFilter(5000, rate)
+            for i in range(5000):
+                bloom.add(i)
+            measured = sum(bloom.might_contain(i) for i in range(5000, 25000)) / 20000
+            self.assertLess(measured, rate * 1.5)
+            self.assertAlmostEqual(bloom.false_positive_rate(), rate, delta=rate * 0.5)
+
+    def test_removals_ask_for_a_rebuild(self):
+        bloom = BloomFilter(10)
+        for i in range(10):
+            bloom.add(i)
+        self.assertEqual([bloom.remove() for _ in range(5)], [False] * 4 + [True])
+        self.assertEqual(bloom.clone().stats(), bloom.stats())
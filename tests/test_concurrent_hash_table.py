@@ -0,0 +1,37 @@
+import threading
+import unittest
+from src.concurrent_hash_table import ConcurrentHashTable
+
+class TestConcurrentHashTable(unittest.TestCase):
+    def setUp(self):
+        self.hash_table = ConcurrentHashTable(stripes=4)
+
+    def test_put_get_remove(self):
+        self.hash_table.put("hello", "world")
+        self.assertEqual(self.hash_table.get("hello"), "world")
+        self.assertTrue(self.hash_table.contains("hello"))
+        self.assertEqual(self.hash_table.remove("hello"), "world")
+        self.assertTrue(self.hash_table.is_empty())
+
+    def test_put_if_absent(self):
+        self.assertIsNone(self.hash_table.put_if_absent("hello", "world"))
+        self.assertEqual(self.hash_table.put_if_absent("hello", "there"), "world")
+        self.assertEqual(self.hash_table.get("hello"), "world")
+
+    def test_concurrent_increments(self):
+        def increment():
+            for i in range(2000):
+                self.hash_table.increment(f"counter{i % 10}")
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.hash_table.size(), 10)
+        self.assertEqual(sum(self.hash_table.values()), 8000)
+
+    def test_invalid_key(self):
+        with self.assertRaises(TypeError):
+            self.hash_table.put(None, "world")
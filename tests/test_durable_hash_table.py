@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+from src.durable_hash_table import DurableHashTable
+
+class TestDurableHashTable(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.hash_table = DurableHashTable(self.directory, commit_interval=None)
+
+    def tearDown(self):
+        self.hash_table.close()
+        shutil.rmtree(self.directory)
+
+    def reopen(self):
+        self.hash_table.close()
+        self.hash_table = DurableHashTable(self.directory, commit_interval=None)
+
+    def test_replay_after_reopening(self):
+        self.hash_table.put_many([("a", 1), ("b", 2), ("c", None)])
+        self.hash_table.remove("b")
+        self.hash_table.put("a", 10)
+        self.reopen()
+        self.assertCountEqual(self.hash_table.entries(), [("a", 10), ("c", None)])
+
+    def test_non_string_keys(self):
+        self.hash_table.put_many([(1, "a"), (b"b", 2)])
+        self.hash_table.compact()
+        self.hash_table.put(-1, None)
+        self.reopen()
+        self.assertCountEqual(self.hash_table.entries(), [(1, "a"), (b"b", 2), (-1, None)])
+        with self.assertRaises(TypeError):
+            self.hash_table.put((1,), 2)
+
+    def test_clear_is_logged(self):
+        self.hash_table.put("a", 1)
+        self.hash_table.clear()
+        self.hash_table.put("b", 2)
+        self.reopen()
+        self.assertEqual(self.hash_table.entries(), [("b", 2)])
+
+    def test_torn_record_is_dropped(self):
+        self.hash_table.put("a", 1)
+        self.hash_table.close()
+
+        with open(os.path.join(self.directory, "table.log"), "ab") as file:
+            file.write(b"\x01\x05")
+
+        self.hash_table = DurableHashTable(self.directory, commit_interval=None)
+        self.assertEqual(self.hash_table.entries(), [("a", 1)])
+
+    def test_compact(self):
+        self.hash_table.put_many((f"key{i}", i) for i in range(100))
+        self.hash_table.compact()
+        self.hash_table.remove("key0")
+        self.reopen()
+        self.assertEqual(self.hash_table.size(), 99)
+        self.assertEqual(self.hash_table.get("key42"), 42)
+        self.assertFalse(self.hash_table.contains("key0"))
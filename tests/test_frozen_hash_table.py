@@ -0,0 +1,41 @@
+import unittest
+from src.frozen_hash_table import FrozenHashTable
+from src.hash_table import HashTable
+
+class TestFrozenHashTable(unittest.TestCase):
+    def test_from_entries(self):
+        entries = [(f"key{i}", i) for i in range(1000)] + [("key0", "last"), (7, "int"), (b"7", "bytes")]
+        frozen = FrozenHashTable.from_entries(entries, hash_function="fnv1a", seed=3)
+        self.assertEqual(frozen.size(), 1002)
+        self.assertEqual(frozen.get_capacity(), 1002)
+        self.assertEqual(frozen.get("key0"), "last")
+        self.assertEqual(frozen.get_many(["key999", 7, b"7", "missing"], -1), [999, "int", "bytes", -1])
+        self.assertEqual(frozen.contains_many(["key1", "missing"]), [True, False])
+        self.assertEqual(sorted(frozen.values(), key=str), sorted([i for i in range(1, 1000)] + ["last", "int", "bytes"], key=str))
+        with self.assertRaises(TypeError):
+            frozen.get(None)
+
+    def test_keys_sharing_their_hash(self):
+        frozen = FrozenHashTable.from_entries([(-1, "a"), (-2, "b"), ("x", "c")])
+        self.assertEqual(hash(-1), hash(-2))
+        self.assertEqual(frozen.get_many([-1, -2, "x", -3]), ["a", "b", "c", None])
+        self.assertEqual(len(frozen), 3)
+
+    def test_empty(self):
+        frozen = FrozenHashTable.from_entries([])
+        self.assertTrue(frozen.is_empty())
+        self.assertFalse(frozen.contains("key"))
+        self.assertEqual(frozen.keys(), [])
+
+    def test_freeze(self):
+        now = [0.0]
+        for storage in ("chained", "open"):
+            hash_table = HashTable(storage=storage, clock=lambda: now[0])
+            hash_table.put_many((i, str(i)) for i in range(500))
+            hash_table.put("expiring", 1, ttl=5)
+            now[0] += 10
+            frozen = hash_table.freeze()
+            self.assertEqual(frozen.size(), 500)
+            self.assertEqual(frozen.get_many(range(500)), [str(i) for i in range(500)])
+            self.assertFalse(frozen.contains("expiring"))
+            self.assertLess(frozen.memory_usage()["bytes_per_entry"], hash_table.memory_usage()["bytes_per_entry"])
@@ -0,0 +1,37 @@
+import unittest
+from src.hash_analysis import analyze, recommend, recommended_capacity
+from src.hash_table import HashTable
+
+class TestHashAnalysis(unittest.TestCase):
+    def test_recommended_capacity_is_prime(self):
+        self.assertEqual(recommended_capacity(75), 101)
+        self.assertEqual(recommended_capacity(3), 5)
+
+    def test_clustering_hash_is_not_recommended(self):
+        keys = [f"user:{i}" for i in range(2000)]
+        reports = analyze(keys, candidates={"clustered": lambda key: len(key), "builtin": hash})
+        self.assertEqual(reports[0]["name"], "builtin")
+        self.assertTrue(reports[0]["recommended"])
+        clustered = reports[1]
+        self.assertGreater(clustered["chi_squared_ratio"], 10)
+        self.assertGreater(clustered["longest_chain"], 100)
+
+    def test_avalanche(self):
+        reports = analyze([f"user:{i}" for i in range(500)], candidates={"builtin": hash, "constant": lambda key: 0})
+        by_name = {report["name"]: report for report in reports}
+        self.assertAlmostEqual(by_name["builtin"]["avalanche"], 0.5, delta=0.05)
+        self.assertEqual(by_name["constant"]["avalanche"], 0.0)
+
+    def test_empty_sample(self):
+        with self.assertRaises(ValueError):
+            analyze([])
+
+    def test_from_sample(self):
+        keys = [f"user:{i}" for i in range(1000)]
+        hash_function, capacity = recommend(keys, 3000, seed=1)
+        hash_table = HashTable.from_sample(keys, 3000, seed=1, storage="open")
+        self.assertEqual(hash_table.get_capacity(), capacity)
+        hash_table.put("user:1", 1)
+        self.assertEqual(hash_table.get("user:1"), 1)
+        with self.assertRaises(TypeError):
+            HashTable.from_sample(keys, capacity=10)
@@ -0,0 +1,38 @@
+import unittest
+from src.hash_functions import HASH_FUNCTIONS, fnv1a_hash, make_batch_hash, make_hash, xxh64_hash
+
+class TestHashFunctions(unittest.TestCase):
+    def test_fnv1a(self):
+        self.assertEqual(fnv1a_hash(""), 0xCBF29CE484222325)
+        self.assertEqual(fnv1a_hash("a"), 0xAF63DC4C8601EC8C)
+
+    def test_xxhash(self):
+        self.assertEqual(xxh64_hash(""), 0xEF46DB3751D8E999)
+        self.assertEqual(xxh64_hash("abc"), 0x44BC2CF5AD770999)
+        self.assertEqual(xxh64_hash("Nobody inspects the spammish repetition"), 0xFBCEA83C8A378BF1)
+
+    def test_seed_changes_hash(self):
+        for name in HASH_FUNCTIONS:
+            self.assertNotEqual(make_hash(name, 1)("user:123"), make_hash(name, 2)("user:123"))
+
+    def test_non_string_keys(self):
+        for name in HASH_FUNCTIONS:
+            hash = make_hash(name, 1)
+            if name != "builtin":
+                self.assertEqual(hash(b"user"), hash("user"))
+            self.assertEqual(hash((1, 2)), hash((1, 2)))
+            self.assertNotEqual(hash(1), hash(2))
+
+    def test_batch_hash_matches_scalar_hash(self):
+        keys = [f"user:{i}" for i in range(150)] + ["", "é" * 40, b"\x00\xff", 7, -2**70, (1, "a")]
+        for name in HASH_FUNCTIONS:
+            for seed in (0, 2**64 - 1):
+                hash = make_hash(name, seed)
+                hashes, indices = make_batch_hash(name, seed)(keys, 97)
+                self.assertEqual(hashes, [hash(key) for key in keys])
+                self.assertEqual(indices, [hash(key) % 97 for key in keys])
+                self.assertIsNone(make_batch_hash(name, seed)(keys, None)[1])
+
+    def test_unknown_hash_function(self):
+        with self.assertRaises(ValueError):
+            make_hash("md5")
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from src.hash_table import HashTable
 
@@ -40,3 +42,485 @@ class TestHashTable(unittest.TestCase):
         self.assertListEqual(self.hash_table.values(), [])
         self.hash_table.put("hello", "world")
         self.assertListEqual(self.hash_table.values(), ["world"])
+
+    def test_grows_when_load_factor_exceeded(self):
+        for i in range(100):
+            self.hash_table.put(f"key{i}", i)
+        self.assertGreater(self.hash_table.get_capacity(), 12)
+        self.assertEqual(self.hash_table.size(), 100)
+        for i in range(100):
+            self.assertEqual(self.hash_table.get(f"key{i}"), i)
+
+    def test_resize_is_incremental(self):
+        hash_table = HashTable(capacity=4, max_load_factor=1.0)
+        for i in range(5):
+            hash_table.put(f"key{i}", i)
+        self.assertEqual(hash_table.get_capacity(), 8)
+        self.assertCountEqual(hash_table.keys(), [f"key{i}" for i in range(5)])
+        for i in range(5):
+            self.assertEqual(hash_table.get(f"key{i}"), i)
+
+    def test_shrinks_when_load_factor_drops(self):
+        for i in range(200):
+            self.hash_table.put(f"key{i}", i)
+        grown_capacity = self.hash_table.get_capacity()
+        for i in range(195):
+            self.hash_table.remove(f"key{i}")
+        self.assertLess(self.hash_table.get_capacity(), grown_capacity)
+        self.assertGreaterEqual(self.hash_table.get_capacity(), 12)
+        self.assertCountEqual(self.hash_table.keys(), [f"key{i}" for i in range(195, 200)])
+
+    def test_invalid_load_factors(self):
+        with self.assertRaises(ValueError):
+            HashTable(min_load_factor=0.8, max_load_factor=0.5)
+
+    def test_open_storage(self):
+        hash_table = HashTable(storage="open")
+        for i in range(100):
+            self.assertIsNone(hash_table.put(f"key{i}", i))
+        self.assertEqual(hash_table.size(), 100)
+        self.assertGreater(hash_table.get_capacity(), 100)
+        self.assertEqual(hash_table.put("key1", "one"), 1)
+        self.assertFalse(hash_table.put("key1", "uno", False))
+        self.assertEqual(hash_table.get("key1"), "one")
+        for i in range(0, 100, 2):
+            hash_table.remove(f"key{i}")
+        self.assertCountEqual(hash_table.keys(), [f"key{i}" for i in range(1, 100, 2)])
+        self.assertFalse(hash_table.contains("key0"))
+        self.assertTrue(hash_table.clone().contains("key3"))
+
+    def test_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            HashTable(storage="cuckoo")
+
+    def test_hash_functions(self):
+        for name in ("builtin", "polynomial", "fnv1a", "xxhash"):
+            hash_table = HashTable(hash_function=name, seed=42)
+            for i in range(50):
+                hash_table.put(f"user:{i}", i)
+            self.assertEqual(hash_table.get("user:7"), 7)
+            self.assertEqual(hash_table.clone().get("user:49"), 49)
+
+    def test_seeded_builtin_hash_spreads_structured_int_keys(self):
+        for keys in ([i << 20 for i in range(2000)], [i * 1024 for i in range(2000)]):
+            hash_table = HashTable()
+            hash_table.put_many((key, key) for key in keys)
+            self.assertGreater(hash_table.non_empty_slots(), hash_table.get_capacity() // 4)
+            self.assertLess(hash_table.longest_chain(), 10)
+
+    def test_slot_statistics(self):
+        hash_table = HashTable(custom_hash=len, max_load_factor=10)
+        for key in ("a", "b", "c", "dd", "eee"):
+            hash_table.put(key, key)
+        self.assertEqual(hash_table.non_empty_slots(), 3)
+        self.assertEqual(hash_table.longest_chain(), 3)
+        self.assertAlmostEqual(hash_table.average_slot_distribution(), 5 / 3)
+        hash_table.remove("b")
+        hash_table.remove("a")
+        self.assertEqual(hash_table.longest_chain(), 1)
+        hash_table.clear()
+        self.assertEqual(hash_table.non_empty_slots(), 0)
+        self.assertEqual(hash_table.longest_chain(), 0)
+
+    def test_setdefault(self):
+        self.assertEqual(self.hash_table.setdefault("hello", "world"), "world")
+        self.assertEqual(self.hash_table.setdefault("hello", "there"), "world")
+        self.assertEqual(self.hash_table.size(), 1)
+
+    def test_compute_and_increment(self):
+        self.assertEqual(self.hash_table.increment("count"), 1)
+        self.assertEqual(self.hash_table.increment("count", 4), 5)
+        self.assertEqual(self.hash_table.compute("count", lambda value: value * 2), 10)
+        self.assertEqual(self.hash_table.compute("other", lambda value: value + [1], []), [1])
+        self.assertEqual(self.hash_table.size(), 2)
+
+    def test_pop(self):
+        self.hash_table.put("hello", None)
+        self.assertIsNone(self.hash_table.pop("hello", "missing"))
+        self.assertEqual(self.hash_table.pop("hello", "missing"), "missing")
+        self.assertTrue(self.hash_table.is_empty())
+
+    def test_put_none_value_is_not_duplicated(self):
+        self.hash_table.put("hello", None)
+        self.hash_table.put("hello", "world")
+        self.assertEqual(self.hash_table.size(), 1)
+        self.assertEqual(self.hash_table.get("hello"), "world")
+
+    def test_put_many_and_get_many(self):
+        self.hash_table.put_many((f"key{i}", i) for i in range(100))
+        self.assertEqual(self.hash_table.size(), 100)
+        self.assertGreaterEqual(self.hash_table.get_capacity(), 100)
+        self.assertEqual(self.hash_table.get_many(["key1", "missing", "key99"], -1), [1, -1, 99])
+        self.hash_table.put_many([("key1", "one"), ("key2", "two")], override=False)
+        self.assertEqual(self.hash_table.get_many(["key1", "key2"]), [1, 2])
+
+    def test_contains_many_and_remove_many(self):
+        self.hash_table.put_many([("a", 1), ("b", 2)])
+        self.assertEqual(self.hash_table.contains_many(["a", "c"]), [True, False])
+        self.assertEqual(self.hash_table.remove_many(["a", "c"]), [1, None])
+        self.assertEqual(self.hash_table.keys(), ["b"])
+
+    def test_batch_validates_before_modifying(self):
+        with self.assertRaises(TypeError):
+            self.hash_table.put_many([("a", 1), (None, 2)])
+        self.assertTrue(self.hash_table.is_empty())
+
+    def test_hashable_keys(self):
+        for storage in ("chained", "open"):
+            for hash_function in ("builtin", "fnv1a"):
+                hash_table = HashTable(storage=storage, hash_function=hash_function)
+                hash_table.put_many([(1, "int"), ((1, "a"), "tuple"), (b"1", "bytes"), ("1", None)])
+                self.assertEqual(hash_table.get_many([1, (1, "a"), b"1"]), ["int", "tuple", "bytes"])
+                self.assertIsNone(hash_table.get("1", 0))
+                self.assertEqual(hash_table.pop(1), "int")
+                self.assertEqual(hash_table.size(), 3)
+
+        with self.assertRaises(TypeError):
+            self.hash_table.put([1], 2)
+
+    def test_large_batches_with_vectorizable_hash_functions(self):
+        keys = [f"key{i}" for i in range(500)] + [b"bytes", 42]
+        for storage in ("chained", "open"):
+            for hash_function in ("polynomial", "fnv1a"):
+                hash_table = HashTable(storage=storage, hash_function=hash_function)
+                hash_table.put_many((key, i) for i, key in enumerate(keys))
+                self.assertTrue(all(hash_table.get(key) == i for i, key in enumerate(keys)))
+                self.assertEqual(hash_table.get_many(keys), list(range(len(keys))))
+                self.assertEqual(hash_table.contains_many(keys + ["missing"] * 100), [True] * len(keys) + [False] * 100)
+                self.assertEqual(hash_table.remove_many(keys[:250]), list(range(250)))
+                self.assertEqual(hash_table.size(), len(keys) - 250)
+
+    def test_bloom_filter(self):
+        for storage in ("chained", "open"):
+            hash_table = HashTable(storage=storage)
+            hash_table.put_many((f"key{i}", i) for i in range(100))
+            hash_table.enable_bloom_filter(0.01)
+            hash_table.put_many((f"key{i}", i) for i in range(100, 1000))
+            for i in range(0, 1000, 2):
+                hash_table.remove(f"key{i}")
+            self.assertEqual(hash_table.get_many([f"key{i}" for i in range(1000)], -1), [i if i % 2 else -1 for i in range(1000)])
+            self.assertFalse(any(hash_table.contains(f"missing{i}") for i in range(1000)))
+            stats = hash_table.bloom_filter_stats()
+            self.assertGreater(stats["rejected"], 1000)
+            self.assertLess(stats["false_positive_rate"], 0.02)
+            hash_table.clear()
+            self.assertIsNone(hash_table.get("key1"))
+            hash_table.disable_bloom_filter()
+            self.assertFalse(hash_table.bloom_filter_stats()["enabled"])
+
+        with self.assertRaises(ValueError):
+            self.hash_table.enable_bloom_filter(1.0)
+
+    def test_sorted_index(self):
+        for storage in ("chained", "open"):
+            hash_table = HashTable(storage=storage)
+            hash_table.put_many((f"tenant:{i % 50}:user:{i}", i) for i in range(1000))
+            hash_table.enable_sorted_index()
+            hash_table.put("tenant:42:admin", -1)
+            hash_table.remove("tenant:42:user:42")
+            keys = sorted(hash_table.keys())
+            self.assertEqual(list(hash_table.sorted_keys()), keys)
+            self.assertEqual(list(hash_table.sorted_keys(reverse=True)), keys[::-1])
+            self.assertEqual(list(hash_table.prefix_scan("tenant:42:")), [key for key in keys if key.startswith("tenant:42:")])
+            self.assertEqual(list(hash_table.range("tenant:1:", "tenant:2")), [key for key in keys if "tenant:1:" <= key < "tenant:2"])
+            with self.assertRaises(TypeError):
+                hash_table.put(1, "int")
+            hash_table.clear()
+            self.assertEqual(list(hash_table.sorted_keys()), [])
+            hash_table.disable_sorted_index()
+            hash_table.put(1, "int")
+            with self.assertRaises(TypeError):
+                hash_table.enable_sorted_index()
+            with self.assertRaises(RuntimeError):
+                hash_table.prefix_scan("tenant:")
+
+    def test_average_slot_distribution_of_empty_table(self):
+        self.assertEqual(self.hash_table.average_slot_distribution(), 0.0)
+        self.assertEqual(HashTable(storage="open").average_slot_distribution(), 0.0)
+
+    def test_stats(self):
+        self.assertFalse(self.hash_table.stats()["enabled"])
+
+        for storage in ("chained", "open"):
+            reports = []
+            hash_table = HashTable(storage=storage)
+            hash_table.enable_stats(sample_every=2, on_report=reports.append, report_every=100)
+
+            for i in range(100):
+                hash_table.put(i, i)
+                hash_table.get(i)
+
+            hash_table.remove(0)
+            stats = hash_table.stats()
+            self.assertEqual(stats["operations"]["put"]["count"], 100)
+            self.assertEqual(stats["operations"]["get"]["samples"], 50)
+            self.assertEqual(stats["operations"]["remove"]["count"], 1)
+            self.assertEqual(stats["inserts"], 100)
+            self.assertGreater(stats["resizes"], 0)
+            self.assertIn("p99", stats["operations"]["get"]["latency"])
+            self.assertEqual(len(reports), 2)
+
+            hash_table.disable_stats()
+            hash_table.get(1)
+            self.assertNotIn("operations", hash_table.stats())
+
+    def test_stats_count_merged_inserts(self):
+        for seed in (1, None):
+            hash_table = HashTable(seed=seed)
+            other = HashTable(seed=seed)
+            hash_table.enable_stats()
+            hash_table.put_many((i, i) for i in range(30))
+            other.put_many((i, -i) for i in range(20, 80))
+            hash_table.merge(other)
+            stats = hash_table.stats()
+            self.assertEqual(stats["inserts"], hash_table.size())
+            self.assertLessEqual(stats["collisions"], stats["inserts"])
+
+    def test_memory_usage(self):
+        self.assertEqual(self.hash_table.memory_usage()["chains"], 0)
+        self.hash_table.put_many((f"key{i}", i) for i in range(100))
+        usage = self.hash_table.memory_usage()
+        self.assertEqual(usage["total"], usage["slots"] + usage["chains"] + usage["nodes"])
+        self.assertAlmostEqual(usage["bytes_per_entry"], usage["total"] / 100)
+        self.assertGreater(self.hash_table.memory_usage(include_data=True)["data"], 0)
+        for i in range(100):
+            self.hash_table.remove(f"key{i}")
+        self.assertEqual(self.hash_table.memory_usage()["chains"], 0)
+
+    def test_views(self):
+        self.hash_table.put_many([("a", 1), ("b", 2)])
+        keys = self.hash_table.keys_view()
+        self.assertEqual(len(keys), 2)
+        self.assertCountEqual(keys, ["a", "b"])
+        self.assertCountEqual(self.hash_table.values_view(), [1, 2])
+        self.assertCountEqual(self.hash_table.items(), [("a", 1), ("b", 2)])
+        self.assertCountEqual(self.hash_table, ["a", "b"])
+        self.assertIn(("a", 1), self.hash_table.items())
+        self.hash_table.put("c", 3)
+        self.assertEqual(len(keys), 3)
+
+    def test_view_detects_changes_during_iteration(self):
+        self.hash_table.put_many([("a", 1), ("b", 2)])
+        with self.assertRaises(RuntimeError):
+            for key in self.hash_table.keys_view():
+                self.hash_table.remove(key)
+
+    def test_clone_keeps_capacity_and_hash(self):
+        hash_table = HashTable(capacity=50, custom_hash=len)
+        hash_table.put("hello", "world")
+        clone = hash_table.clone()
+        self.assertEqual(clone.get_capacity(), 50)
+        self.assertEqual(clone.get("hello"), "world")
+        clone.put("hello", "there")
+        self.assertEqual(hash_table.get("hello"), "world")
+
+    def test_copy_on_write_clone(self):
+        self.hash_table.put_many([("a", 1), ("b", 2)])
+        clone = self.hash_table.clone(copy_on_write=True)
+        clone.put("a", 10)
+        clone.remove("b")
+        self.hash_table.increment("b")
+        self.assertCountEqual(self.hash_table.entries(), [("a", 1), ("b", 3)])
+        self.assertEqual(clone.entries(), [("a", 10)])
+
+    def test_merge_same_hash(self):
+        self.hash_table.put_many([("a", 1), ("b", 2)])
+        other = self.hash_table.clone()
+        other.put_many([("b", 20), ("c", 30)])
+        self.hash_table.merge(other)
+        self.assertCountEqual(self.hash_table.entries(), [("a", 1), ("b", 2), ("c", 30)])
+        self.hash_table.merge(other, override=True)
+        self.assertEqual(self.hash_table.get("b"), 20)
+
+    def test_merge_independent_tables(self):
+        for storage in ("chained", "open"):
+            hash_table = HashTable(storage=storage)
+            other = HashTable(storage=storage)
+            hash_table.put_many((f"key{i}", i) for i in range(100))
+            other.put_many((f"key{i}", -i) for i in range(50, 150))
+            hash_table.merge(other)
+            self.assertEqual(hash_table.size(), 150)
+            self.assertEqual(hash_table.get("key60"), 60)
+            self.assertEqual(hash_table.get("key120"), -120)
+            hash_table.merge(other, override=True)
+            self.assertEqual(hash_table.get("key60"), -60)
+
+    def test_merge_with_shared_hash_reuses_hashes(self):
+        calls = [0]
+        def counted_hash(key):
+            calls[0] += 1
+            return hash(key)
+        hash_table = HashTable(custom_hash=counted_hash)
+        other = HashTable(custom_hash=counted_hash)
+        other.put_many((f"key{i}", i) for i in range(100))
+        calls[0] = 0
+        hash_table.merge(other)
+        self.assertEqual(calls[0], 0)
+        self.assertEqual(hash_table.get("key42"), 42)
+
+    def test_save_and_open(self):
+        self.hash_table.put_many([("a", 1), ("b", [2]), ("c", None)])
+        path = os.path.join(tempfile.mkdtemp(), "table.snapshot")
+        self.hash_table.save(path)
+
+        with HashTable.open(path) as mapped:
+            self.assertEqual(mapped.get("b"), [2])
+            self.assertEqual(mapped.get("c", 0), None)
+            self.assertEqual(mapped.get("d", 0), 0)
+            self.assertTrue(mapped.contains("a"))
+            self.assertCountEqual(mapped.entries(), self.hash_table.entries())
+
+        loaded = HashTable.open(path, mmap=False)
+        self.assertCountEqual(loaded.entries(), self.hash_table.entries())
+        self.assertEqual(loaded.get_capacity(), self.hash_table.get_capacity())
+
+    def test_opened_table_shrinks_below_saved_capacity(self):
+        for storage in ("chained", "open"):
+            hash_table = HashTable(storage=storage)
+            hash_table.put_many((f"key{i}", i) for i in range(2000))
+            path = os.path.join(tempfile.mkdtemp(), "table.snapshot")
+            hash_table.save(path)
+            loaded = HashTable.open(path, mmap=False)
+            saved_capacity = loaded.get_capacity()
+            for i in range(1990):
+                loaded.remove(f"key{i}")
+            self.assertLess(loaded.get_capacity(), saved_capacity)
+            self.assertEqual(loaded.get("key1995"), 1995)
+
+    def test_save_and_open_non_string_keys(self):
+        self.hash_table.put_many([(-300, 1), (b"\x00", 2), ("e", 3)])
+        path = os.path.join(tempfile.mkdtemp(), "table.snapshot")
+        self.hash_table.save(path)
+
+        with HashTable.open(path) as mapped:
+            self.assertEqual(mapped.get_many([-300, b"\x00", "e", 300, (1,)]), [1, 2, 3, None, None])
+
+        self.assertCountEqual(HashTable.open(path, mmap=False).entries(), self.hash_table.entries())
+        self.hash_table.put((1,), 4)
+        with self.assertRaises(TypeError):
+            self.hash_table.save(path)
+
+    def test_lru_eviction(self):
+        evicted = []
+        hash_table = HashTable(max_entries=2, on_evict=lambda key, value: evicted.append((key, value)))
+        hash_table.put_many([("a", 1), ("b", 2)])
+        hash_table.get("a")
+        hash_table.put("c", 3)
+        self.assertEqual(evicted, [("b", 2)])
+        self.assertCountEqual(hash_table.keys(), ["a", "c"])
+        self.assertEqual(hash_table.get("b"), None)
+        self.assertEqual(hash_table.cache_stats()["hits"], 1)
+        self.assertEqual(hash_table.cache_stats()["misses"], 1)
+
+    def test_lfu_eviction(self):
+        hash_table = HashTable(max_entries=2, policy="lfu", storage="open")
+        hash_table.put_many([("a", 1), ("b", 2)])
+        hash_table.get("a")
+        hash_table.get("b")
+        hash_table.get("a")
+        hash_table.put("c", 3)
+        self.assertCountEqual(hash_table.keys(), ["a", "c"])
+
+    def test_tinylfu_stays_bounded(self):
+        hash_table = HashTable(max_entries=10, policy="tinylfu")
+
+        for i in range(100):
+            hash_table.put("hot", i)
+            hash_table.put(f"cold{i}", i)
+
+        self.assertEqual(hash_table.size(), 10)
+        self.assertTrue(hash_table.contains("hot"))
+        self.assertEqual(hash_table.cache_stats()["evictions"], 91)
+
+    def test_memoize(self):
+        calls = []
+        hash_table = HashTable(max_entries=10)
+
+        @hash_table.memoize
+        def square(number):
+            calls.append(number)
+            return number * number
+
+        self.assertEqual([square(3), square(3), square(4)], [9, 9, 16])
+        self.assertEqual(calls, [3, 4])
+
+    def test_ttl_expires_lazily(self):
+        now = [0.0]
+        hash_table = HashTable(clock=lambda: now[0])
+        hash_table.put("session", "data", ttl=10)
+        hash_table.put("forever", "data")
+        self.assertEqual(hash_table.ttl("session"), 10)
+        self.assertIsNone(hash_table.ttl("forever"))
+        now[0] = 10
+        self.assertIsNone(hash_table.get("session"))
+        self.assertFalse(hash_table.contains("session"))
+        self.assertEqual(hash_table.size(), 1)
+
+    def test_put_replaces_ttl(self):
+        now = [0.0]
+        hash_table = HashTable(clock=lambda: now[0])
+        hash_table.put("session", 1, ttl=10)
+        hash_table.put("session", 2)
+        now[0] = 20
+        self.assertEqual(hash_table.get("session"), 2)
+        with self.assertRaises(ValueError):
+            hash_table.put("session", 3, ttl=0)
+
+    def test_expired_keys_are_skipped_before_sweep(self):
+        for storage in ("chained", "open"):
+            now = [0.0]
+            hash_table = HashTable(storage=storage, clock=lambda: now[0])
+            hash_table.put("session", 1, ttl=10)
+            hash_table.put("forever", 2)
+            now[0] = 10
+            self.assertEqual(hash_table.keys(), ["forever"])
+            self.assertEqual(hash_table.entries(), [("forever", 2)])
+            self.assertEqual(list(hash_table.items()), [("forever", 2)])
+            # The size counts the expired key until it is removed, in constant time
+            self.assertEqual(len(hash_table), 2)
+            hash_table.sweep()
+            self.assertEqual(len(hash_table), 1)
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "table.snapshot")
+                hash_table.save(path)
+                self.assertEqual(HashTable.open(path, mmap=False).entries(), [("forever", 2)])
+
+    def test_merge_applies_ttl(self):
+        for seed in (1, None):
+            now = [0.0]
+            source = HashTable(seed=seed, clock=lambda: now[0])
+            target = HashTable(seed=seed, clock=lambda: now[0])
+            source.put("expired", 1, ttl=5)
+            source.put("session", 2, ttl=20)
+            source.put("forever", 3)
+            target.put("forever", 0, ttl=5)
+            target.put("stale", 0, ttl=5)
+            source.put("stale", 4)
+            now[0] = 10
+            target.merge(source, override=True)
+            self.assertCountEqual(target.entries(), [("session", 2), ("forever", 3), ("stale", 4)])
+            self.assertEqual(target.ttl("session"), 10)
+            self.assertIsNone(target.ttl("forever"))
+            self.assertIsNone(target.ttl("stale"))
+
+    def test_failed_put_registers_no_ttl(self):
+        hash_table = HashTable()
+        hash_table.enable_sorted_index()
+        with self.assertRaises(TypeError):
+            hash_table.put(5, "int", ttl=10)
+        self.assertIsNone(hash_table.ttl(5))
+        self.assertEqual(len(hash_table), 0)
+
+    def test_sweep(self):
+        now = [0.0]
+        hash_table = HashTable(clock=lambda: now[0])
+
+        for i in range(100):
+            hash_table.put(f"key{i}", i, ttl=1 + i % 2)
+
+        now[0] = 1.5
+        self.assertEqual(hash_table.sweep(), 50)
+        self.assertEqual(hash_table.size(), 50)
+        now[0] = 2.5
+        self.assertEqual(hash_table.sweep(), 50)
+        self.assertTrue(hash_table.is_empty())
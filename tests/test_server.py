@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from src.client import HashTableClient
+from src.hash_table import HashTable
+from src.server import HashTableServer
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = HashTableServer()
+        await self.server.start(port=0)
+        host, port = self.server.address()
+        self.client = HashTableClient(host, port, pool_size=2)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_commands(self):
+        await self.client.put("a", b"1")
+        await self.client.put_many([("b", "2"), ("c", b"3")])
+        self.assertEqual(await self.client.get("a"), b"1")
+        self.assertEqual(await self.client.get("missing", b"default"), b"default")
+        self.assertEqual(await self.client.get_many(["b", "c", "d"]), [b"2", b"3", None])
+        self.assertEqual(await self.client.contains_many(["a", "d"]), [True, False])
+        self.assertTrue(await self.client.remove("a"))
+        self.assertFalse(await self.client.contains("a"))
+        self.assertEqual(await self.client.size(), 2)
+
+    async def test_pipeline_replies_in_order(self):
+        replies = await self.client.pipeline([("SET", "a", "1"), ("GET", "a"), ("UNKNOWN",), ("DEL", "a", "b")])
+        self.assertEqual(replies[:2], ["OK", b"1"])
+        self.assertIsInstance(replies[2], Exception)
+        self.assertIn("unknown command", str(replies[2]))
+        self.assertEqual(replies[3], 1)
+
+    async def test_concurrent_clients_share_the_pool(self):
+        await asyncio.gather(*(self.client.put(f"key{i}", str(i)) for i in range(50)))
+        values = await asyncio.gather(*(self.client.get(f"key{i}") for i in range(50)))
+        self.assertEqual(values, [str(i).encode() for i in range(50)])
+
+    async def test_negative_lengths_close_the_connection(self):
+        host, port = self.server.address()[:2]
+
+        for packet in (b"*1\r\n$-12\r\n", b"*-3\r\n"):
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(packet)
+            await writer.drain()
+            reply = await asyncio.wait_for(reader.read(), timeout=5)
+            self.assertTrue(reply.startswith(b"-ERR Protocol error"))
+            writer.close()
+
+        # The event loop is still serving the other clients
+        await self.client.put("a", b"1")
+        self.assertEqual(await self.client.get("a"), b"1")
+
+    async def test_hash_table_errors_keep_their_message(self):
+        server = HashTableServer(HashTable(hash_function="fnv1a"))
+        await server.start(port=0)
+        host, port = server.address()[:2]
+        async with HashTableClient(host, port) as client:
+            replies = await client.pipeline([("SET", b"\xff\xfe", "v"), ("SET", "a"), ("SET", "a", "1")])
+        await server.close()
+        self.assertIn("UnicodeEncodeError", str(replies[0]))
+        self.assertIn("wrong number of arguments", str(replies[1]))
+        self.assertEqual(replies[2], "OK")
@@ -0,0 +1,53 @@
+import os
+import threading
+import unittest
+from src.sharded_hash_table import ShardedHashTable
+
+PARENT = os.getpid()
+
+class ChildUnhashable:
+    """ A key hashable in the test process only, so that its shard fails on it. """
+    def __hash__(self):
+        if os.getpid() != PARENT:
+            raise TypeError("unhashable in a shard")
+        return 0
+
+class TestShardedHashTable(unittest.TestCase):
+    def setUp(self):
+        self.hash_table = ShardedHashTable(shards=2)
+
+    def tearDown(self):
+        self.hash_table.close()
+
+    def test_put_get_remove(self):
+        self.hash_table.put("hello", "world")
+        self.assertEqual(self.hash_table.get("hello"), "world")
+        self.assertTrue(self.hash_table.contains("hello"))
+        self.assertEqual(self.hash_table.remove("hello"), "world")
+        self.assertTrue(self.hash_table.is_empty())
+
+    def test_batches(self):
+        self.hash_table.put_many((f"key{i}", i) for i in range(100))
+        self.assertEqual(self.hash_table.size(), 100)
+        self.assertEqual(self.hash_table.get_many(["key5", "missing", "key42"], -1), [5, -1, 42])
+        self.assertEqual(self.hash_table.contains_many(["key1", "missing"]), [True, False])
+        self.assertEqual(self.hash_table.remove_many(["key1", "missing"]), [1, None])
+        self.assertCountEqual(self.hash_table.keys(), [f"key{i}" for i in range(2, 100)] + ["key0"])
+
+    def test_invalid_key(self):
+        with self.assertRaises(TypeError):
+            self.hash_table.put_many([("a", 1), (None, 2)])
+        self.assertTrue(self.hash_table.is_empty())
+
+    def test_failed_shard_leaves_no_stale_reply(self):
+        self.hash_table.put_many((f"key{i}", i) for i in range(20))
+        with self.assertRaises(TypeError):
+            self.hash_table.get_many([ChildUnhashable()] + [f"key{i}" for i in range(20)])
+        self.assertEqual(self.hash_table.get("key3"), 3)
+        self.assertEqual(self.hash_table.size(), 20)
+        # A value that can't be pickled fails the batch before any shard receives it
+        with self.assertRaises(TypeError):
+            self.hash_table.put_many([(f"new{i}", i) for i in range(20)] + [("lock", threading.Lock())])
+        self.assertEqual(self.hash_table.get("key3"), 3)
+        self.assertEqual(self.hash_table.size(), 20)
+        self.assertFalse(self.hash_table.contains("new0"))
@@ -0,0 +1,27 @@
+import unittest
+from src.sorted_index import CHUNK_SIZE, SortedIndex
+
+class TestSortedIndex(unittest.TestCase):
+    def test_add_and_remove_across_chunks(self):
+        keys = [f"{i:05d}" for i in range(CHUNK_SIZE * 5)]
+        index = SortedIndex(keys[::2])
+        for key in keys[1::2]:
+            index.add(key)
+        self.assertEqual(list(index), keys)
+        for key in keys[::3]:
+            index.remove(key)
+        remaining = [key for i, key in enumerate(keys) if i % 3]
+        self.assertEqual(list(index), remaining)
+        self.assertEqual(list(reversed(index)), remaining[::-1])
+        self.assertEqual(len(index), len(remaining))
+        self.assertNotIn(keys[0], index)
+        self.assertIn(keys[1], index)
+
+    def test_range_and_prefix(self):
+        index = SortedIndex(["a", "ab", "abc", "abd", "b", "ba"])
+        self.assertEqual(list(index.prefix("ab")), ["ab", "abc", "abd"])
+        self.assertEqual(list(index.prefix("c")), [])
+        self.assertEqual(list(index.range("ab", "b")), ["ab", "abc", "abd"])
+        self.assertEqual(list(index.range(high="ab")), ["a"])
+        self.assertEqual(list(index.range("b")), ["b", "ba"])
+        self.assertEqual(list(SortedIndex().range()), [])